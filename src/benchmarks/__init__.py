@@ -0,0 +1 @@
+# Benchmarks - offline performance checks against local stand-in services
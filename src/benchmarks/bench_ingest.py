@@ -0,0 +1,143 @@
+"""Benchmark the raw_data ingest strategies end to end against the local SODA stand-in.
+
+The stand-in runs in its own process, and each strategy runs in a fresh
+worker process with an empty DATA_DIR, so every strategy's peak RSS is its
+own. Rows are counted by reading the raw dataset back after the timed run;
+bytes are what the stand-in sent over the wire.
+
+Usage (from src/):
+    python -m benchmarks.bench_ingest --rows 300000 --latency 0.05
+    python -m benchmarks.bench_ingest --strategies keyset export --throttle-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+DATASET_ID = "test-0001"
+
+
+def _in_memory(raw_data, dataset_id, metadata, row_count):
+    from subsets_utils import save_raw_json
+    rows = raw_data.fetch_rows(dataset_id)
+    save_raw_json({"id": dataset_id, "name": metadata["name"], "score": 0, "metadata": metadata, "data": rows},
+                  f"dataset_{dataset_id}", compress=True)
+
+
+def _keyset(raw_data, dataset_id, metadata, row_count):
+    raw_data.stream_large_dataset(dataset_id, metadata["name"], 0, metadata, paging="keyset")
+
+
+def _offset(raw_data, dataset_id, metadata, row_count):
+    raw_data.stream_large_dataset(dataset_id, metadata["name"], 0, metadata, paging="offset")
+
+
+def _export(raw_data, dataset_id, metadata, row_count):
+    raw_data.export_large_dataset(dataset_id, metadata["name"], 0, metadata)
+
+
+def _auto(raw_data, dataset_id, metadata, row_count):
+    asyncio.run(raw_data.fetch_full(dataset_id, 0, metadata, None, row_count=row_count))
+
+
+STRATEGIES = {
+    "in-memory": _in_memory,
+    "keyset": _keyset,
+    "offset": _offset,
+    "export": _export,
+    "auto": _auto,
+}
+
+
+def run_worker(strategy: str, url: str, dataset_id: str):
+    """Run one strategy in this process and print its result as one JSON line."""
+    import cdc_client
+    from ingest import raw_data
+    from subsets_utils import RateLimiter, iter_raw_rows
+
+    cdc_client.BASE_URL = url
+    # The stand-in is local: lift the production request budget (429s still penalize it)
+    cdc_client._limiter = RateLimiter(calls=1000, period=1)
+
+    metadata = cdc_client.get_dataset_metadata(dataset_id)
+    row_count = cdc_client.get_row_count(dataset_id)
+
+    start = time.perf_counter()
+    STRATEGIES[strategy](raw_data, dataset_id, metadata, row_count)
+    seconds = time.perf_counter() - start
+
+    rows = sum(1 for _ in iter_raw_rows(f"dataset_{dataset_id}"))
+    print(json.dumps({
+        "rows": rows,
+        "seconds": seconds,
+        # ru_maxrss is KiB on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def _start_standin(args) -> tuple[subprocess.Popen, str]:
+    command = [sys.executable, "-m", "benchmarks.soda_standin", "--rows", str(args.rows),
+               "--latency", str(args.latency), "--skip-cost", str(args.skip_cost),
+               "--throttle-rate", str(args.throttle_rate), "--retry-after", str(args.retry_after)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    return server, server.stdout.readline().strip()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--strategies", nargs="+", choices=list(STRATEGIES), default=list(STRATEGIES))
+    parser.add_argument("--latency", type=float, default=0.05, help="Per-request latency (s)")
+    parser.add_argument("--skip-cost", type=float, default=2e-7, help="Simulated cost per skipped row (s)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After sent with a 429 (s)")
+    parser.add_argument("--worker", choices=list(STRATEGIES), help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.url, DATASET_ID)
+        return
+
+    server, url = _start_standin(args)
+    try:
+        print(f"{args.rows:,} rows, {args.latency * 1000:.0f} ms latency, "
+              f"{args.throttle_rate:.0%} throttled, served from {url}")
+        print(f"{'strategy':<10} {'rows':>10} {'requests':>9} {'429s':>5} {'seconds':>8} "
+              f"{'rows/s':>10} {'MB/s':>7} {'peak RSS MB':>12}")
+
+        for strategy in args.strategies:
+            before = httpx.get(f"{url}/_stats").json()
+            with tempfile.TemporaryDirectory() as data_dir:
+                env = {**os.environ, "DATA_DIR": data_dir, "CI": "", "ENABLE_HTTP_CACHE": "false"}
+                worker = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_ingest", "--worker", strategy, "--url", url],
+                    env=env, capture_output=True, text=True,
+                )
+            if worker.returncode != 0:
+                print(f"{strategy:<10} failed:\n{worker.stderr}")
+                continue
+            after = httpx.get(f"{url}/_stats").json()
+
+            result = json.loads(worker.stdout.strip().splitlines()[-1])
+            seconds = result["seconds"]
+            sent = after["bytes_sent"] - before["bytes_sent"]
+            print(f"{strategy:<10} {result['rows']:>10,} {after['requests'] - before['requests']:>9} "
+                  f"{after['throttled'] - before['throttled']:>5} {seconds:>8.2f} "
+                  f"{result['rows'] / seconds:>10,.0f} {sent / seconds / 1024 / 1024:>7.1f} "
+                  f"{result['peak_rss_mb']:>12.0f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
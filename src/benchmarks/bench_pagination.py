@@ -0,0 +1,71 @@
+"""Benchmark keyset vs $offset paging against the local SODA stand-in.
+
+Usage (from src/):
+    python -m benchmarks.bench_pagination --rows 1000000 --page-size 50000
+"""
+
+import argparse
+import time
+
+import cdc_client
+from subsets_utils import RateLimiter
+from .soda_standin import SodaStandin
+
+DATASET_ID = "bench-0001"
+
+
+def _offset_serial(limit):
+    offset = 0
+    while True:
+        page = cdc_client.get_dataset(DATASET_ID, limit=limit, offset=offset, params=cdc_client.KEYSET_ORDER)
+        if page:
+            yield page
+        if len(page) < limit:
+            return
+        offset += limit
+
+
+def _offset_parallel(limit):
+    total = cdc_client.get_row_count(DATASET_ID)
+    return cdc_client.iter_dataset_pages(DATASET_ID, total, limit=limit, params=cdc_client.KEYSET_ORDER)
+
+
+def _keyset(limit):
+    return cdc_client.iter_dataset_keyset(DATASET_ID, limit=limit)
+
+
+STRATEGIES = {
+    "offset (serial)": _offset_serial,
+    "offset (parallel)": _offset_parallel,
+    "keyset": _keyset,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=50_000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Per-request latency (s)")
+    parser.add_argument("--skip-cost", type=float, default=2e-7, help="Simulated cost per skipped row (s)")
+    args = parser.parse_args()
+
+    # The stand-in is local: lift the production request budget
+    cdc_client._limiter = RateLimiter(calls=1000, period=1)
+
+    with SodaStandin({DATASET_ID: args.rows}, latency=args.latency, skip_cost=args.skip_cost) as server:
+        cdc_client.BASE_URL = server.url
+        print(f"{args.rows:,} rows, {args.page_size:,} per page, "
+              f"{args.latency * 1000:.0f} ms latency, {args.skip_cost * 1e9:.0f} ns/skipped row")
+        print(f"{'strategy':<20} {'rows':>10} {'requests':>9} {'seconds':>8} {'rows/s':>10}")
+
+        for label, strategy in STRATEGIES.items():
+            server.requests = 0
+            start = time.perf_counter()
+            rows = sum(len(page) for page in strategy(args.page_size))
+            elapsed = time.perf_counter() - start
+            assert rows == args.rows, f"{label}: expected {args.rows} rows, got {rows}"
+            print(f"{label:<20} {rows:>10,} {server.requests:>9} {elapsed:>8.2f} {rows / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
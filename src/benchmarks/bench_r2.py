@@ -0,0 +1,106 @@
+"""Benchmark r2 upload helpers and transfer settings against the local S3 stand-in.
+
+Each upload path (one PUT, managed multipart from bytes, a file and an
+iterator, and the serial MultipartWriter) sends the same object, at each
+requested concurrency. The stand-in runs in its own process and reads
+request bodies at a capped bandwidth, like a remote endpoint, so parallel
+parts pay off as they would against R2.
+
+Usage (from src/):
+    python -m benchmarks.bench_r2 --size-mb 128 --bandwidth-mb 40 --concurrency 1 4 8
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from subsets_utils import r2
+
+KEY = "bench/object.bin"
+CHUNK_SIZE = 1024 * 1024
+
+
+def _chunks(data: bytes):
+    for start in range(0, len(data), CHUNK_SIZE):
+        yield data[start:start + CHUNK_SIZE]
+
+
+def _single_put(data, path, config):
+    r2.upload_bytes(data, KEY, r2.transfer_config(threshold=len(data) + 1))
+
+
+def _multipart_bytes(data, path, config):
+    r2.upload_bytes(data, KEY, config)
+
+
+def _multipart_file(data, path, config):
+    r2.upload_file(path, KEY, config)
+
+
+def _multipart_iter(data, path, config):
+    r2.upload_iter(_chunks(data), KEY, config)
+
+
+def _multipart_writer(data, path, config):
+    with r2.MultipartWriter(KEY, part_size=config.multipart_chunksize) as f:
+        for chunk in _chunks(data):
+            f.write(chunk)
+
+
+# (label, upload, uses the concurrency setting)
+STRATEGIES = [
+    ("put_object", _single_put, False),
+    ("bytes", _multipart_bytes, True),
+    ("file", _multipart_file, True),
+    ("iterator", _multipart_iter, True),
+    ("MultipartWriter", _multipart_writer, False),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=128)
+    parser.add_argument("--part-size-mb", type=int, default=16)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--latency", type=float, default=0.02, help="Per-request latency (s)")
+    parser.add_argument("--bandwidth-mb", type=float, default=40.0, help="MB/s per request body (0 = unlimited)")
+    args = parser.parse_args()
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.s3_standin", "--latency", str(args.latency),
+         "--bandwidth-mb", str(args.bandwidth_mb)],
+        stdout=subprocess.PIPE, text=True,
+    )
+    url = server.stdout.readline().strip()
+    os.environ.update({"R2_ENDPOINT_URL": url, "R2_ACCESS_KEY_ID": "bench", "R2_SECRET_ACCESS_KEY": "bench",
+                       "R2_BUCKET_NAME": "bench"})
+    r2._s3_client = None
+
+    data = os.urandom(args.size_mb * 1024 * 1024)
+    try:
+        with tempfile.NamedTemporaryFile() as f:
+            f.write(data)
+            f.flush()
+
+            print(f"{args.size_mb} MB object, {args.part_size_mb} MB parts, "
+                  f"{args.bandwidth_mb:g} MB/s per request, {args.latency * 1000:.0f} ms latency")
+            print(f"{'upload':<16} {'concurrency':>11} {'seconds':>8} {'MB/s':>7}")
+            for label, upload, concurrent in STRATEGIES:
+                for concurrency in (args.concurrency if concurrent else [1]):
+                    config = r2.transfer_config(part_size=args.part_size_mb * 1024 * 1024,
+                                                max_concurrency=concurrency)
+                    start = time.perf_counter()
+                    upload(data, f.name, config)
+                    elapsed = time.perf_counter() - start
+                    assert r2.download_bytes(KEY) == data, f"{label}: uploaded object differs"
+                    print(f"{label:<16} {concurrency:>11} {elapsed:>8.2f} {args.size_mb / elapsed:>7.1f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
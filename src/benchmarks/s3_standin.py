@@ -0,0 +1,231 @@
+"""Local stand-in for the S3 API subset that subsets_utils.r2 uses.
+
+Implements PutObject, GetObject, HeadObject, DeleteObject and multipart
+uploads (create, upload part, complete, abort) with path-style addressing,
+keeping objects in memory. Request bodies may be plain, HTTP-chunked or
+aws-chunked (boto3's streaming checksum encoding). A fixed latency per
+request and a bandwidth cap per request body can be injected, so that
+concurrent part uploads behave as they do against a remote endpoint.
+
+Usage:
+    with S3Standin(bandwidth=50 * 2**20) as server:
+        os.environ["R2_ENDPOINT_URL"] = server.url
+
+or as a separate process (prints its URL, then serves until killed):
+    python -m benchmarks.s3_standin --bandwidth-mb 50 --latency 0.02
+"""
+
+import argparse
+import hashlib
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+_S3_NS = "http://s3.amazonaws.com/doc/2006-03-01/"
+_PART_NUMBER = re.compile(r"<PartNumber>(\d+)</PartNumber>")
+
+
+def _decode_aws_chunked(body: bytes) -> bytes:
+    """Payload of an aws-chunked body: `<hex size>[;ext]\\r\\n<data>\\r\\n` chunks, then trailers."""
+    data = bytearray()
+    position = 0
+    while True:
+        line_end = body.index(b"\r\n", position)
+        size = int(body[position:line_end].split(b";")[0], 16)
+        if size == 0:
+            return bytes(data)
+        data += body[line_end + 2:line_end + 2 + size]
+        position = line_end + 2 + size + 2
+
+
+class S3Standin:
+    """Threaded HTTP server emulating an S3 bucket store on localhost.
+
+    Args:
+        latency: Fixed delay per request, in seconds
+        bandwidth: Bytes per second each request body is read at (0 = unlimited)
+        port: Port to listen on (0 = any free port)
+    """
+
+    def __init__(self, latency: float = 0.0, bandwidth: float = 0.0, port: int = 0):
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.objects = {}
+        self.uploads = {}
+        self.requests = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _target(self):
+                url = urlparse(self.path)
+                bucket, _, key = url.path.lstrip("/").partition("/")
+                query = {k: v[0] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+                with standin._lock:
+                    standin.requests += 1
+                if standin.latency:
+                    time.sleep(standin.latency)
+                return bucket, unquote(key), query
+
+            def _read_body(self) -> bytes:
+                if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+                    body = bytearray()
+                    while True:
+                        size = int(self.rfile.readline().split(b";")[0], 16)
+                        if size == 0:
+                            while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                                pass
+                            break
+                        body += self.rfile.read(size)
+                        self.rfile.readline()
+                    body = bytes(body)
+                else:
+                    body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if standin.bandwidth:
+                    time.sleep(len(body) / standin.bandwidth)
+                with standin._lock:
+                    standin.bytes_received += len(body)
+                if "aws-chunked" in self.headers.get("Content-Encoding", ""):
+                    body = _decode_aws_chunked(body)
+                return body
+
+            def do_PUT(self):
+                bucket, key, query = self._target()
+                body = self._read_body()
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if "uploadId" in query:
+                    upload = standin.uploads.get(query["uploadId"])
+                    if upload is None:
+                        self._send(404, self._error("NoSuchUpload"))
+                        return
+                    upload[int(query["partNumber"])] = body
+                else:
+                    standin.objects[(bucket, key)] = body
+                self._send(200, headers={"ETag": etag})
+
+            def do_POST(self):
+                bucket, key, query = self._target()
+                body = self._read_body()
+                if "uploads" in query:
+                    upload_id = uuid.uuid4().hex
+                    standin.uploads[upload_id] = {}
+                    self._send(200, self._xml("InitiateMultipartUploadResult",
+                                              Bucket=bucket, Key=key, UploadId=upload_id))
+                elif "uploadId" in query:
+                    parts = standin.uploads.pop(query["uploadId"], None)
+                    if parts is None:
+                        self._send(404, self._error("NoSuchUpload"))
+                        return
+                    numbers = [int(n) for n in _PART_NUMBER.findall(body.decode("utf-8"))]
+                    data = b"".join(parts[n] for n in numbers)
+                    standin.objects[(bucket, key)] = data
+                    etag = f'"{hashlib.md5(data).hexdigest()}-{len(numbers)}"'
+                    self._send(200, self._xml("CompleteMultipartUploadResult",
+                                              Bucket=bucket, Key=key, ETag=etag))
+                else:
+                    self._send(400, self._error("InvalidRequest"))
+
+            def do_GET(self):
+                bucket, key, query = self._target()
+                if not key and self.path.startswith("/_stats"):
+                    with standin._lock:
+                        stats = f'{{"requests": {standin.requests}, "bytes_received": {standin.bytes_received}}}'
+                    self._send(200, stats.encode("utf-8"), content_type="application/json")
+                    return
+                data = standin.objects.get((bucket, key))
+                if data is None:
+                    self._send(404, self._error("NoSuchKey"))
+                    return
+                self._send(200, data, content_type="application/octet-stream")
+
+            def do_HEAD(self):
+                bucket, key, query = self._target()
+                data = standin.objects.get((bucket, key))
+                self.send_response(404 if data is None else 200)
+                self.send_header("Content-Length", str(0 if data is None else len(data)))
+                self.end_headers()
+
+            def do_DELETE(self):
+                bucket, key, query = self._target()
+                if "uploadId" in query:
+                    standin.uploads.pop(query["uploadId"], None)
+                else:
+                    standin.objects.pop((bucket, key), None)
+                self._send(204)
+
+            def _xml(self, root, **fields) -> bytes:
+                inner = "".join(f"<{name}>{value}</{name}>" for name, value in fields.items())
+                return f'<?xml version="1.0" encoding="UTF-8"?><{root} xmlns="{_S3_NS}">{inner}</{root}>'.encode()
+
+            def _error(self, code) -> bytes:
+                return f'<?xml version="1.0" encoding="UTF-8"?><Error><Code>{code}</Code></Error>'.encode()
+
+            def _send(self, status, body=b"", content_type="application/xml", headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an in-memory S3 stand-in until killed.")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-request latency (s)")
+    parser.add_argument("--bandwidth-mb", type=float, default=0.0, help="MB/s per request body (0 = unlimited)")
+    args = parser.parse_args()
+
+    server = S3Standin(latency=args.latency, bandwidth=args.bandwidth_mb * 1024 * 1024, port=args.port)
+    print(server.url, flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+"""Local stand-in for the Socrata endpoints cdc_client uses.
+
+Serves synthetic datasets through the catalog (`api/views`), per-view
+metadata (`api/views/{id}.json`) and rows (`resource/{id}.json`, and `.csv`
+for bulk exports), with the SoQL subset that
+cdc_client uses: $limit, $offset, $order=:id, $where with ANDed
+`:id > '...'` / `:updated_at > '...'` / `:created_at <= '...'` /
+`` `col` = '...' `` / `col IS NULL`
+conditions, $select column lists (`*`, system fields, backquoted names),
+count(*) (optionally with a one-column $group) and max(:updated_at). The stand-in models the server-side cost of deep
+$offset pages (rows skipped before the page starts), which is what makes
+offset paging degrade on multi-million-row Socrata datasets.
+
+With `etags`, responses carry an ETag (a hash of the body) and a request
+whose If-None-Match matches it is answered 304 Not Modified. Per-request latency
+and random 429 Too Many Requests responses (with Retry-After) can be
+injected. `_stats` returns request, byte, throttle and 304 counters.
+
+Usage:
+    with SodaStandin({"test-0001": 200000}) as server:
+        cdc_client.BASE_URL = server.url
+
+or as a separate process (prints its URL, then serves until killed):
+    python -m benchmarks.soda_standin --rows 200000 --latency 0.05
+"""
+
+import argparse
+import bisect
+import csv
+import hashlib
+import io
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+_CONDITION = re.compile(r"(:id|:updated_at|:created_at)\s*(>|<=)\s*'([^']*)'")
+_EQUALS = re.compile(r"`?(\w+)`?\s*=\s*'((?:[^']|'')*)'")
+_IS_NULL = re.compile(r"`?(\w+)`?\s+IS\s+NULL", re.IGNORECASE)
+
+
+def make_rows(row_count: int, id_prefix: str = "row", created_at: str = "2024-01-01T00:00:00.000Z") -> list[dict]:
+    """Synthetic rows shaped like a CDC surveillance table, sorted by :id."""
+    states = ["AL", "AK", "AZ", "CA", "CO", "NY", "TX", "WA"]
+    return [
+        {
+            ":id": f"{id_prefix}-{i:09d}",
+            ":created_at": created_at,
+            ":updated_at": created_at,
+            "year": str(2000 + i % 25),
+            "week": str(1 + i % 52),
+            "state": states[i % len(states)],
+            "value": str((i * 7919) % 10000 / 100),
+        }
+        for i in range(row_count)
+    ]
+
+
+class SodaStandin:
+    """Threaded HTTP server serving synthetic SODA datasets on localhost.
+
+    Args:
+        datasets: Mapping of dataset id to row count
+        latency: Fixed delay per request, in seconds
+        skip_cost: Simulated delay per row skipped by $offset, in seconds
+        throttle_rate: Fraction of requests answered 429 instead
+        retry_after: Retry-After seconds sent with a 429
+        etags: Send ETags and answer matching If-None-Match requests with 304
+        port: Port to listen on (0 = any free port)
+    """
+
+    def __init__(self, datasets: dict, latency: float = 0.0, skip_cost: float = 2e-7,
+                 throttle_rate: float = 0.0, retry_after: float = 1.0, etags: bool = False, port: int = 0):
+        self.datasets = {ds: make_rows(n) for ds, n in datasets.items()}
+        self.keys = {ds: [row[":id"] for row in rows] for ds, rows in self.datasets.items()}
+        self.latency = latency
+        self.skip_cost = skip_cost
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.etags = etags
+        self.requests = 0
+        self.bytes_sent = 0
+        self.throttled = 0
+        self.not_modified = 0
+        self._random = random.Random(0)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"requests": self.requests, "bytes_sent": self.bytes_sent, "throttled": self.throttled,
+                    "not_modified": self.not_modified}
+
+    def view(self, dataset_id: str) -> dict:
+        """Catalog view of a dataset, shaped like api/views/{id}.json."""
+        rows = self.datasets[dataset_id]
+        fields = [field for field in (rows[0] if rows else make_rows(1)[0]) if not field.startswith(":")]
+        return {
+            "id": dataset_id,
+            "name": f"Synthetic dataset {dataset_id}",
+            "assetType": "dataset",
+            "rowsUpdatedAt": 1704067200,
+            "viewLastModified": 1704067200,
+            "columns": [
+                {"fieldName": field, "dataTypeName": "text",
+                 "cachedContents": {"non_null": str(len(rows)), "null": "0"}}
+                for field in fields
+            ],
+        }
+
+    def update_rows(self, dataset_id: str, indexes, updated_at: str, **values):
+        """Modify rows in place, stamping them with a new :updated_at."""
+        for i in indexes:
+            self.datasets[dataset_id][i].update(values, **{":updated_at": updated_at})
+
+    def delete_rows(self, dataset_id: str, indexes):
+        """Remove rows, as a Socrata delete does (no trace left in the rows that remain)."""
+        drop = set(indexes)
+        self.datasets[dataset_id] = [row for i, row in enumerate(self.datasets[dataset_id]) if i not in drop]
+        self.keys[dataset_id] = [row[":id"] for row in self.datasets[dataset_id]]
+
+    def replace_rows(self, dataset_id: str, row_count: int, created_at: str):
+        """Replace every row, as a Socrata replace does: all rows get new :ids and timestamps."""
+        self.datasets[dataset_id] = make_rows(row_count, id_prefix=f"r{created_at[:10]}", created_at=created_at)
+        self.keys[dataset_id] = [row[":id"] for row in self.datasets[dataset_id]]
+
+    def query(self, dataset_id: str, params: dict) -> list[dict]:
+        """Evaluate the supported SoQL subset against a synthetic dataset."""
+        rows = self.datasets[dataset_id]
+        select = params.get("$select", "*")
+
+        start = 0
+        filters = []
+        for field, op, value in _CONDITION.findall(params.get("$where", "")):
+            if field == ":id":
+                start = bisect.bisect_right(self.keys[dataset_id], value)
+            else:
+                filters.append((field, op, value))
+        where = params.get("$where", "")
+        equals = [(f, v.replace("''", "'")) for f, v in _EQUALS.findall(where)]
+        equals += [(f, None) for f in _IS_NULL.findall(where)]
+        if filters or equals:
+            rows = [row for row in rows[start:]
+                    if all(row[f] > v if op == ">" else row[f] <= v for f, op, v in filters)
+                    and all(row.get(f) == v for f, v in equals)]
+            start = 0
+
+        if params.get("$group"):
+            group = params["$group"].strip("`")
+            counts = {}
+            for row in rows[start:]:
+                counts[row.get(group)] = counts.get(row.get(group), 0) + 1
+            return [{**({group: value} if value is not None else {}), "count": str(count)}
+                    for value, count in sorted(counts.items(), key=lambda item: (item[0] is None, item[0] or ""))]
+        if select.lower().startswith("count(*)"):
+            return [{"count": str(len(rows) - start)}]
+        if select.lower().startswith("max(:updated_at)"):
+            return [{"watermark": max(row[":updated_at"] for row in rows)}] if rows else []
+
+        offset = int(params.get("$offset", 0))
+        limit = int(params.get("$limit", 1000))
+        if offset and self.skip_cost:
+            time.sleep(offset * self.skip_cost)
+
+        page = rows[start + offset:start + offset + limit]
+        columns = {column.strip().strip("`") for column in select.split(",")}
+        return [
+            {k: v for k, v in row.items() if k in columns or ("*" in columns and not k.startswith(":"))}
+            for row in page
+        ]
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/_stats":
+                    self._send(200, standin.stats())
+                    return
+
+                with standin._lock:
+                    standin.requests += 1
+                    throttle = standin.throttle_rate and standin._random.random() < standin.throttle_rate
+                    if throttle:
+                        standin.throttled += 1
+                if standin.latency:
+                    time.sleep(standin.latency)
+                if throttle:
+                    self._send(429, {"error": True, "message": "Too many requests"},
+                               headers={"Retry-After": f"{standin.retry_after:g}"})
+                    return
+
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                if url.path == "/api/views":
+                    self._send(200, [standin.view(dataset_id) for dataset_id in standin.datasets])
+                    return
+                match = re.fullmatch(r"/api/views/([\w-]+)\.json", url.path)
+                if match and match.group(1) in standin.datasets:
+                    self._send(200, standin.view(match.group(1)))
+                    return
+                match = re.fullmatch(r"/resource/([\w-]+)\.(json|csv)", url.path)
+                if not match or match.group(1) not in standin.datasets:
+                    self._send(404, {"error": True, "message": "not found"})
+                    return
+                rows = standin.query(match.group(1), params)
+                if match.group(2) == "csv":
+                    self._send_csv(rows)
+                else:
+                    self._send(200, rows)
+
+            def _send_csv(self, rows):
+                buffer = io.StringIO()
+                if rows:
+                    writer = csv.DictWriter(buffer, fieldnames=list(rows[0]))
+                    writer.writeheader()
+                    writer.writerows(rows)
+                self._send(200, buffer.getvalue().encode("utf-8"), "text/csv")
+
+            def _send(self, status, payload, content_type="application/json", headers=None):
+                body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+                if standin.etags and status == 200 and self.path != "/_stats":
+                    etag = f'"{hashlib.md5(body).hexdigest()}"'
+                    headers = {**(headers or {}), "ETag": etag}
+                    if self.headers.get("If-None-Match") == etag:
+                        with standin._lock:
+                            standin.not_modified += 1
+                        status, body = 304, b""
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                with standin._lock:
+                    standin.bytes_sent += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve synthetic SODA datasets until killed.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[200_000], help="Row count per dataset")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Per-request latency (s)")
+    parser.add_argument("--skip-cost", type=float, default=2e-7, help="Simulated cost per skipped row (s)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After sent with a 429 (s)")
+    parser.add_argument("--etags", action="store_true", help="Send ETags and answer If-None-Match with 304")
+    args = parser.parse_args()
+
+    datasets = {f"test-{i + 1:04d}": rows for i, rows in enumerate(args.rows)}
+    server = SodaStandin(datasets, latency=args.latency, skip_cost=args.skip_cost,
+                         throttle_rate=args.throttle_rate, retry_after=args.retry_after, etags=args.etags,
+                         port=args.port)
+    print(server.url, flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
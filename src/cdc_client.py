@@ -2,27 +2,157 @@
 
 """CDC Socrata Open Data API client with rate limiting."""
 
-from ratelimit import limits, sleep_and_retry
-from subsets_utils import get
+import atexit
+import csv
+import io
+import json
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pyarrow as pa
+import pyarrow.json as pa_json
+from tenacity import (
+    AsyncRetrying, Retrying, retry_if_exception, stop_after_attempt, stop_after_delay, wait_random_exponential,
+)
+from subsets_utils import get, aget, stream, RateLimiter, parse_retry_after, debug
 
 BASE_URL = "https://data.cdc.gov"
 
+# SODA page size and number of page windows fetched concurrently
+PAGE_SIZE = 50000
+MAX_WORKERS = int(os.environ.get('CDC_MAX_WORKERS', '4'))
+
+# Keyset order: the system :id column is unique and indexed on every dataset
+KEYSET_ORDER = {'$select': ':id, *', '$order': ':id'}
+
 # CDC Socrata API: without app token, requests share a limited pool
-# Be conservative with rate limiting
-@sleep_and_retry
-@limits(calls=5, period=1)
-def rate_limited_get(endpoint, params=None, headers=None):
-    """Make a rate-limited GET request to CDC Socrata API."""
-    url = f"{BASE_URL}/{endpoint}"
+# Be conservative with rate limiting; an app token (SOCRATA_APP_TOKEN) gets
+# its own, much larger pool. One limiter is shared by the sync and async
+# request paths, and by every process on this machine through its state file,
+# so concurrent ingest stays within the same budget.
+APP_TOKEN = os.environ.get('SOCRATA_APP_TOKEN')
+RATE_LIMIT_FILE = os.environ.get('CDC_RATE_LIMIT_FILE',
+                                 os.path.join(tempfile.gettempdir(), 'cdc-socrata.ratelimit'))
+
+_limiter = RateLimiter(calls=20 if APP_TOKEN else 5, period=1, state_file=RATE_LIMIT_FILE)
+atexit.register(lambda: _limiter.log_stats('cdc_socrata'))
+
+# Server throttling: back off for Retry-After (or this long if it's missing)
+THROTTLE_STATUSES = (429, 503)
+DEFAULT_RETRY_AFTER = 5.0
+
+
+# Transient failures worth retrying: network errors, throttling and gateway errors
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+def is_retryable(exc):
+    """Whether a failed request may succeed if sent again."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for retryable request failures.
+
+    Gives up after `attempts` tries or once `max_elapsed` seconds have passed,
+    re-raising the last error. Backoff comes on top of the rate limiter, which
+    already holds requests back for Retry-After after a 429/503. Each attempt's
+    number and the backoff so far are recorded in the debug HTTP log.
+    """
+
+    def __init__(self, attempts=5, max_elapsed=300.0, initial=1.0, max_wait=60.0):
+        self.attempts = attempts
+        self.max_elapsed = max_elapsed
+        self.initial = initial
+        self.max_wait = max_wait
+
+    def _kwargs(self):
+        return {
+            'stop': stop_after_attempt(self.attempts) | stop_after_delay(self.max_elapsed),
+            'wait': wait_random_exponential(multiplier=self.initial, max=self.max_wait),
+            'retry': retry_if_exception(is_retryable),
+            'reraise': True,
+        }
+
+    def call(self, fn, *args, **kwargs):
+        """Call fn(*args, **kwargs), retrying it under this policy."""
+        for attempt in Retrying(**self._kwargs()):
+            state = attempt.retry_state
+            with attempt, debug.http_attempt(state.attempt_number, int(state.idle_for * 1000)):
+                result = fn(*args, **kwargs)
+        return result
+
+    async def acall(self, fn, *args, **kwargs):
+        """Await fn(*args, **kwargs), retrying it under this policy."""
+        async for attempt in AsyncRetrying(**self._kwargs()):
+            state = attempt.retry_state
+            with attempt, debug.http_attempt(state.attempt_number, int(state.idle_for * 1000)):
+                result = await fn(*args, **kwargs)
+        return result
+
+
+# Single requests (metadata, counts, pages)
+DEFAULT_RETRY = RetryPolicy(
+    attempts=int(os.environ.get('CDC_RETRY_ATTEMPTS', '5')),
+    max_elapsed=float(os.environ.get('CDC_RETRY_MAX_ELAPSED', '300')),
+)
+# Whole streamed pages and exports: re-fetching is expensive, so fewer tries
+# spread further apart
+STREAM_RETRY = RetryPolicy(attempts=4, max_elapsed=900.0, initial=5.0, max_wait=120.0)
+
+
+def _request_headers(headers=None):
     default_headers = {
         'Accept': 'application/json',
     }
+    if APP_TOKEN:
+        default_headers['X-App-Token'] = APP_TOKEN
     if headers:
         default_headers.update(headers)
-    response = get(url, params=params, headers=default_headers, timeout=120.0)
+    return default_headers
+
+
+def _observe_throttling(response):
+    """Slow the shared limiter down when the server says we're sending too fast."""
+    if response.status_code in THROTTLE_STATUSES:
+        _limiter.penalize(parse_retry_after(response.headers.get('Retry-After'), DEFAULT_RETRY_AFTER))
+
+
+def _check_retryable(response):
+    """Raise for statuses the retry policy should retry; other responses pass through."""
+    _observe_throttling(response)
+    if response.status_code in RETRYABLE_STATUSES:
+        response.raise_for_status()
     return response
 
 
+def rate_limited_get(endpoint, params=None, headers=None, retry=DEFAULT_RETRY):
+    """Make a rate-limited GET request to CDC Socrata API, retrying transient failures."""
+    url = f"{BASE_URL}/{endpoint}"
+
+    def attempt():
+        _limiter.wait()
+        return _check_retryable(get(url, params=params, headers=_request_headers(headers), timeout=120.0))
+
+    return retry.call(attempt)
+
+
+async def async_rate_limited_get(endpoint, params=None, headers=None, retry=DEFAULT_RETRY):
+    """Async variant of rate_limited_get, sharing the same rate limiter."""
+    url = f"{BASE_URL}/{endpoint}"
+
+    async def attempt():
+        await _limiter.wait_async()
+        return _check_retryable(await aget(url, params=params, headers=_request_headers(headers), timeout=120.0))
+
+    return await retry.acall(attempt)
+
+
 def get_catalog():
     """
     Get list of all available datasets (views).
@@ -35,7 +165,24 @@ def get_catalog():
     return response.json()
 
 
-def get_dataset(dataset_id, limit=50000, offset=0):
+def stream_catalog():
+    """
+    Stream the catalog of views, decoding one view at a time.
+
+    Not retried (views already yielded can't be taken back); callers retry
+    the whole listing under STREAM_RETRY.
+
+    Yields:
+        (view, line) tuples, where line is the view as one-line JSON text
+    """
+    _limiter.wait()
+    with stream("GET", f"{BASE_URL}/api/views", headers=_request_headers(), timeout=120.0) as response:
+        _observe_throttling(response)
+        response.raise_for_status()
+        yield from iter_json_array(response.iter_text())
+
+
+def get_dataset(dataset_id, limit=PAGE_SIZE, offset=0, params=None):
     """
     Get data from a specific dataset using SODA 2.0.
 
@@ -43,13 +190,15 @@ def get_dataset(dataset_id, limit=50000, offset=0):
         dataset_id: The dataset identifier (e.g., 'vbim-akqf')
         limit: Number of rows to fetch (max usually 50000)
         offset: Offset for pagination
+        params: Extra SoQL parameters (e.g., {'$order': ':id'})
 
     Returns:
         List of records
     """
     params = {
         '$limit': limit,
-        '$offset': offset
+        '$offset': offset,
+        **(params or {}),
     }
 
     response = rate_limited_get(
@@ -60,6 +209,364 @@ def get_dataset(dataset_id, limit=50000, offset=0):
     return response.json()
 
 
+def _keyset_params(limit, after_id=None, params=None):
+    """SoQL parameters for one keyset page: ordered by :id, starting after after_id."""
+    params = {
+        **KEYSET_ORDER,
+        '$limit': limit,
+        **(params or {}),
+    }
+    if after_id is not None:
+        condition = f":id > '{after_id}'"
+        params['$where'] = f"({params['$where']}) AND {condition}" if '$where' in params else condition
+    return params
+
+
+def get_dataset_after(dataset_id, after_id=None, limit=PAGE_SIZE, params=None):
+    """
+    Get one keyset page: rows ordered by the system :id, after after_id.
+
+    Unlike $offset paging, the server cost does not grow with depth and the
+    page boundaries stay stable while the dataset is being updated. Each row
+    carries its ':id', which is the cursor for the next page.
+
+    Args:
+        dataset_id: The dataset identifier
+        after_id: ':id' of the last row already fetched (None for the first page)
+        limit: Number of rows to fetch
+        params: Extra SoQL parameters (an existing $where is ANDed with the cursor)
+
+    Returns:
+        List of records
+    """
+    response = rate_limited_get(
+        f'resource/{dataset_id}.json',
+        params=_keyset_params(limit, after_id, params)
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def iter_json_array(chunks):
+    """
+    Incrementally decode a JSON array body, one element at a time.
+
+    Only the current element and the unread part of the current chunk are
+    held in memory. Each element is also returned as compact one-line JSON
+    text sliced from the body (SODA pretty-prints rows across lines; JSON
+    strings cannot contain raw newlines, so dropping them is safe), which can
+    be written out as NDJSON without re-encoding.
+
+    Args:
+        chunks: Iterable of text chunks (e.g., response.iter_text())
+
+    Yields:
+        (element, line) tuples
+    """
+    decoder = json.JSONDecoder()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and separators
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError(f"Expected JSON array, got {buffer[pos:pos + 20]!r}")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                element, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # An element ending exactly at the buffer end may be truncated (e.g., a number)
+            if end is not None and (end < len(buffer) or eof):
+                yield element, buffer[pos:end].replace("\n", "").replace("\r", "")
+                pos = end
+                continue
+        elif eof:
+            raise ValueError("Unexpected end of JSON array")
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def stream_dataset_after(dataset_id, after_id=None, limit=PAGE_SIZE, params=None):
+    """
+    Streaming variant of get_dataset_after: decode the page while it downloads.
+
+    Rows are yielded one at a time instead of materializing the page as a
+    list of dicts, so memory per page stays at one row plus a read buffer.
+    Rows already yielded can't be taken back, so retries are left to the
+    caller: re-run the whole page under STREAM_RETRY.
+
+    Yields:
+        (record, line) tuples, where line is the record as one-line JSON text
+    """
+    _limiter.wait()
+    url = f"{BASE_URL}/resource/{dataset_id}.json"
+    with stream("GET", url, params=_keyset_params(limit, after_id, params),
+                headers=_request_headers(), timeout=120.0) as response:
+        _observe_throttling(response)
+        response.raise_for_status()
+        yield from iter_json_array(response.iter_text())
+
+
+def stream_dataset_batches(dataset_id, after_id=None, limit=PAGE_SIZE, params=None, schema=None,
+                           batch_rows=10000):
+    """
+    Stream a dataset with keyset paging into Arrow record batches.
+
+    Rows go from the response body as JSON text straight into pyarrow's
+    NDJSON reader, batch_rows at a time, without building Python dicts.
+
+    Args:
+        dataset_id: The dataset identifier
+        after_id: ':id' to resume after (None to start from the beginning)
+        limit: Rows per page request
+        params: Extra SoQL parameters
+        schema: Optional pa.Schema applied to every batch
+        batch_rows: Rows per record batch
+
+    Yields:
+        pa.RecordBatch, in :id order
+    """
+    parse_options = pa_json.ParseOptions(explicit_schema=schema) if schema is not None else None
+    lines = []
+
+    def flush():
+        table = pa_json.read_json(io.BytesIO("\n".join(lines).encode("utf-8")), parse_options=parse_options)
+        lines.clear()
+        return table.to_batches()
+
+    while True:
+        count = 0
+        for record, line in stream_dataset_after(dataset_id, after_id=after_id, limit=limit, params=params):
+            lines.append(line)
+            after_id = record[':id']
+            count += 1
+            if len(lines) >= batch_rows:
+                yield from flush()
+        if count < limit:
+            break
+    if lines:
+        yield from flush()
+
+
+def iter_dataset_keyset(dataset_id, after_id=None, limit=PAGE_SIZE, params=None):
+    """
+    Page through a dataset with keyset pagination, one request at a time.
+
+    Args:
+        dataset_id: The dataset identifier
+        after_id: ':id' to resume after (None to start from the beginning)
+        limit: Rows per page
+        params: Extra SoQL parameters
+
+    Yields:
+        Lists of records, in :id order
+    """
+    while True:
+        page = get_dataset_after(dataset_id, after_id=after_id, limit=limit, params=params)
+        if page:
+            yield page
+        if len(page) < limit:
+            return
+        after_id = page[-1][':id']
+
+
+def _count_params(where=None):
+    params = {'$select': 'count(*) AS count'}
+    if where:
+        params['$where'] = where
+    return params
+
+
+def get_row_count(dataset_id, where=None):
+    """
+    Get the number of rows in a dataset with a single count(*) query.
+
+    Args:
+        dataset_id: The dataset identifier
+        where: Optional SoQL filter to count matching rows only
+
+    Returns:
+        Row count as int
+    """
+    response = rate_limited_get(
+        f'resource/{dataset_id}.json',
+        params=_count_params(where)
+    )
+    response.raise_for_status()
+    rows = response.json()
+    return int(rows[0]['count']) if rows else 0
+
+
+def soql_equals(column, value):
+    """SoQL condition matching `column` = value (IS NULL for None)."""
+    if value is None:
+        return f"`{column}` IS NULL"
+    return f"`{column}` = '{str(value).replace(chr(39), chr(39) * 2)}'"
+
+
+def get_group_counts(dataset_id, column, where=None):
+    """
+    Get row counts per distinct value of a column with one grouped count(*) query.
+
+    Args:
+        dataset_id: The dataset identifier
+        column: Field name to group by
+        where: Optional SoQL filter to count matching rows only
+
+    Returns:
+        Dict of value (None for nulls) -> row count
+    """
+    params = {
+        '$select': f'`{column}`, count(*) AS count',
+        '$group': f'`{column}`',
+        '$limit': PAGE_SIZE,
+    }
+    if where:
+        params['$where'] = where
+    response = rate_limited_get(f'resource/{dataset_id}.json', params=params)
+    response.raise_for_status()
+    return {row.get(column): int(row['count']) for row in response.json()}
+
+
+async def async_get_row_count(dataset_id, where=None):
+    """Async variant of get_row_count."""
+    response = await async_rate_limited_get(
+        f'resource/{dataset_id}.json',
+        params=_count_params(where)
+    )
+    response.raise_for_status()
+    rows = response.json()
+    return int(rows[0]['count']) if rows else 0
+
+
+async def async_get_max_updated_at(dataset_id):
+    """
+    Get the latest system :updated_at timestamp of a dataset's rows.
+
+    Used as the watermark for incremental ingest: rows changed later have a
+    greater :updated_at.
+
+    Args:
+        dataset_id: The dataset identifier
+
+    Returns:
+        Timestamp string (e.g., '2024-05-01T12:00:00.000Z'), or None if empty
+    """
+    response = await async_rate_limited_get(
+        f'resource/{dataset_id}.json',
+        params={'$select': 'max(:updated_at) AS watermark'}
+    )
+    response.raise_for_status()
+    rows = response.json()
+    return rows[0].get('watermark') if rows else None
+
+
+def updated_since(watermark):
+    """SoQL filter for rows changed after a watermark."""
+    return f":updated_at > '{watermark}'"
+
+
+def created_through(watermark):
+    """SoQL filter for rows that already existed at a watermark."""
+    return f":created_at <= '{watermark}'"
+
+
+def iter_dataset_pages(dataset_id, total_rows, limit=PAGE_SIZE, offset=0, max_workers=MAX_WORKERS, params=None):
+    """
+    Fetch page windows of a dataset concurrently, yielding pages in order.
+
+    At most 2 * max_workers pages are in flight or buffered at once, so memory
+    stays bounded. Every request still goes through rate_limited_get, which
+    enforces the global request budget across worker threads. If the dataset
+    grew since total_rows was counted, the tail is fetched serially until a
+    short page is returned.
+
+    Args:
+        dataset_id: The dataset identifier
+        total_rows: Row count from get_row_count()
+        limit: Rows per page
+        offset: Offset of the first page to fetch
+        max_workers: Number of concurrent page requests
+        params: Extra SoQL parameters sent with every page
+
+    Yields:
+        Lists of records, in offset order
+    """
+    offsets = iter(range(offset, total_rows, limit))
+    next_offset = offset
+    last_page_size = limit
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = deque()
+
+        def submit():
+            page_offset = next(offsets, None)
+            if page_offset is not None:
+                pending.append((page_offset, pool.submit(get_dataset, dataset_id, limit, page_offset, params)))
+
+        for _ in range(max_workers * 2):
+            submit()
+
+        try:
+            while pending:
+                page_offset, future = pending.popleft()
+                page = future.result()
+                submit()
+                next_offset = page_offset + limit
+                last_page_size = len(page)
+                if page:
+                    yield page
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+    # Count was stale: keep paging until the dataset is exhausted
+    while last_page_size == limit:
+        page = get_dataset(dataset_id, limit=limit, offset=next_offset, params=params)
+        last_page_size = len(page)
+        next_offset += limit
+        if page:
+            yield page
+
+
+def iter_dataset_batches(dataset_id, total_rows, schema=None, **kwargs):
+    """
+    Fetch a dataset concurrently as a stream of Arrow record batches.
+
+    Args:
+        dataset_id: The dataset identifier
+        total_rows: Row count from get_row_count()
+        schema: Optional pa.Schema applied to every batch (keeps batches consistent
+            when SODA omits null fields from some pages)
+        **kwargs: Passed through to iter_dataset_pages()
+
+    Yields:
+        pa.RecordBatch per page, in offset order
+    """
+    for page in iter_dataset_pages(dataset_id, total_rows, **kwargs):
+        yield pa.RecordBatch.from_pylist(page, schema=schema)
+
+
 def get_dataset_metadata(dataset_id):
     """
     Get metadata for a specific dataset.
@@ -73,3 +580,106 @@ def get_dataset_metadata(dataset_id):
     response = rate_limited_get(f'api/views/{dataset_id}.json')
     response.raise_for_status()
     return response.json()
+
+
+class _CsvRecordCounter:
+    """Counts the records of a CSV body as its bytes stream past, keeping the last one.
+
+    A newline ends a record unless it is inside a quoted field. Every double
+    quote toggles quoting (an escaped "" toggles twice), so each chunk is
+    split on quotes and only newlines outside them are counted.
+    """
+
+    def __init__(self):
+        self.records = 0
+        self.last = b''  # the last complete record, without its newline
+        self._quoted = False
+        self._record = b''  # bytes seen since the last record ended
+
+    def feed(self, chunk):
+        if not chunk:
+            return
+        # Offsets of the last two record-ending newlines in this chunk
+        end = previous = -1
+        offset = 0
+        for i, part in enumerate(chunk.split(b'"')):
+            if not (self._quoted ^ bool(i % 2)):
+                newlines = part.count(b'\n')
+                if newlines:
+                    self.records += newlines
+                    last = part.rfind(b'\n')
+                    previous = offset + part.rfind(b'\n', 0, last) if newlines > 1 else end
+                    end = offset + last
+            offset += len(part) + 1
+        self._quoted ^= bool(chunk.count(b'"') % 2)
+        if end < 0:
+            self._record += chunk
+            return
+        self.last = self._record + chunk[:end] if previous < 0 else chunk[previous + 1:end]
+        self._record = chunk[end + 1:]
+
+    @property
+    def rows(self):
+        """Data rows: records after the header line, counting an unterminated last one."""
+        return max(0, self.records + bool(self._record) - 1)
+
+    @property
+    def last_id(self):
+        """First field (:id, with KEYSET_ORDER) of the last data row, or None if there are none."""
+        record = self._record if self._record and not self._quoted else self.last
+        if self.rows == 0 or not record:
+            return None
+        return next(csv.reader([record.decode('utf-8')]))[0]
+
+
+def download_export(dataset_id, fileobj, limit, after_id=None, params=None, header=True, chunk_size=1 << 20):
+    """
+    Download up to `limit` rows after after_id as CSV in one request, streaming it to fileobj.
+
+    Uses the SODA resource CSV endpoint with keyset ordering, so the body is
+    never held in memory, the columns are the same field names (with the same
+    value encoding) as the JSON pages, and a large dataset can be exported
+    in windows: fetch the next one after the returned :id until a window
+    comes back short.
+
+    Args:
+        dataset_id: The dataset identifier
+        fileobj: Binary file-like object to write the CSV body to
+        limit: Rows in the window ($limit)
+        after_id: ':id' to start after (None to start from the beginning)
+        params: Extra SoQL parameters
+        header: Write the CSV header line (False for windows after the first)
+        chunk_size: Bytes per write
+
+    Not retried here, since fileobj can't be rewound: callers retry the
+    whole window (see STREAM_RETRY).
+
+    Returns:
+        (bytes written, rows written, last :id) tuple
+    """
+    _limiter.wait()
+    url = f"{BASE_URL}/resource/{dataset_id}.csv"
+
+    written = 0
+    records = _CsvRecordCounter()
+    with stream("GET", url, params=_keyset_params(limit, after_id, params),
+                headers=_request_headers({'Accept': 'text/csv'}), timeout=120.0) as response:
+        _observe_throttling(response)
+        response.raise_for_status()
+        for chunk in response.iter_bytes(chunk_size):
+            body = chunk
+            if not header and records.records == 0:
+                # Still inside the header line: drop everything up to its end
+                newline = chunk.find(b'\n')
+                body = chunk[newline + 1:] if newline >= 0 else b''
+            records.feed(chunk)
+            fileobj.write(body)
+            written += len(body)
+    return written, records.rows, records.last_id
+
+
+async def async_get_dataset_metadata(dataset_id):
+    """Async variant of get_dataset_metadata."""
+    response = await async_rate_limited_get(f'api/views/{dataset_id}.json')
+    response.raise_for_status()
+    return response.json()
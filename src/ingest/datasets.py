@@ -1,14 +1,142 @@
+import gzip
 
-from cdc_client import get_catalog
-from subsets_utils import save_raw_json
+import pyarrow as pa
+
+from cdc_client import STREAM_RETRY, stream_catalog
+from subsets_utils import save_raw_json, load_raw_json, raw_writer, save_raw_parquet, load_raw_parquet
+from selected_datasets import SELECTED_DATASETS
+
+# Catalog views of the selected datasets, filled by run() and shared with
+# raw_data in the same process
+_views = {}
+_index = None
+
+CATALOG_INDEX_SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("name", pa.string()),
+    ("rows_updated_at", pa.int64()),
+    ("view_last_modified", pa.int64()),
+    ("columns", pa.list_(pa.string())),
+    ("row_count", pa.int64()),
+])
+
+# Entry fields whose change marks a view as changed in the catalog diff
+DIFF_FIELDS = ("rows_updated_at", "view_last_modified", "columns")
+
+
+def _cached_row_count(view: dict) -> int | None:
+    """Row count from the columns' cachedContents (non-null + null), if the catalog has it."""
+    counts = []
+    for col in view.get("columns", []):
+        cached = col.get("cachedContents") or {}
+        if "non_null" not in cached:
+            continue
+        try:
+            counts.append(int(cached.get("non_null", 0)) + int(cached.get("null", 0)))
+        except (TypeError, ValueError):
+            continue
+    return max(counts) if counts else None
+
+
+def index_entry(view: dict) -> dict:
+    """Catalog index entry for a view: rowsUpdatedAt, viewLastModified, column list and row count."""
+    return {
+        "rows_updated_at": view.get("rowsUpdatedAt"),
+        "view_last_modified": view.get("viewLastModified"),
+        "columns": [col.get("fieldName") for col in view.get("columns", [])],
+        "row_count": _cached_row_count(view),
+    }
+
+
+def _index_table(index: dict, names: dict) -> pa.Table:
+    return pa.Table.from_pylist(
+        [{"id": view_id, "name": names.get(view_id), **entry} for view_id, entry in index.items()],
+        schema=CATALOG_INDEX_SCHEMA,
+    )
+
+
+def _load_saved_index() -> dict:
+    """Catalog index saved by the last catalog ingest."""
+    try:
+        table = load_raw_parquet("catalog_index")
+    except FileNotFoundError:
+        return {}
+    return {row.pop("id"): {key: value for key, value in row.items() if key != "name"}
+            for row in table.to_pylist()}
+
+
+def get_catalog_index() -> dict:
+    """Catalog index from this run, or the one saved by the last catalog ingest."""
+    global _index
+    if _index is None:
+        _index = _load_saved_index()
+    return _index
+
+
+def get_catalog_view(dataset_id: str) -> dict | None:
+    """Full catalog view (same shape as api/views/{id}.json), if fetched in this run."""
+    return _views.get(dataset_id)
+
+
+def diff_catalog(previous: dict, current: dict) -> dict:
+    """Views added, changed (rows, view or columns) and removed between two catalog indexes."""
+    def changed(view_id):
+        return any(current[view_id].get(key) != previous[view_id].get(key) for key in DIFF_FIELDS)
+
+    return {
+        "new": sorted(current.keys() - previous.keys()),
+        "changed": sorted(view_id for view_id in current.keys() & previous.keys() if changed(view_id)),
+        "removed": sorted(previous.keys() - current.keys()),
+    }
+
+
+def get_catalog_diff() -> dict:
+    """Diff saved by the last catalog ingest: {"new", "changed", "removed"} view ids."""
+    try:
+        return load_raw_json("catalog_diff")
+    except FileNotFoundError:
+        return {"new": [], "changed": [], "removed": []}
+
+
+def _fetch_catalog() -> tuple[dict, dict]:
+    """Stream the catalog into datasets.json.gz, returning its index and view names."""
+    index, names = {}, {}
+    _views.clear()
+    with raw_writer("datasets", "json.gz") as f, gzip.GzipFile(fileobj=f, mode='wb') as gz:
+        gz.write(b'[')
+        for position, (view, line) in enumerate(stream_catalog()):
+            gz.write((',\n' if position else '\n').encode('utf-8') + line.encode('utf-8'))
+            if "id" not in view:
+                continue
+            index[view["id"]] = index_entry(view)
+            names[view["id"]] = view.get("name")
+            # The catalogue doubles as bulk metadata for raw_data
+            if view["id"] in SELECTED_DATASETS:
+                _views[view["id"]] = view
+        gz.write(b'\n]\n')
+    return index, names
 
 
 def run():
-    """Fetch CDC dataset catalogue and save raw JSON"""
+    """Fetch CDC dataset catalogue and save it compressed, with an index and a diff.
+
+    The catalogue is streamed one view at a time into datasets.json.gz. The
+    id-keyed index goes to catalog_index.parquet and the views added, changed
+    or removed since the previous index go to catalog_diff.json, so later
+    steps can read either instead of the full catalogue.
+    """
+    global _index
     print("  Fetching dataset catalogue...")
 
-    datasets = get_catalog()
+    previous = _load_saved_index()
+    index, names = STREAM_RETRY.call(_fetch_catalog)
+
+    print(f"  Found {len(index):,} datasets")
 
-    print(f"  Found {len(datasets):,} datasets")
+    save_raw_parquet(_index_table(index, names), "catalog_index")
+    _index = index
 
-    save_raw_json(datasets, "datasets")
+    diff = diff_catalog(previous, index)
+    save_raw_json(diff, "catalog_diff")
+    print(f"  Catalogue changes: {len(diff['new'])} new, {len(diff['changed'])} changed, "
+          f"{len(diff['removed'])} removed")
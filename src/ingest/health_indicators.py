@@ -1,45 +1,84 @@
-import gzip
 import json
-import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 
-from cdc_client import get_dataset
-from subsets_utils import get_data_dir
+import pyarrow as pa
+
+from cdc_client import MAX_WORKERS, get_dataset_metadata, get_group_counts, iter_dataset_keyset, soql_equals
+from subsets_utils import save_raw_json, save_raw_parquet
 
 # PLACES: Local Data for Better Health dataset ID
 PLACES_COUNTY_ID = 'swc5-untb'
 
+# Partition keys to split on, in order of preference; the first one the
+# dataset has is used
+PARTITION_COLUMNS = ("stateabbr", "statedesc", "state", "jurisdiction")
+
+# File name for rows with no partition value (the name Hive uses)
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def choose_partition_column(metadata: dict) -> str:
+    """First of PARTITION_COLUMNS present in the dataset's columns."""
+    fields = {col.get("fieldName") for col in metadata.get("columns", [])}
+    for column in PARTITION_COLUMNS:
+        if column in fields:
+            return column
+    raise ValueError(f"No partition column among {PARTITION_COLUMNS} in {metadata.get('id')}")
 
-def run():
-    """Fetch CDC PLACES county-level health indicators and stream to disk."""
-    print("  Fetching PLACES county health indicators...")
 
-    data_dir = get_data_dir()
-    raw_dir = os.path.join(data_dir, "raw")
-    os.makedirs(raw_dir, exist_ok=True)
-    output_path = os.path.join(raw_dir, "health_indicators.ndjson.gz")
+def partition_asset(column: str, value: str | None) -> str:
+    """Raw asset id of one partition: health_indicators/{column}={value}."""
+    name = NULL_PARTITION if value is None else re.sub(r'[^\w.-]', '_', value)
+    return f"health_indicators/{column}={name}"
 
-    offset = 0
-    limit = 50000
-    total_records = 0
 
-    with gzip.open(output_path, 'wt', encoding='utf-8') as f:
-        while True:
-            print(f"    Fetching rows {offset:,} to {offset + limit:,}...")
-            batch = get_dataset(PLACES_COUNTY_ID, limit=limit, offset=offset)
+def _cell(value):
+    # Nested values (e.g. geolocation points) are kept as JSON text
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
 
-            if not batch:
-                break
 
-            for record in batch:
-                f.write(json.dumps(record) + '\n')
+def fetch_partition(column: str, value: str | None, fields: list) -> int:
+    """Fetch one partition with keyset paging and save it as a Parquet file."""
+    rows = []
+    for page in iter_dataset_keyset(PLACES_COUNTY_ID, params={'$where': soql_equals(column, value)}):
+        rows.extend(page)
+
+    table = pa.table(
+        {field: pa.array([_cell(row.get(field)) for row in rows], type=pa.string()) for field in fields}
+    )
+    save_raw_parquet(table, partition_asset(column, value), metadata={"dataset": PLACES_COUNTY_ID, column: value})
+    return len(rows)
+
+
+def run():
+    """Fetch CDC PLACES county-level health indicators, one Parquet file per state.
+
+    The dataset is split on its partition column (state), partitions are
+    fetched concurrently, largest first, and health_indicators/_partitions.json
+    lists the partition files with their row counts.
+    """
+    print("  Fetching PLACES county health indicators...")
 
-            total_records += len(batch)
-            print(f"      Got {len(batch):,} rows")
+    metadata = get_dataset_metadata(PLACES_COUNTY_ID)
+    column = choose_partition_column(metadata)
+    # Same columns in every partition, so the files read as one table
+    fields = [":id"] + [col["fieldName"] for col in metadata.get("columns", [])
+                        if not col.get("fieldName", ":").startswith(":")]
 
-            if len(batch) < limit:
-                break
+    counts = get_group_counts(PLACES_COUNTY_ID, column)
+    total_estimate = sum(counts.values())
+    partitions = sorted(counts, key=counts.get, reverse=True)
+    print(f"    Fetching ~{total_estimate:,} rows in {len(partitions)} partitions by {column}...")
 
-            offset += limit
+    manifest = {"dataset": PLACES_COUNTY_ID, "partition_column": column, "partitions": {}}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {value: executor.submit(fetch_partition, column, value, fields) for value in partitions}
+        for value, future in futures.items():
+            manifest["partitions"][partition_asset(column, value)] = future.result()
 
+    total_records = sum(manifest["partitions"].values())
+    save_raw_json(manifest, "health_indicators/_partitions")
     print(f"  Total: {total_records:,} records")
-    print(f"  -> R2: Saved health_indicators.ndjson.gz")
@@ -0,0 +1,63 @@
+"""Column projection: fetch only the source fields that transforms read.
+
+Each transform declares SOURCE_ID and SOURCE_FIELDS at module level. The
+declarations are read with `ast` so transforms are not imported during ingest.
+"""
+
+import ast
+from pathlib import Path
+
+TRANSFORMS_DIR = Path(__file__).resolve().parent.parent / "transforms"
+
+
+def _module_constants(path: Path) -> dict:
+    constants = {}
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            name = node.targets[0].id
+            if name in ("SOURCE_ID", "SOURCE_FIELDS"):
+                constants[name] = ast.literal_eval(node.value)
+    return constants
+
+
+def collect_source_fields() -> dict:
+    """Map each SOURCE_ID to the union of SOURCE_FIELDS of the transforms reading it.
+
+    A source maps to None (fetch all columns) if any transform reading it
+    does not declare SOURCE_FIELDS.
+    """
+    fields = {}
+    for path in sorted(TRANSFORMS_DIR.glob("*/main.py")):
+        constants = _module_constants(path)
+        source_id = constants.get("SOURCE_ID")
+        if source_id is None:
+            continue
+        declared = constants.get("SOURCE_FIELDS")
+        if declared is None or (source_id in fields and fields[source_id] is None):
+            fields[source_id] = None
+        else:
+            fields[source_id] = sorted(set(fields.get(source_id, [])) | set(declared))
+    return fields
+
+
+def project_fields(fields: list | None, columns: list | None) -> list | None:
+    """Restrict requested fields to the dataset's columns (when the catalog lists them)."""
+    if fields is None or not columns:
+        return fields
+    return [field for field in fields if field in columns]
+
+
+def select_clause(fields: list | None) -> dict:
+    """SoQL params selecting :id plus the given fields (empty dict = all columns)."""
+    if fields is None:
+        return {}
+    return {'$select': ", ".join([":id"] + [f"`{field}`" for field in fields])}
+
+
+def covers(fetched: list | None, needed: list | None) -> bool:
+    """True if rows fetched with `fetched` fields contain every `needed` field."""
+    if fetched is None:
+        return True
+    if needed is None:
+        return False
+    return set(needed) <= set(fetched)
@@ -1,30 +1,143 @@
+import asyncio
 import gzip
+import itertools
 import json
 import os
+import time
 from httpx import HTTPStatusError
 from tqdm import tqdm
 
-from cdc_client import get_dataset, get_dataset_metadata
-from subsets_utils import load_state, save_state, get_data_dir
+from cdc_client import (
+    KEYSET_ORDER, PAGE_SIZE, STREAM_RETRY, async_get_dataset_metadata, async_get_row_count,
+    async_get_max_updated_at, download_export, get_row_count, iter_dataset_pages, iter_dataset_keyset,
+    stream_dataset_after, updated_since, created_through,
+)
+from subsets_utils import (
+    load_state, save_state, delete_state, save_raw_json, save_raw_delta, clear_raw_deltas, raw_segment_writer,
+    has_raw_segments, join_raw_segments, clear_raw_segments, remove_raw_layouts, aclose,
+)
 from selected_datasets import SELECTED_DATASETS
+from ingest.datasets import get_catalog_index, get_catalog_view
+from ingest.projection import collect_source_fields, covers, project_fields, select_clause
+from ingest.scheduler import INGEST_TIME_BUDGET, Schedule, estimate_cost
 
-# Datasets too large to fit in memory - stream directly to disk
-LARGE_DATASET_THRESHOLD = 200000  # Stream if > 200k rows
+# Datasets too large to page through - fetched as one bulk CSV export
+LARGE_DATASET_THRESHOLD = 200000  # Export if > 200k rows
+EXPORT_WINDOW = 1000000  # Rows per export request, each committed as a resumable segment
 
+# Incremental refresh: changed rows are appended as delta segments unless so
+# many changed (or segments piled up) that a full re-fetch is cheaper
+MAX_DELTA_ROWS = LARGE_DATASET_THRESHOLD
+MAX_DELTA_FRACTION = 0.5  # of the stored rows
+MAX_DELTA_SEGMENTS = 20
 
-def stream_large_dataset(dataset_id: str, name: str, score: int, metadata: dict, first_batch: list) -> int:
-    """Stream a large dataset directly to disk in NDJSON format to avoid OOM."""
-    data_dir = get_data_dir()
-    raw_dir = os.path.join(data_dir, "raw")
-    os.makedirs(raw_dir, exist_ok=True)
+# Number of datasets fetched concurrently by the async ingest engine
+INGEST_CONCURRENCY = int(os.environ.get('INGEST_CONCURRENCY', '8'))
 
-    output_path = os.path.join(raw_dir, f"dataset_{dataset_id}.ndjson.gz")
 
-    limit = 50000
-    total_rows = 0
+def _write_segment(dataset_id: str, seq: int, lines) -> int:
+    """Write NDJSON lines as one gzip member, committed as raw segment `seq`. Returns lines written.
 
-    with gzip.open(output_path, 'wt', encoding='utf-8') as f:
-        # Write header record first
+    Lines are consumed as they arrive, so a streamed page never sits in
+    memory. mtime and filename are left out of the gzip header, so the same
+    lines always produce the same bytes, and segments concatenate into a
+    valid .ndjson.gz file. Nothing is kept if there were no lines.
+    """
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        return 0
+    count = 0
+    with raw_segment_writer(f"dataset_{dataset_id}", "ndjson.gz", seq) as f, \
+            gzip.GzipFile(filename='', mode='wb', fileobj=f, mtime=0) as gz:
+        for line in itertools.chain([first], lines):
+            gz.write(line.encode('utf-8') + b'\n')
+            count += 1
+    return count
+
+
+def load_stream_checkpoint(dataset_id: str, params: dict | None) -> dict | None:
+    """Checkpoint of an interrupted stream_large_dataset or export_large_dataset run, if it can be resumed.
+
+    The manifest's "layout" says which of the two wrote it.
+    """
+    checkpoint = load_state(f"raw_data_stream_{dataset_id}")
+    if not checkpoint.get("segments") or checkpoint.get("params") != (params or {}):
+        return None
+    layout = checkpoint.get("layout", "ndjson.gz")
+    if not has_raw_segments(f"dataset_{dataset_id}", layout, checkpoint["segments"]):
+        return None
+    return checkpoint
+
+
+def stream_large_dataset(dataset_id: str, name: str, score: int, metadata: dict,
+                         paging: str = "keyset", params: dict = None, watermark: str = None,
+                         checkpoint: dict = None) -> int:
+    """Stream a large dataset to the raw store in NDJSON format to avoid OOM.
+
+    Rows come in :id order. With paging="keyset" pages are fetched serially
+    with `:id > last_seen` cursors, which stays cheap and stable on deep
+    pages; those pages are decoded incrementally and each row's response
+    text is written as-is, so a page is never held in memory.
+    paging="offset" fetches $offset windows concurrently instead.
+    params carries the column projection ($select).
+
+    Each page is committed as a gzip member in its own raw segment (see
+    raw_segment_writer: a local file, or an R2 object streamed as a
+    multipart upload), recorded in a checkpoint manifest (state asset
+    raw_data_stream_{id}). Pass the manifest from load_stream_checkpoint()
+    as `checkpoint` to resume after the last committed page, in either
+    mode. When the last page arrives, the segments are joined into
+    dataset_{id}.ndjson.gz, which is the same file an uninterrupted run
+    writes.
+    """
+    if checkpoint is not None:
+        paging = checkpoint["paging"]
+    if paging not in ("keyset", "offset"):
+        raise ValueError(f"Invalid paging '{paging}'. Must be 'keyset' or 'offset'.")
+
+    checkpoint_asset = f"raw_data_stream_{dataset_id}"
+    limit = PAGE_SIZE
+
+    def commit(lines, page=None):
+        count = _write_segment(dataset_id, manifest["segments"], lines)
+        if not count:
+            return
+        manifest["segments"] += 1
+        if page is not None:
+            manifest["pages"] += 1
+            manifest["rows"] += page["rows"]
+            manifest["after_id"] = page["after_id"]
+        save_state(checkpoint_asset, manifest)
+
+    def record_lines(records, page):
+        for record in records:
+            page["rows"] += 1
+            page["after_id"] = record[':id']
+            yield json.dumps(record)
+
+    def streamed_lines(page):
+        # Raw response text per row, written without a decode/encode round trip
+        for record, line in stream_dataset_after(dataset_id, after_id=page["after_id"], limit=limit,
+                                                 params=params):
+            page["rows"] += 1
+            page["after_id"] = record[':id']
+            yield line
+
+    if checkpoint is None:
+        # Segments left by a run that can't be resumed would be joined in
+        clear_raw_segments(f"dataset_{dataset_id}", "ndjson.gz")
+        manifest = {
+            "layout": "ndjson.gz",
+            "paging": paging,
+            "params": params or {},
+            "watermark": watermark,
+            "segments": 0,
+            "pages": 0,
+            "rows": 0,
+            "after_id": None,
+        }
+        # Header record first
         header = {
             "_header": True,
             "id": dataset_id,
@@ -32,95 +145,384 @@ def stream_large_dataset(dataset_id: str, name: str, score: int, metadata: dict,
             "score": score,
             "metadata": metadata,
         }
-        f.write(json.dumps(header) + '\n')
+        commit([json.dumps(header)])
+    else:
+        manifest = checkpoint
 
-        # Write first batch (already fetched)
-        for row in first_batch:
-            f.write(json.dumps(row) + '\n')
-        total_rows += len(first_batch)
-        offset = limit
+    if paging == "keyset":
+        def fetch_page():
+            # A failed attempt leaves nothing committed, so the page restarts clean
+            page = {"rows": 0, "after_id": manifest["after_id"]}
+            commit(streamed_lines(page), page)
+            return page
 
-        # Continue fetching remaining batches
         while True:
-            rows = get_dataset(dataset_id, limit=limit, offset=offset)
-            if not rows:
+            page = STREAM_RETRY.call(fetch_page)
+            if page["rows"] < limit:
                 break
+    else:
+        # Fetch remaining pages concurrently, written back in offset order
+        total_estimate = get_row_count(dataset_id)
+        pages = iter_dataset_pages(dataset_id, total_estimate, limit=limit, offset=manifest["pages"] * limit,
+                                   params={**KEYSET_ORDER, **(params or {})})
+        for rows in pages:
+            page = {"rows": 0, "after_id": None}
+            commit(record_lines(rows, page), page)
 
-            for row in rows:
-                f.write(json.dumps(row) + '\n')
+    join_raw_segments(f"dataset_{dataset_id}", "ndjson.gz", manifest["segments"])
+    delete_state(checkpoint_asset)
+    return manifest["rows"]
 
-            total_rows += len(rows)
-            offset += limit
 
-            if len(rows) < limit:
-                break
+def export_large_dataset(dataset_id: str, name: str, score: int, metadata: dict,
+                         params: dict = None, watermark: str = None, checkpoint: dict = None) -> tuple[int, int]:
+    """Fetch a large dataset with bulk CSV exports, streamed to the raw store.
 
-    return total_rows
+    The export runs in keyset windows of up to EXPORT_WINDOW rows, each
+    starting after the last :id of the one before, until a window comes
+    back short; a window is one request, so a stale row count can't cut the
+    export short. Each window goes through gzip into its own raw segment,
+    recorded in a checkpoint manifest like stream_large_dataset's pages
+    (pass the manifest from load_stream_checkpoint() as `checkpoint` to
+    resume after the last committed window). The segments are then joined
+    into dataset_{id}.csv.gz, with the CSV header line from the first
+    window only; the header record is saved alongside as
+    dataset_{id}.header.json.
 
+    Returns (bytes, rows) written.
+    """
+    checkpoint_asset = f"raw_data_stream_{dataset_id}"
 
-def run():
-    """Fetch raw data for selected high-quality CDC datasets."""
-    state = load_state("raw_data")
-    completed = set(state.get("completed", []))
-    skipped = set(state.get("skipped", []))
+    if checkpoint is None:
+        clear_raw_segments(f"dataset_{dataset_id}", "csv.gz")
+        save_raw_json({
+            "id": dataset_id,
+            "name": name,
+            "score": score,
+            "metadata": metadata,
+        }, f"dataset_{dataset_id}.header")
+        manifest = {
+            "layout": "csv.gz",
+            "params": params or {},
+            "watermark": watermark,
+            "segments": 0,
+            "rows": 0,
+            "bytes": 0,
+            "after_id": None,
+        }
+    else:
+        manifest = checkpoint
 
-    pending = [(id, score) for id, score in SELECTED_DATASETS.items()
-               if id not in completed and id not in skipped]
+    def export_window():
+        # A failed attempt leaves nothing committed, so the window restarts clean
+        seq = manifest["segments"]
+        with raw_segment_writer(f"dataset_{dataset_id}", "csv.gz", seq) as f, \
+                gzip.GzipFile(filename='', mode='wb', fileobj=f, mtime=0) as gz:
+            return download_export(dataset_id, gz, EXPORT_WINDOW, after_id=manifest["after_id"], params=params,
+                                   header=seq == 0)
 
-    if not pending:
-        print("  All datasets up to date")
-        return
+    while True:
+        size, rows, last_id = STREAM_RETRY.call(export_window)
+        manifest["segments"] += 1
+        manifest["rows"] += rows
+        manifest["bytes"] += size
+        manifest["after_id"] = last_id or manifest["after_id"]
+        save_state(checkpoint_asset, manifest)
+        if rows < EXPORT_WINDOW:
+            break
+
+    join_raw_segments(f"dataset_{dataset_id}", "csv.gz", manifest["segments"])
+    delete_state(checkpoint_asset)
+    return manifest["bytes"], manifest["rows"]
+
+
+def fetch_rows(dataset_id: str, params: dict = None) -> list:
+    """Fetch all rows (matching params['$where'], if any) with keyset paging."""
+    return [row for page in iter_dataset_keyset(dataset_id, params=params) for row in page]
+
+
+def fetch_delta_rows(dataset_id: str, where: str, params: dict = None) -> list:
+    """Fetch all rows matching a SoQL filter with keyset paging."""
+    return fetch_rows(dataset_id, {**(params or {}), '$where': where})
+
+
+async def fetch_full(dataset_id: str, score: int, metadata: dict, fields: list | None,
+                     row_count: int | None = None) -> dict | None:
+    """Fetch a whole dataset into the raw store, projected to `fields` (None = all columns).
+
+    The fetch path is picked from the row count before any row is fetched:
+    `row_count` (e.g. from the catalog) if given, else a count(*) query; a
+    given count of 0, or one large enough for an export, is replaced by a
+    live count(*). Up to one page is kept in memory, up to
+    LARGE_DATASET_THRESHOLD rows are streamed page by page, and anything
+    larger is a bulk CSV export. An export whose rows match neither the
+    count before it nor a count after it is re-fetched with keyset paging.
+    Streams and exports are checkpointed, and one interrupted in an
+    earlier run (locally or in the cloud) is resumed first.
+
+    Returns the dataset's state entry, or None if the dataset has no rows.
+    """
+    name = metadata.get("name", dataset_id)
+    params = select_clause(fields)
+
+    # Resume a stream or export interrupted in an earlier run from its last committed segment
+    checkpoint = await asyncio.to_thread(load_stream_checkpoint, dataset_id, params)
+    if checkpoint is not None:
+        layout = checkpoint.get("layout", "ndjson.gz")
+        if layout == "csv.gz":
+            tqdm.write(f"  {dataset_id}: {name[:50]}... (resuming export after {checkpoint['rows']:,} rows)")
+            _, total_rows = await asyncio.to_thread(
+                export_large_dataset, dataset_id, name, score, metadata, checkpoint=checkpoint, params=params
+            )
+        else:
+            tqdm.write(f"  {dataset_id}: {name[:50]}... (resuming stream after {checkpoint['rows']:,} rows)")
+            total_rows = await asyncio.to_thread(
+                stream_large_dataset, dataset_id, name, score, metadata, checkpoint=checkpoint, params=params
+            )
+        tqdm.write(f"    -> {total_rows:,} rows")
+        await asyncio.to_thread(clear_raw_deltas, f"dataset_{dataset_id}")
+        await asyncio.to_thread(remove_raw_layouts, f"dataset_{dataset_id}", keep=layout)
+        return await _full_entry(dataset_id, metadata, checkpoint["watermark"], fields)
+
+    # Watermark is taken before fetching: rows changed mid-fetch are re-pulled next run
+    watermark = await async_get_max_updated_at(dataset_id)
+    if not row_count or row_count > LARGE_DATASET_THRESHOLD:
+        # A catalog count comes from cachedContents, which lags recently
+        # changed views: skipping a dataset as empty, and picking and checking
+        # a bulk export, take a live count(*)
+        row_count = await async_get_row_count(dataset_id)
+
+    if row_count == 0:
+        tqdm.write(f"  {dataset_id}: {name[:50]}... (0 rows - skipping)")
+        return None
+
+    # Disk writes and the threaded pagers run off the event loop
+    if row_count > LARGE_DATASET_THRESHOLD:
+        tqdm.write(f"  {dataset_id}: {name[:50]}... (bulk export, ~{row_count:,} rows)")
+        size, total_rows = await asyncio.to_thread(
+            export_large_dataset, dataset_id, name, score, metadata, params=params, watermark=watermark
+        )
+        tqdm.write(f"    -> {size / 1024 / 1024:,.1f} MB CSV, {total_rows:,} rows")
+        layout = "csv.gz"
+        if total_rows != row_count and total_rows != await async_get_row_count(dataset_id):
+            # Neither the count before nor after the export: rows went missing
+            tqdm.write(f"    -> export doesn't match count(*); re-fetching with keyset paging")
+            total_rows = await asyncio.to_thread(
+                stream_large_dataset, dataset_id, name, score, metadata, params=params, watermark=watermark
+            )
+            tqdm.write(f"    -> {total_rows:,} rows")
+            layout = "ndjson.gz"
+    elif row_count > PAGE_SIZE:
+        tqdm.write(f"  {dataset_id}: {name[:50]}... (streaming ~{row_count:,} rows)")
+        total_rows = await asyncio.to_thread(
+            stream_large_dataset, dataset_id, name, score, metadata, params=params, watermark=watermark
+        )
+        tqdm.write(f"    -> {total_rows:,} rows")
+        layout = "ndjson.gz"
+    else:
+        # Small dataset - save normally (keyset paging picks up rows beyond a stale count)
+        rows = await asyncio.to_thread(fetch_rows, dataset_id, params)
+        if not rows:
+            tqdm.write(f"  {dataset_id}: {name[:50]}... (0 rows - skipping)")
+            return None
+        tqdm.write(f"  {dataset_id}: {name[:50]}... ({len(rows):,} rows)")
+        await asyncio.to_thread(save_raw_json, {
+            "id": dataset_id,
+            "name": name,
+            "score": score,
+            "metadata": metadata,
+            "data": rows,
+        }, f"dataset_{dataset_id}", compress=True)
+        layout = "json.gz"
+
+    # Deltas from before this snapshot would overwrite newer rows, and an
+    # older snapshot in another layout would shadow this one
+    await asyncio.to_thread(clear_raw_deltas, f"dataset_{dataset_id}")
+    await asyncio.to_thread(remove_raw_layouts, f"dataset_{dataset_id}", keep=layout)
+
+    return await _full_entry(dataset_id, metadata, watermark, fields)
+
+
+async def _stored_rows(dataset_id: str, watermark: str | None) -> int:
+    """Rows created up to the watermark: what the raw store holds, less rows created mid-fetch."""
+    if not watermark:
+        return 0
+    return await async_get_row_count(dataset_id, where=created_through(watermark))
+
+
+async def _full_entry(dataset_id: str, metadata: dict, watermark: str | None, fields: list | None) -> dict:
+    """State entry for a dataset just fetched in full."""
+    return {"rows_updated_at": metadata.get("rowsUpdatedAt"), "watermark": watermark, "deltas": 0,
+            "fields": fields, "rows": await _stored_rows(dataset_id, watermark)}
+
+
+async def fetch_delta(dataset_id: str, metadata: dict, entry: dict) -> dict | None:
+    """Re-pull rows changed since the stored watermark as a new delta segment.
+
+    Deltas only add and replace rows, so the entry's row count (rows created
+    up to its watermark) is checked against a live count first: fewer means
+    rows were deleted, and a replace gives every row a new :id and
+    :created_at, so either needs a full re-fetch.
 
-    print(f"  Fetching {len(pending)} datasets...")
+    Returns the updated state entry, or None when a full re-fetch is needed
+    (no watermark or row count yet, too many segments, deleted or replaced
+    rows, or too many changed rows).
+    """
+    if not entry.get("watermark") or entry.get("rows") is None or entry.get("deltas", 0) >= MAX_DELTA_SEGMENTS:
+        return None
 
-    # Import here to avoid circular import
-    from subsets_utils import save_raw_json
+    if await _stored_rows(dataset_id, entry["watermark"]) != entry["rows"]:
+        return None
 
-    for dataset_id, score in tqdm(pending, desc="Datasets", unit="ds"):
+    where = updated_since(entry["watermark"])
+    changed = await async_get_row_count(dataset_id, where=where)
+    if changed > MAX_DELTA_ROWS or changed > entry["rows"] * MAX_DELTA_FRACTION:
+        return None
+
+    name = metadata.get("name", dataset_id)
+    watermark = await async_get_max_updated_at(dataset_id)
+    deltas = entry.get("deltas", 0)
+
+    tqdm.write(f"  {dataset_id}: {name[:50]}... ({changed:,} changed rows)")
+    if changed:
+        rows = await asyncio.to_thread(fetch_delta_rows, dataset_id, where, select_clause(entry.get("fields")))
+        deltas += 1
+        await asyncio.to_thread(save_raw_delta, rows, f"dataset_{dataset_id}", deltas)
+
+    watermark = watermark or entry["watermark"]
+    return {**entry, "rows_updated_at": metadata.get("rowsUpdatedAt"), "watermark": watermark,
+            "deltas": deltas, "rows": await _stored_rows(dataset_id, watermark)}
+
+
+async def ingest_dataset(dataset_id: str, score: int, entry: dict | None, catalog: dict,
+                         needed: list | None) -> tuple[str, dict | None]:
+    """Bring one dataset in the raw store up to date.
+
+    The catalog index decides whether a completed dataset changed, and the
+    catalog view serves as its metadata, so no per-dataset metadata call is
+    made unless the dataset is missing from the catalog. Only the `needed`
+    source fields are fetched (None = all columns); if transforms now need
+    fields the stored rows lack, the dataset is re-fetched in full.
+
+    Returns (outcome, state entry) where outcome is 'completed' (full fetch),
+    'updated' (delta segment), 'unchanged' or 'skipped'.
+    """
+    listing = catalog.get(dataset_id)
+    if entry is not None and listing is not None:
+        fields = project_fields(needed, listing["columns"])
+        if covers(entry.get("fields"), fields) and listing["rows_updated_at"] == entry.get("rows_updated_at"):
+            return "unchanged", entry
+
+    metadata = get_catalog_view(dataset_id)
+    if metadata is None:
         try:
-            metadata = get_dataset_metadata(dataset_id)
+            metadata = await async_get_dataset_metadata(dataset_id)
         except HTTPStatusError as e:
             if e.response.status_code == 404:
                 tqdm.write(f"  {dataset_id}: NOT FOUND (skipping)")
-                skipped.add(dataset_id)
-                save_state("raw_data", {"completed": list(completed), "skipped": list(skipped)})
-                continue
+                return "skipped", None
             raise
 
-        name = metadata.get("name", dataset_id)
+    fields = project_fields(needed, [col.get("fieldName") for col in metadata.get("columns", [])])
+    if entry is not None and not covers(entry.get("fields"), fields):
+        entry = None
 
-        # Check estimated row count from metadata
-        row_count_estimate = metadata.get("columns_field_name", metadata).get("row_count", 0)
-        if isinstance(row_count_estimate, str):
-            row_count_estimate = int(row_count_estimate) if row_count_estimate.isdigit() else 0
+    if entry is not None:
+        if entry.get("rows_updated_at") == metadata.get("rowsUpdatedAt"):
+            return "unchanged", entry
 
-        # Fetch first batch to check size
-        first_batch = get_dataset(dataset_id, limit=50000, offset=0)
+        refreshed = await fetch_delta(dataset_id, metadata, entry)
+        if refreshed is not None:
+            return "updated", refreshed
 
-        if not first_batch:
-            tqdm.write(f"  {dataset_id}: {name[:50]}... (0 rows - skipping)")
-            skipped.add(dataset_id)
-            save_state("raw_data", {"completed": list(completed), "skipped": list(skipped)})
-            continue
-
-        # If first batch is full, dataset may be large - stream to avoid OOM
-        if len(first_batch) == 50000:
-            tqdm.write(f"  {dataset_id}: {name[:50]}... (streaming)")
-            total_rows = stream_large_dataset(dataset_id, name, score, metadata, first_batch)
-            tqdm.write(f"    -> {total_rows:,} rows")
-        else:
-            # Small dataset - save normally
-            tqdm.write(f"  {dataset_id}: {name[:50]}... ({len(first_batch):,} rows)")
-            save_raw_json({
-                "id": dataset_id,
-                "name": name,
-                "score": score,
-                "metadata": metadata,
-                "data": first_batch,
-            }, f"dataset_{dataset_id}", compress=True)
-
-        # Update state after each save
-        completed.add(dataset_id)
-        save_state("raw_data", {"completed": list(completed), "skipped": list(skipped)})
-
-    print(f"  Done. Fetched {len(pending)} datasets ({len(skipped)} skipped).")
+    new_entry = await fetch_full(dataset_id, score, metadata, fields,
+                                 row_count=listing.get("row_count") if listing else None)
+    if new_entry is None:
+        return "skipped", None
+    return "completed", new_entry
+
+
+async def run_async(concurrency: int = INGEST_CONCURRENCY, budget: float = INGEST_TIME_BUDGET):
+    """Fetch raw data for selected datasets, `concurrency` datasets at a time.
+
+    New datasets are fetched in full. Completed datasets whose rowsUpdatedAt
+    changed in the catalog index are refreshed incrementally (see fetch_delta).
+    Work is ordered and spread over workers by estimated cost, and datasets
+    that don't fit the time `budget` (seconds, 0 = none) wait for the next
+    run (see ingest.scheduler). All requests share cdc_client's rate limiter.
+    State is saved as each dataset finishes, so an interrupted run keeps its
+    partial progress.
+    """
+    state = load_state("raw_data")
+    completed = set(state.get("completed", []))
+    skipped = set(state.get("skipped", []))
+    datasets = state.get("datasets", {})
+    fetch_seconds = state.get("fetch_seconds", {})
+    catalog = get_catalog_index()
+    source_fields = collect_source_fields()
+
+    # Completed datasets from before watermarks and row counts were tracked get one full re-fetch
+    def stored_entry(dataset_id):
+        return datasets.get(dataset_id) if dataset_id in completed else None
+
+    pending = [(id, score) for id, score in SELECTED_DATASETS.items() if id not in skipped]
+    costs = {id: estimate_cost(stored_entry(id), catalog.get(id), fetch_seconds.get(id)) for id, _ in pending}
+    workers = min(concurrency, len(pending))
+    schedule = Schedule(pending, costs, workers, budget)
+
+    print(f"  Checking {len(pending)} datasets ({concurrency} concurrent)...")
+    schedule.log()
+
+    state_lock = asyncio.Lock()
+    outcomes = {"completed": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+    progress = tqdm(total=len(schedule), desc="Datasets", unit="ds")
+
+    async def worker(index):
+        while True:
+            item = schedule.next(index)
+            if item is None:
+                return
+            dataset_id, score = item
+
+            started = time.monotonic()
+            outcome, entry = await ingest_dataset(dataset_id, score, stored_entry(dataset_id), catalog,
+                                                  source_fields.get(dataset_id))
+            outcomes[outcome] += 1
+
+            # Update state after each dataset
+            if outcome != "unchanged":
+                async with state_lock:
+                    if outcome == "skipped":
+                        skipped.add(dataset_id)
+                        completed.discard(dataset_id)
+                        datasets.pop(dataset_id, None)
+                    else:
+                        completed.add(dataset_id)
+                        datasets[dataset_id] = entry
+                    if outcome == "completed":
+                        # Full fetch times feed the scheduler's next estimates
+                        fetch_seconds[dataset_id] = round(time.monotonic() - started, 1)
+                    await asyncio.to_thread(save_state, "raw_data", {
+                        "completed": list(completed),
+                        "skipped": list(skipped),
+                        "datasets": datasets,
+                        "fetch_seconds": fetch_seconds,
+                    })
+            progress.update(1)
+
+    try:
+        await asyncio.gather(*(worker(index) for index in range(workers)))
+    finally:
+        progress.close()
+        await aclose()
+
+    if outcomes["completed"] == outcomes["updated"] == 0:
+        print("  All datasets up to date")
+    deferred = f", {len(schedule.deferred)} deferred" if schedule.deferred else ""
+    print(f"  Done. {outcomes['completed']} fetched, {outcomes['updated']} updated, "
+          f"{outcomes['unchanged']} unchanged ({len(skipped)} skipped{deferred}).")
+
+
+def run():
+    """Fetch raw data for selected high-quality CDC datasets."""
+    asyncio.run(run_async())
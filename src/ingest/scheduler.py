@@ -0,0 +1,119 @@
+"""Size-aware scheduling of dataset fetches across ingest workers.
+
+Each dataset's cost is estimated from what is known before any request is
+made: whether the catalog says it changed, how long its last full fetch took,
+or its catalog row count. Work is then
+
+- chosen under an optional time budget, best score per estimated second
+  first, so a run cut short has done the small and high-score datasets;
+- bin-packed across workers longest-first (LPT), so long streams land on
+  different workers instead of queueing behind each other;
+- ordered within each worker best score per second first.
+
+Estimates are rough, so a worker that runs out of work takes the lowest
+priority item from the worker with the most estimated work left.
+"""
+
+import heapq
+import os
+from collections import deque
+
+from subsets_utils import debug
+
+# Cost model (seconds). Throughput is for datasets never fetched before.
+ROWS_PER_SECOND = 20000
+REQUEST_SECONDS = 2.0
+DEFAULT_COST = 30.0  # size unknown
+DELTA_COST = 5.0  # count + watermark + changed rows
+
+# Wall-clock budget for one ingest run in seconds (0 = no budget)
+INGEST_TIME_BUDGET = float(os.environ.get('INGEST_TIME_BUDGET', '0'))
+
+
+def estimate_cost(entry: dict | None, listing: dict | None, fetch_seconds: float | None) -> tuple[float, str]:
+    """Estimated seconds to bring one dataset up to date, and what the estimate is based on."""
+    if entry is not None and listing is not None and listing.get("rows_updated_at") == entry.get("rows_updated_at"):
+        return 0.0, "unchanged"
+    if entry is not None and entry.get("watermark"):
+        return DELTA_COST, "delta"
+    if fetch_seconds:
+        return float(fetch_seconds), "history"
+    if listing is not None and listing.get("row_count") is not None:
+        return REQUEST_SECONDS + listing["row_count"] / ROWS_PER_SECOND, "catalog"
+    return DEFAULT_COST, "default"
+
+
+def makespan(costs: list, workers: int) -> float:
+    """Finish time of the busiest worker when costs are packed longest-first."""
+    loads = [0.0] * max(1, workers)
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+
+class Schedule:
+    """Per-worker queues of (dataset_id, score) items.
+
+    Args:
+        items: (dataset_id, score) pairs to schedule
+        costs: dataset_id -> (estimated seconds, basis) from estimate_cost
+        workers: Number of concurrent workers
+        budget: Estimated makespan limit in seconds (0 = none); items that
+            don't fit are deferred to the next run
+    """
+
+    def __init__(self, items: list, costs: dict, workers: int, budget: float = 0.0):
+        self.costs = costs
+        self.workers = max(1, workers)
+        self.budget = budget
+
+        def priority(item):
+            dataset_id, score = item
+            return score / max(costs[dataset_id][0], 1.0)
+
+        self.selected, self.deferred = [], []
+        for item in sorted(items, key=priority, reverse=True):
+            fits = not budget or makespan([costs[i][0] for i, _ in self.selected + [item]], self.workers) <= budget
+            (self.selected if fits else self.deferred).append(item)
+
+        # LPT: each item, longest first, goes to the least loaded worker
+        assigned = [[] for _ in range(self.workers)]
+        loads = [(0.0, worker) for worker in range(self.workers)]
+        for item in sorted(self.selected, key=lambda item: costs[item[0]][0], reverse=True):
+            load, worker = heapq.heappop(loads)
+            assigned[worker].append(item)
+            heapq.heappush(loads, (load + costs[item[0]][0], worker))
+
+        self.queues = [deque(sorted(queue, key=priority, reverse=True)) for queue in assigned]
+        self.estimated_seconds = max(load for load, _ in loads)
+
+    def __len__(self):
+        return len(self.selected)
+
+    def _remaining(self, worker: int) -> float:
+        return sum(self.costs[dataset_id][0] for dataset_id, _ in self.queues[worker])
+
+    def next(self, worker: int) -> tuple | None:
+        """Next item for a worker: its own queue first, then stolen from the busiest."""
+        if self.queues[worker]:
+            return self.queues[worker].popleft()
+        busiest = max(range(self.workers), key=self._remaining)
+        if self.queues[busiest]:
+            return self.queues[busiest].pop()
+        return None
+
+    def log(self):
+        """Print a summary and write every placement to the debug schedule log."""
+        budget = f", budget {self.budget / 60:,.1f} min" if self.budget else ""
+        print(f"  Schedule: {len(self.selected)} datasets on {self.workers} workers, "
+              f"est. {self.estimated_seconds / 60:,.1f} min{budget}")
+        if self.deferred:
+            print(f"  Deferred to next run: {', '.join(dataset_id for dataset_id, _ in self.deferred)}")
+
+        for worker, queue in enumerate(self.queues):
+            for position, (dataset_id, score) in enumerate(queue):
+                cost, basis = self.costs[dataset_id]
+                debug.log_schedule(dataset_id, score, round(cost, 1), basis, worker=worker, position=position)
+        for dataset_id, score in self.deferred:
+            cost, basis = self.costs[dataset_id]
+            debug.log_schedule(dataset_id, score, round(cost, 1), basis, deferred=True)
@@ -1,16 +1,24 @@
-from .http_client import get, post, put, delete
-from .io import upload_data, load_state, save_state, load_asset, has_changed, save_raw_json, load_raw_json, save_raw_file, load_raw_file, save_raw_parquet, load_raw_parquet
+from .http_client import get, post, put, delete, stream
+from .async_http_client import aget, apost, aput, adelete, aclose
+from .rate_limiter import RateLimiter, parse_retry_after
+from .io import upload_data, load_state, save_state, delete_state, load_asset, has_changed, save_raw_json, load_raw_json, save_raw_delta, clear_raw_deltas, open_raw_dataset, iter_raw_rows, open_raw_batches, remove_raw_layouts, save_raw_file, load_raw_file, raw_writer, raw_segment_writer, has_raw_segments, join_raw_segments, clear_raw_segments, save_raw_parquet, load_raw_parquet
 from .environment import validate_environment, get_data_dir
+from .r2 import is_cloud_mode
 from .publish import publish
 from .testing import validate
 from . import debug
 
 __all__ = [
-    'get', 'post', 'put', 'delete',
-    'upload_data', 'load_state', 'save_state', 'load_asset', 'has_changed',
-    'save_raw_json', 'load_raw_json', 'save_raw_file', 'load_raw_file',
+    'get', 'post', 'put', 'delete', 'stream',
+    'aget', 'apost', 'aput', 'adelete', 'aclose',
+    'RateLimiter', 'parse_retry_after',
+    'upload_data', 'load_state', 'save_state', 'delete_state', 'load_asset', 'has_changed',
+    'save_raw_json', 'load_raw_json', 'save_raw_delta', 'clear_raw_deltas',
+    'open_raw_dataset', 'iter_raw_rows', 'open_raw_batches', 'remove_raw_layouts',
+    'save_raw_file', 'load_raw_file', 'raw_writer',
+    'raw_segment_writer', 'has_raw_segments', 'join_raw_segments', 'clear_raw_segments',
     'save_raw_parquet', 'load_raw_parquet',
-    'validate_environment', 'get_data_dir',
+    'validate_environment', 'get_data_dir', 'is_cloud_mode',
     'publish',
     'validate',
 ]
\ No newline at end of file
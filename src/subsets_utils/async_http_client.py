@@ -0,0 +1,132 @@
+"""Async counterpart of http_client, built on httpx.AsyncClient.
+
+Used by ingest code that fetches many resources concurrently from one event
+loop. Configuration, caching and request logging mirror http_client.
+"""
+
+import asyncio
+import time
+import httpx
+from typing import Optional
+from . import debug
+from .connection_pool import PoolStats, pool_options
+from .http_client import (
+    SINGLE_FLIGHT_METHODS, _client_config, _single_flight, CacheManager, conditional_kwargs, get_cache_manager,
+    request_key,
+)
+
+_async_client: Optional[httpx.AsyncClient] = None
+_cache: Optional[CacheManager] = None
+_pool_stats = PoolStats("async")
+
+
+def _create_base_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=_client_config['timeout'],
+        headers=_client_config['headers'],
+        follow_redirects=True,
+        event_hooks={'request': [_pool_stats.on_request_async]},
+        **pool_options(_client_config)
+    )
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get or create the shared AsyncClient (closed again by aclose())."""
+    global _async_client, _cache
+
+    if _async_client is None:
+        _async_client = _create_base_client()
+        if _client_config['cache_enabled']:
+            _cache = get_cache_manager()
+
+    return _async_client
+
+
+async def _request(method: str, url: str, **kwargs) -> httpx.Response:
+    client = get_async_client()
+
+    if _cache is None:
+        return await client.request(method, url, **kwargs)
+
+    cached_response, validators = _cache.lookup(method, url, **kwargs)
+    if cached_response:
+        return cached_response
+
+    lock = _cache.fetch_lock(method, url, **kwargs)
+    if lock is None:
+        return await _fetch(client, method, url, validators, **kwargs)
+    try:
+        # Waiting on the lock file blocks, so off the event loop
+        if await asyncio.to_thread(lock.acquire):
+            # Another process was fetching this: it is likely cached by now
+            cached_response, validators = _cache.lookup(method, url, **kwargs)
+            if cached_response:
+                return cached_response
+        return await _fetch(client, method, url, validators, **kwargs)
+    finally:
+        lock.release()
+
+
+async def _fetch(client: httpx.AsyncClient, method: str, url: str, validators: dict, **kwargs) -> httpx.Response:
+    if validators:
+        response = await client.request(method, url, **conditional_kwargs(kwargs, validators))
+        if response.status_code == 304:
+            cached_response = _cache.revalidated(method, url, response, **kwargs)
+            if cached_response:
+                return cached_response
+            # Evicted since the lookup: fetch the body after all
+            response = await client.request(method, url, **kwargs)
+    else:
+        response = await client.request(method, url, **kwargs)
+
+    if response.status_code < 300:
+        _cache.save(method, url, response, **kwargs)
+
+    return response
+
+
+async def _logged_request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Execute async HTTP request with logging if ENABLE_LOGGING is set."""
+    start = time.time()
+    error = None
+    status = None
+
+    try:
+        if _client_config['single_flight'] and method.upper() in SINGLE_FLIGHT_METHODS:
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+            response = await _single_flight.ado(key, lambda: _request(method, url, **kwargs))
+        else:
+            response = await _request(method, url, **kwargs)
+        status = response.status_code
+        return response
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        duration_ms = int((time.time() - start) * 1000)
+        debug.log_http_request(method, url, status, duration_ms=duration_ms, error=error)
+
+
+async def aget(url: str, **kwargs) -> httpx.Response:
+    return await _logged_request("GET", url, **kwargs)
+
+
+async def apost(url: str, **kwargs) -> httpx.Response:
+    return await _logged_request("POST", url, **kwargs)
+
+
+async def aput(url: str, **kwargs) -> httpx.Response:
+    return await _logged_request("PUT", url, **kwargs)
+
+
+async def adelete(url: str, **kwargs) -> httpx.Response:
+    return await _logged_request("DELETE", url, **kwargs)
+
+
+async def aclose():
+    """Close the AsyncClient. Call before the event loop shuts down."""
+    global _async_client, _cache
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        _cache = None
@@ -0,0 +1,107 @@
+"""Connection pool settings and statistics for the shared HTTP clients.
+
+pool_options() turns the http_client configuration into httpx pool limits,
+keep-alive expiry and HTTP/2 (via h2, installed with httpx[http2]).
+Each request to the same host then reuses a pooled connection, or with
+HTTP/2 shares one multiplexed connection, instead of paying a TCP and TLS
+handshake each time.
+
+PoolStats follows every request through httpcore's trace extension to count
+new versus reused connections, handshake time and time spent waiting for a
+free connection, and writes the totals to the debug logs at exit.
+"""
+
+import atexit
+import threading
+import time
+
+import httpx
+
+from . import debug
+
+try:
+    import h2
+except ImportError:  # installed with httpx[http2]; without it clients stay on HTTP/1.1
+    h2 = None
+
+
+def pool_options(config: dict) -> dict:
+    """httpx client kwargs for the pool: limits, keep-alive expiry and HTTP/2."""
+    return {
+        "limits": httpx.Limits(
+            max_connections=config['max_connections'],
+            max_keepalive_connections=config['max_keepalive_connections'],
+            keepalive_expiry=config['keepalive_expiry'],
+        ),
+        "http2": config['http2'] and h2 is not None,
+    }
+
+
+class PoolStats:
+    """Per-process connection counters for one client, fed by request event hooks."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "http2_requests": 0,
+            "connections_opened": 0,
+            "connections_reused": 0,
+            "connect_ms": 0.0,
+            "wait_ms": 0.0,
+        }
+        atexit.register(self.log_stats)
+
+    def _record(self, opened: bool, http2: bool, connect_seconds: float, wait_seconds: float):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["http2_requests"] += http2
+            self._stats["connections_opened" if opened else "connections_reused"] += 1
+            self._stats["connect_ms"] += connect_seconds * 1000
+            self._stats["wait_ms"] += max(0.0, wait_seconds) * 1000
+
+    def _tracer(self):
+        started = time.perf_counter()
+        state = {"opened": False, "connect": 0.0, "since": None, "sent": False}
+
+        def trace(name: str, info: dict):
+            now = time.perf_counter()
+            if name in ("connection.connect_tcp.started", "connection.start_tls.started"):
+                state["opened"] = True
+                state["since"] = now
+            elif name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                state["connect"] += now - state["since"]
+            elif name.endswith(".send_request_headers.started") and not state["sent"]:
+                # Time before the request goes out, less handshakes, is time queued for a connection
+                state["sent"] = True
+                self._record(state["opened"], name.startswith("http2."), state["connect"],
+                             now - started - state["connect"])
+
+        return trace
+
+    def on_request(self, request: httpx.Request):
+        """Request event hook for httpx.Client."""
+        request.extensions["trace"] = self._tracer()
+
+    async def on_request_async(self, request: httpx.Request):
+        """Request event hook for httpx.AsyncClient."""
+        trace = self._tracer()
+
+        async def atrace(name: str, info: dict):
+            trace(name, info)
+
+        request.extensions["trace"] = atrace
+
+    def stats(self) -> dict:
+        """Counters for this process: requests, connections opened/reused, handshake and wait time."""
+        with self._lock:
+            return {**self._stats,
+                    "connect_ms": round(self._stats["connect_ms"], 1),
+                    "wait_ms": round(self._stats["wait_ms"], 1)}
+
+    def log_stats(self):
+        """Write this process's counters to the debug connection pool log."""
+        stats = self.stats()
+        if stats["requests"]:
+            debug.log_http_pool(self.name, **stats)
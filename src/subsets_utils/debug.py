@@ -1,5 +1,7 @@
 import os
 import csv
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 
@@ -8,6 +10,20 @@ from .r2 import is_cloud_mode
 _log_dir = None
 _run_timestamp = None
 
+# (attempt number, ms spent backing off so far) for requests made under a
+# retry policy; context-local, so concurrent threads and tasks don't mix
+_http_attempt = ContextVar('http_attempt', default=(1, 0))
+
+
+@contextmanager
+def http_attempt(attempt: int, retry_wait_ms: int):
+    """Tag HTTP requests logged inside the block as retry `attempt`."""
+    token = _http_attempt.set((attempt, retry_wait_ms))
+    try:
+        yield
+    finally:
+        _http_attempt.reset(token)
+
 
 def _get_run_timestamp() -> str:
     global _run_timestamp
@@ -53,6 +69,7 @@ def _append_csv(filename: str, row: dict, fieldnames: list):
 
 
 def log_http_request(method, url, status_code, duration_ms=None, error=None, **kwargs):
+    attempt, retry_wait_ms = _http_attempt.get()
     _append_csv("http_requests.csv", {
         "timestamp": datetime.now().isoformat(),
         "run_id": os.environ.get('RUN_ID', 'unknown'),
@@ -60,8 +77,90 @@ def log_http_request(method, url, status_code, duration_ms=None, error=None, **k
         "url": url,
         "status": status_code,
         "duration_ms": duration_ms,
+        "attempt": attempt,
+        "retry_wait_ms": retry_wait_ms,
         "error": error or ""
-    }, ["timestamp", "run_id", "method", "url", "status", "duration_ms", "error"])
+    }, ["timestamp", "run_id", "method", "url", "status", "duration_ms", "attempt", "retry_wait_ms", "error"])
+
+
+def log_rate_limit(limiter, requests, throttled, throttled_seconds, penalties, penalty_seconds, **kwargs):
+    _append_csv("rate_limits.csv", {
+        "timestamp": datetime.now().isoformat(),
+        "run_id": os.environ.get('RUN_ID', 'unknown'),
+        "pid": os.getpid(),
+        "limiter": limiter,
+        "requests": requests,
+        "throttled": throttled,
+        "throttled_seconds": throttled_seconds,
+        "penalties": penalties,
+        "penalty_seconds": penalty_seconds
+    }, ["timestamp", "run_id", "pid", "limiter", "requests", "throttled", "throttled_seconds",
+        "penalties", "penalty_seconds"])
+
+
+def log_http_cache(cache_dir, hits, misses, expired, revalidated, stores, evictions, bytes_served, bytes_stored,
+                   bytes_evicted, size_bytes, **kwargs):
+    _append_csv("http_cache.csv", {
+        "timestamp": datetime.now().isoformat(),
+        "run_id": os.environ.get('RUN_ID', 'unknown'),
+        "pid": os.getpid(),
+        "cache_dir": cache_dir,
+        "hits": hits,
+        "misses": misses,
+        "expired": expired,
+        "revalidated": revalidated,
+        "stores": stores,
+        "evictions": evictions,
+        "bytes_served": bytes_served,
+        "bytes_stored": bytes_stored,
+        "bytes_evicted": bytes_evicted,
+        "size_bytes": size_bytes
+    }, ["timestamp", "run_id", "pid", "cache_dir", "hits", "misses", "expired", "revalidated", "stores", "evictions",
+        "bytes_served", "bytes_stored", "bytes_evicted", "size_bytes"])
+
+
+def log_http_pool(client, requests, http2_requests, connections_opened, connections_reused, connect_ms, wait_ms,
+                  **kwargs):
+    _append_csv("http_pool.csv", {
+        "timestamp": datetime.now().isoformat(),
+        "run_id": os.environ.get('RUN_ID', 'unknown'),
+        "pid": os.getpid(),
+        "client": client,
+        "requests": requests,
+        "http2_requests": http2_requests,
+        "connections_opened": connections_opened,
+        "connections_reused": connections_reused,
+        "connect_ms": connect_ms,
+        "wait_ms": wait_ms
+    }, ["timestamp", "run_id", "pid", "client", "requests", "http2_requests", "connections_opened",
+        "connections_reused", "connect_ms", "wait_ms"])
+
+
+def log_r2_upload(key, method, bytes, seconds, mb_per_s, parts=None, **kwargs):
+    _append_csv("r2_uploads.csv", {
+        "timestamp": datetime.now().isoformat(),
+        "run_id": os.environ.get('RUN_ID', 'unknown'),
+        "key": key,
+        "method": method,
+        "bytes": bytes,
+        "seconds": seconds,
+        "mb_per_s": mb_per_s,
+        "parts": parts
+    }, ["timestamp", "run_id", "key", "method", "bytes", "seconds", "mb_per_s", "parts"])
+
+
+def log_schedule(dataset, score, est_seconds, basis, worker=None, position=None, deferred=False, **kwargs):
+    _append_csv("schedule.csv", {
+        "timestamp": datetime.now().isoformat(),
+        "run_id": os.environ.get('RUN_ID', 'unknown'),
+        "dataset": dataset,
+        "score": score,
+        "est_seconds": est_seconds,
+        "basis": basis,
+        "worker": "" if worker is None else worker,
+        "position": "" if position is None else position,
+        "deferred": deferred
+    }, ["timestamp", "run_id", "dataset", "score", "est_seconds", "basis", "worker", "position", "deferred"])
 
 
 def log_data_output(dataset_name, row_count, size_bytes, columns=None, null_counts=None, **kwargs):
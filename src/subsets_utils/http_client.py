@@ -1,80 +1,533 @@
 import os
+import gzip
+import zlib
 import json
+import atexit
 import hashlib
 import httpx
 import time
+import threading
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Optional, Dict, Union
-from datetime import datetime
+from typing import Optional, Dict, Iterator, Union
+import sqlalchemy as sa
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from . import debug
+from .connection_pool import PoolStats, pool_options
+from .single_flight import FileLock, SingleFlight, fcntl
+
+try:
+    import zstandard
+except ImportError:  # a declared dependency, but cached bodies fall back to gzip without it
+    zstandard = None
 
 _client = None
+_client_lock = threading.Lock()
+_cache_manager = None
+_cache_lock = threading.Lock()
 _client_config = {
     'timeout': int(os.environ.get('HTTP_TIMEOUT', '30')),
     'cache_enabled': os.environ.get('ENABLE_HTTP_CACHE', '').lower() == 'true',
     'cache_dir': Path(os.environ.get('HTTP_CACHE_DIR', 'http_cache')),
+    # Compressed bytes kept on disk before least recently used entries go (0 = no limit)
+    'cache_max_bytes': int(os.environ.get('HTTP_CACHE_MAX_BYTES', str(2 * 1024 ** 3))),
+    # Seconds an entry is served for (0 = forever)
+    'cache_ttl': float(os.environ.get('HTTP_CACHE_TTL', '86400')),
+    # Concurrent identical GETs in this process share one request
+    'single_flight': os.environ.get('HTTP_SINGLE_FLIGHT', 'true').lower() == 'true',
+    # Cached requests also take a per-key lock file, so processes sharing the cache fetch a key once
+    'cache_lock_files': os.environ.get('HTTP_CACHE_LOCK_FILES', '').lower() == 'true',
+    # Connection pool per client; HTTP/2 needs h2, installed with httpx[http2]
+    'http2': os.environ.get('HTTP2', 'true').lower() == 'true',
+    'max_connections': int(os.environ.get('HTTP_MAX_CONNECTIONS', '20')),
+    'max_keepalive_connections': int(os.environ.get('HTTP_MAX_KEEPALIVE', '10')),
+    'keepalive_expiry': float(os.environ.get('HTTP_KEEPALIVE_EXPIRY', '30')),
     'headers': {'User-Agent': os.environ.get('HTTP_USER_AGENT', 'DataIntegrations/1.0')}
 }
 
+# Request headers that select a different response body, so are part of the cache key
+VARY_HEADERS = ("accept", "accept-encoding", "accept-language", "range")
+
+# Requests safe to share between concurrent callers
+SINGLE_FLIGHT_METHODS = ("GET", "HEAD")
+
+_single_flight = SingleFlight()
+_pool_stats = PoolStats("sync")
+
+
+def request_key(method: str, url: str, params: Optional[Dict] = None, headers=None) -> str:
+    """Key identifying a request's response: method, URL, params and the VARY_HEADERS."""
+    vary = {}
+    if headers:
+        vary = {name.lower(): value for name, value in dict(headers).items() if name.lower() in VARY_HEADERS}
+    key_parts = [method.upper(), url, sorted(dict(params or {}).items()), sorted(vary.items())]
+    return hashlib.sha256(json.dumps(key_parts, default=str).encode()).hexdigest()
+
+_cache_entries = sa.Table(
+    "entries", sa.MetaData(),
+    sa.Column("key", sa.String, primary_key=True),
+    sa.Column("method", sa.String, nullable=False),
+    sa.Column("url", sa.String, nullable=False),
+    sa.Column("status_code", sa.Integer, nullable=False),
+    sa.Column("headers", sa.Text, nullable=False),  # JSON object
+    sa.Column("etag", sa.String),
+    sa.Column("last_modified", sa.String),
+    sa.Column("encoding", sa.String),
+    sa.Column("size", sa.Integer),  # body bytes as served; unknown for bodies stored as sent
+    sa.Column("stored_bytes", sa.Integer, nullable=False),  # compressed body bytes on disk
+    sa.Column("cached_at", sa.Float, nullable=False),
+    sa.Column("expires_at", sa.Float),
+    sa.Column("last_used", sa.Float, nullable=False, index=True),
+    sa.Column("hits", sa.Integer, nullable=False, default=0),
+)
+
+
+def _create_index_engine(path: Path):
+    engine = sa.create_engine(f"sqlite:///{path}", connect_args={"timeout": 60, "check_same_thread": False})
+
+    @sa.event.listens_for(engine, "connect")
+    def _configure(dbapi_connection, connection_record):
+        # WAL lets readers in other processes carry on while one process writes
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    return engine
+
+
+def _compressor():
+    """Incremental compressor for cached bodies and its encoding: zstd, or gzip if zstandard is missing."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compressobj(), "zstd"
+    return zlib.compressobj(6, zlib.DEFLATED, 31), "gzip"  # wbits 31: gzip container
+
+
+def _open_body(f, encoding: Optional[str]):
+    """Decompressing reader over a stored body file."""
+    if encoding == "zstd":
+        return zstandard.ZstdDecompressor().stream_reader(f, read_across_frames=True)
+    if encoding == "gzip":
+        return gzip.GzipFile(fileobj=f, mode='rb')
+    return f
+
+
+class _CachedBodyStream(httpx.SyncByteStream):
+    """Body of a cache hit, decompressed from its file as it is read."""
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, f, encoding: Optional[str], on_read):
+        self._file = f
+        self._reader = _open_body(f, encoding)
+        self._on_read = on_read
+
+    def __iter__(self) -> Iterator[bytes]:
+        while chunk := self._reader.read(self.CHUNK_SIZE):
+            self._on_read(len(chunk))
+            yield chunk
+
+    def close(self):
+        self._reader.close()
+        self._file.close()
+
+
+class _TeeStream(httpx.SyncByteStream):
+    """A response's raw body, copied into a cache writer as the caller reads it.
+
+    The entry is committed once the body has been read to the end, and
+    discarded if the response is closed (or fails) before that. Callers
+    often stop just short of the end (a JSON decoder returns at the closing
+    bracket), so finish() reads a small remainder itself before committing.
+    """
+
+    # Unread bytes finish() will still fetch to complete an entry
+    DRAIN_LIMIT = 64 * 1024
+
+    def __init__(self, stream: httpx.SyncByteStream, writer: "CacheWriter"):
+        self._stream = stream
+        self._writer = writer
+        self._chunks = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        # One iterator over the body, shared with finish()
+        if self._chunks is None:
+            self._chunks = iter(self._stream)
+        for chunk in self._chunks:
+            self._writer.write(chunk)
+            yield chunk
+        self._writer.commit()
+
+    def finish(self):
+        """Commit the entry once the caller is done, reading up to DRAIN_LIMIT unread bytes first.
+
+        A larger remainder means the body was abandoned: it is discarded.
+        """
+        if self._writer.closed:
+            return
+        if self._chunks is None:
+            self._chunks = iter(self._stream)
+        drained = 0
+        for chunk in self._chunks:
+            drained += len(chunk)
+            if drained > self.DRAIN_LIMIT:
+                self._writer.discard()
+                return
+            self._writer.write(chunk)
+        self._writer.commit()
+
+    def close(self):
+        self._writer.discard()
+        self._stream.close()
+
+
+class CacheWriter:
+    """One response body on its way into the cache.
+
+    The body goes to a temporary file next to its final path, compressed
+    as it is written unless it arrived gzip (or zstd) encoded, in which case
+    the bytes are kept as sent. commit() renames it into place and indexes
+    it; discard() drops it. Both are no-ops once either has run.
+    """
+
+    def __init__(self, cache: "CacheManager", key: str, row: dict, encoding: Optional[str] = None):
+        self._cache = cache
+        self._row = row
+        self._passthrough = encoding is not None
+        if self._passthrough:
+            self._compressor, self._encoding = None, encoding
+        else:
+            self._compressor, self._encoding = _compressor()
+        self._path = cache._body_path(key)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self._path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        self._file = open(self._tmp, 'wb')
+        self._size = 0
+        self.closed = False
+
+    def write(self, chunk: bytes):
+        self._size += len(chunk)
+        self._file.write(self._compressor.compress(chunk) if self._compressor else chunk)
+
+    def commit(self):
+        if self.closed:
+            return
+        if self._compressor:
+            self._file.write(self._compressor.flush())
+        stored_bytes = self._file.tell()
+        self._file.close()
+        self.closed = True
+        os.replace(self._tmp, self._path)
+        self._cache._index({
+            **self._row,
+            "encoding": self._encoding,
+            "size": None if self._passthrough else self._size,
+            "stored_bytes": stored_bytes,
+        })
+
+    def discard(self):
+        if self.closed:
+            return
+        self._file.close()
+        self.closed = True
+        try:
+            os.unlink(self._tmp)
+        except FileNotFoundError:
+            pass
+
+
 class CacheManager:
-    def __init__(self, cache_dir: Path):
-        self.cache_dir = cache_dir
+    """On-disk response cache with compressed bodies, a byte budget and a TTL.
+
+    The index (key, url, status, headers, validators, sizes, timestamps, hit
+    count) is one SQLite database, cache.db; bodies are compressed files
+    (zstd, or gzip without zstandard, or as sent if they arrived gzip-encoded)
+    sharded as bodies/{key[:2]}/{key}. A body
+    is written under a temporary name and renamed into place before its
+    index row is committed, so any process sharing the directory sees whole
+    entries only.
+
+    Expired entries are misses. Once the bodies exceed `max_bytes`, the least
+    recently used entries go. Responses carrying an ETag or Last-Modified are
+    revalidated with a conditional request instead of being served from disk
+    unchecked; on a 304 the stored body is served and only headers cross the
+    network.
+    """
+
+    # Eviction frees space down to this fraction of the budget, so it doesn't run on every save
+    EVICT_TO = 0.9
+
+    def __init__(self, cache_dir: Path, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True, parents=True)
-        
-    def _cache_key(self, method: str, url: str, params: Optional[Dict] = None) -> str:
-        key_parts = [method, url]
-        if params:
-            key_parts.append(json.dumps(sorted(params.items())))
-        return hashlib.md5("".join(key_parts).encode()).hexdigest()
-    
+        self.max_bytes = _client_config['cache_max_bytes'] if max_bytes is None else max_bytes
+        self.ttl = _client_config['cache_ttl'] if ttl is None else ttl
+        self._engine = _create_index_engine(self.cache_dir / "cache.db")
+        with self._engine.begin() as conn:
+            # IF NOT EXISTS: processes sharing the directory may race to create it
+            conn.execute(sa.schema.CreateTable(_cache_entries, if_not_exists=True))
+            for index in _cache_entries.indexes:
+                conn.execute(sa.schema.CreateIndex(index, if_not_exists=True))
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bytes_served": 0,
+            "bytes_stored": 0,
+            "bytes_evicted": 0,
+        }
+        atexit.register(self.log_stats)
+
+    def _cache_key(self, method: str, url: str, params: Optional[Dict] = None, headers=None) -> str:
+        return request_key(method, url, params, headers)
+
+    def fetch_lock(self, method: str, url: str, **kwargs) -> Optional[FileLock]:
+        """Cross-process lock for fetching a key, if lock files are enabled (and supported)."""
+        if not _client_config['cache_lock_files'] or fcntl is None:
+            return None
+        lock_dir = self.cache_dir / "locks"
+        lock_dir.mkdir(exist_ok=True)
+        key = self._cache_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        return FileLock(lock_dir / f"{key}.lock")
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / "bodies" / key[:2] / key
+
+    def _count(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                self._stats[name] += value
+
+    def _delete(self, conn, keys: list):
+        """Drop entries from the index and their bodies from disk."""
+        if not keys:
+            return
+        conn.execute(sa.delete(_cache_entries).where(_cache_entries.c.key.in_(keys)))
+        for key in keys:
+            try:
+                self._body_path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _response(self, method: str, url: str, entry, body, streaming: bool = False) -> httpx.Response:
+        # Get headers and remove encoding-related ones since content is raw
+        headers = json.loads(entry.headers)
+        headers.pop("content-encoding", None)
+        headers.pop("transfer-encoding", None)
+        headers.pop("content-length", None)
+
+        response = httpx.Response(
+            status_code=entry.status_code,
+            headers=headers,
+            stream=_CachedBodyStream(body, entry.encoding, lambda n: self._count(bytes_served=n)),
+            request=httpx.Request(method, url)
+        )
+        if not streaming:
+            response.read()
+        return response
+
+    def _read(self, key: str):
+        """Index row and open body file of an entry, or None (a body evicted by another process counts as gone)."""
+        with self._engine.begin() as conn:
+            entry = conn.execute(sa.select(_cache_entries).where(_cache_entries.c.key == key)).first()
+            if entry is None:
+                return None
+            try:
+                body = open(self._body_path(key), 'rb')
+            except FileNotFoundError:
+                self._delete(conn, [key])
+                return None
+        return entry, body
+
+    def lookup(self, method: str, url: str, streaming: bool = False, **kwargs) -> tuple[Optional[httpx.Response], dict]:
+        """Cached response, or the conditional request headers to revalidate the entry with.
+
+        Entries with an ETag or Last-Modified validator are always
+        revalidated, so they are never served stale; entries without one are
+        served until they expire. With `streaming`, the response body is
+        read from its file as the caller iterates, and must be closed.
+        """
+        key = self._cache_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        found = self._read(key)
+        if found is None:
+            self._count(misses=1)
+            return None, {}
+        entry, body = found
+
+        validators = {}
+        if entry.etag:
+            validators["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            validators["If-Modified-Since"] = entry.last_modified
+        if validators:
+            body.close()
+            self._count(misses=1)
+            return None, validators
+
+        now = time.time()
+        if entry.expires_at and entry.expires_at < now:
+            body.close()
+            with self._engine.begin() as conn:
+                self._delete(conn, [key])
+            self._count(misses=1, expired=1)
+            return None, {}
+
+        with self._engine.begin() as conn:
+            conn.execute(sa.update(_cache_entries).where(_cache_entries.c.key == key)
+                         .values(last_used=now, hits=_cache_entries.c.hits + 1))
+        self._count(hits=1)
+        return self._response(method, url, entry, body, streaming), {}
+
     def get(self, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
-        key = self._cache_key(method, url, kwargs.get("params"))
-        metadata_file = self.cache_dir / f"{key}.meta.json"
-        content_file = self.cache_dir / f"{key}.bin"
-        
-        if metadata_file.exists() and content_file.exists():
-            # Load metadata
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
-            # Load raw content bytes
-            with open(content_file, 'rb') as f:
-                content = f.read()
-            
-            # Get headers and remove encoding-related ones since content is raw
-            headers = metadata.get("headers", {})
-            headers.pop("content-encoding", None)
-            headers.pop("transfer-encoding", None)
-
-            return httpx.Response(
-                status_code=metadata["status_code"],
-                headers=headers,
-                content=content,
-                request=httpx.Request(method, url)
-            )
-        
-        return None
-    
-    def save(self, method: str, url: str, response: httpx.Response, **kwargs):
-        key = self._cache_key(method, url, kwargs.get("params"))
-        metadata_file = self.cache_dir / f"{key}.meta.json"
-        content_file = self.cache_dir / f"{key}.bin"
-        
-        # Save raw content bytes
-        with open(content_file, 'wb') as f:
-            f.write(response.content)
-        
-        # Save metadata
-        metadata = {
-            "status_code": response.status_code,
-            "headers": dict(response.headers),
-            "url": url,
+        return self.lookup(method, url, **kwargs)[0]
+
+    def revalidated(self, method: str, url: str, response: httpx.Response, streaming: bool = False,
+                    **kwargs) -> Optional[httpx.Response]:
+        """Cached response for a 304 Not Modified, with its headers and expiry refreshed.
+
+        Returns None if the entry was evicted meanwhile.
+        """
+        key = self._cache_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        found = self._read(key)
+        if found is None:
+            return None
+        entry, body = found
+
+        # A 304 carries the current validators and caching headers, never a body
+        headers = json.loads(entry.headers)
+        for name, value in response.headers.items():
+            if name not in ("content-length", "content-encoding", "transfer-encoding"):
+                headers[name] = value
+        now = time.time()
+        with self._engine.begin() as conn:
+            conn.execute(sa.update(_cache_entries).where(_cache_entries.c.key == key).values(
+                headers=json.dumps(headers),
+                expires_at=now + self.ttl if self.ttl else None,
+                last_used=now,
+                hits=_cache_entries.c.hits + 1,
+                **self._validators(response),
+            ))
+            entry = conn.execute(sa.select(_cache_entries).where(_cache_entries.c.key == key)).first()
+
+        self._count(revalidated=1)
+        return self._response(method, url, entry, body, streaming)
+
+    @staticmethod
+    def _validators(response: httpx.Response) -> dict:
+        return {"etag": response.headers.get("etag"), "last_modified": response.headers.get("last-modified")}
+
+    def writer(self, method: str, url: str, response: httpx.Response, raw: bool = False,
+               **kwargs) -> Optional[CacheWriter]:
+        """Writer for a response body, fed either decoded content or, with `raw`, the bytes as sent.
+
+        Raw bodies in a content encoding the cache can't read back (e.g.
+        br, deflate) aren't cached: returns None.
+        """
+        key = self._cache_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+        encoding = None
+        if raw:
+            content_encoding = response.headers.get("content-encoding", "identity").lower()
+            if content_encoding == "gzip" or (content_encoding == "zstd" and zstandard is not None):
+                encoding = content_encoding
+            elif content_encoding != "identity":
+                return None
+
+        row = {
+            "key": key,
             "method": method,
-            "cached_at": datetime.now().isoformat()
+            "url": url,
+            "status_code": response.status_code,
+            "headers": json.dumps(dict(response.headers)),
+            **self._validators(response),
         }
-        
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        return CacheWriter(self, key, row, encoding)
+
+    def save(self, method: str, url: str, response: httpx.Response, **kwargs):
+        writer = self.writer(method, url, response, **kwargs)
+        writer.write(response.content)
+        writer.commit()
+
+    def _index(self, row: dict):
+        """Add or replace an entry's index row; its body is already in place."""
+        now = time.time()
+        row = {**row, "cached_at": now, "expires_at": now + self.ttl if self.ttl else None,
+               "last_used": now, "hits": 0}
+        statement = sqlite_insert(_cache_entries).values(**row)
+        with self._engine.begin() as conn:
+            conn.execute(statement.on_conflict_do_update(
+                index_elements=["key"], set_={name: statement.excluded[name] for name in row if name != "key"}))
+
+        self._count(stores=1, bytes_stored=row["stored_bytes"])
+        if self.max_bytes and self.size() > self.max_bytes:
+            self.prune()
+
+    def size(self) -> int:
+        """Compressed body bytes on disk."""
+        with self._engine.connect() as conn:
+            return conn.execute(sa.select(sa.func.coalesce(sa.func.sum(_cache_entries.c.stored_bytes), 0))).scalar()
+
+    def prune(self):
+        """Drop expired entries without validators, then least recently used ones until under budget."""
+        now = time.time()
+        with self._engine.begin() as conn:
+            expired = conn.execute(sa.select(_cache_entries.c.key, _cache_entries.c.stored_bytes).where(
+                _cache_entries.c.expires_at < now,
+                _cache_entries.c.etag.is_(None),
+                _cache_entries.c.last_modified.is_(None),
+            )).all()
+
+            target = self.max_bytes * self.EVICT_TO if self.max_bytes else None
+            size = conn.execute(sa.select(sa.func.coalesce(sa.func.sum(_cache_entries.c.stored_bytes), 0))).scalar()
+            size -= sum(stored for _, stored in expired)
+            evicted = []
+            if target is not None and size > target:
+                expired_keys = {key for key, _ in expired}
+                for key, stored in conn.execute(sa.select(_cache_entries.c.key, _cache_entries.c.stored_bytes)
+                                                .order_by(_cache_entries.c.last_used)):
+                    if size <= target:
+                        break
+                    if key in expired_keys:
+                        continue
+                    evicted.append((key, stored))
+                    size -= stored
+
+            self._delete(conn, [key for key, _ in expired + evicted])
+
+        with self._lock:
+            self._stats["evictions"] += len(evicted)
+            self._stats["bytes_evicted"] += sum(stored for _, stored in evicted)
+
+    def stats(self) -> dict:
+        """Counters for this process: hits, misses, stores, evictions and bytes."""
+        size = self.size()
+        with self._lock:
+            return {**self._stats, "size_bytes": size}
+
+    def log_stats(self):
+        """Write this process's counters to the debug HTTP cache log."""
+        with self._lock:
+            used = self._stats["hits"] or self._stats["misses"]
+        if used:
+            debug.log_http_cache(str(self.cache_dir), **self.stats())
+
+
+def get_cache_manager(cache_dir: Optional[Path] = None) -> CacheManager:
+    """Shared response cache for the sync and async clients."""
+    global _cache_manager
+    cache_dir = Path(cache_dir or _client_config['cache_dir'])
+    with _cache_lock:
+        if _cache_manager is None or _cache_manager.cache_dir != cache_dir:
+            _cache_manager = CacheManager(cache_dir)
+    return _cache_manager
+
+
+def conditional_kwargs(kwargs: dict, validators: dict) -> dict:
+    """Request kwargs with the If-None-Match / If-Modified-Since headers added."""
+    return {**kwargs, "headers": {**dict(kwargs.get("headers") or {}), **validators}}
 
 
 class CachedClient:
@@ -83,18 +536,101 @@ class CachedClient:
         self.cache = cache_manager
         
     def request(self, method: str, url: str, **kwargs) -> httpx.Response:
-        if _client_config['cache_enabled']:
-            cached_response = self.cache.get(method, url, **kwargs)
-            if cached_response:
-                return cached_response
+        if not _client_config['cache_enabled']:
+            return self.client.request(method, url, **kwargs)
+
+        cached_response, validators = self.cache.lookup(method, url, **kwargs)
+        if cached_response:
+            return cached_response
 
-        response = self.client.request(method, url, **kwargs)
+        lock = self.cache.fetch_lock(method, url, **kwargs)
+        if lock is None:
+            return self._fetch(method, url, validators, **kwargs)
+        try:
+            if lock.acquire():
+                # Another process was fetching this: it is likely cached by now
+                cached_response, validators = self.cache.lookup(method, url, **kwargs)
+                if cached_response:
+                    return cached_response
+            return self._fetch(method, url, validators, **kwargs)
+        finally:
+            lock.release()
+
+    def _fetch(self, method: str, url: str, validators: dict, **kwargs) -> httpx.Response:
+        if validators:
+            response = self.client.request(method, url, **conditional_kwargs(kwargs, validators))
+            if response.status_code == 304:
+                cached_response = self.cache.revalidated(method, url, response, **kwargs)
+                if cached_response:
+                    return cached_response
+                # Evicted since the lookup: fetch the body after all
+                response = self.client.request(method, url, **kwargs)
+        else:
+            response = self.client.request(method, url, **kwargs)
 
-        if _client_config['cache_enabled'] and response.status_code < 400:
+        if response.status_code < 300:
             self.cache.save(method, url, response, **kwargs)
 
         return response
     
+    @contextmanager
+    def stream(self, method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+        """Stream a response through the cache without buffering it.
+
+        A hit streams the stored body from its file. A miss is copied into
+        the cache as the caller reads it and kept if the block exits without
+        an error, with at most _TeeStream.DRAIN_LIMIT bytes left unread.
+        A body can't be shared while it streams, so concurrent fetches of
+        the same key (threads, and processes with lock files) wait for the
+        one in flight to finish and then stream its cached copy.
+        """
+        if not _client_config['cache_enabled']:
+            with self.client.stream(method, url, **kwargs) as response:
+                yield response
+            return
+
+        cached_response, validators = self.cache.lookup(method, url, streaming=True, **kwargs)
+        tee = None
+        with ExitStack() as stack:
+            if cached_response is None and self._hold(stack, method, url, **kwargs):
+                # Another fetch of this key just finished: it is likely cached by now
+                cached_response, validators = self.cache.lookup(method, url, streaming=True, **kwargs)
+
+            if cached_response is None:
+                request_kwargs = conditional_kwargs(kwargs, validators) if validators else kwargs
+                response = stack.enter_context(self.client.stream(method, url, **request_kwargs))
+                if validators and response.status_code == 304:
+                    cached_response = self.cache.revalidated(method, url, response, streaming=True, **kwargs)
+                    if cached_response is None:
+                        # Evicted since the lookup: fetch the body after all
+                        response.close()
+                        response = stack.enter_context(self.client.stream(method, url, **kwargs))
+
+            if cached_response is not None:
+                stack.callback(cached_response.close)
+                response = cached_response
+            elif response.status_code < 300:
+                writer = self.cache.writer(method, url, response, raw=True, **kwargs)
+                if writer is not None:
+                    tee = response.stream = _TeeStream(response.stream, writer)
+                    stack.callback(writer.discard)
+
+            yield response
+            if tee is not None:
+                tee.finish()
+
+    def _hold(self, stack: ExitStack, method: str, url: str, **kwargs) -> bool:
+        """Hold a key against concurrent fetches until `stack` closes; True if one held it first."""
+        waited = False
+        if _client_config['single_flight'] and method.upper() in SINGLE_FLIGHT_METHODS:
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+            waited = stack.enter_context(_single_flight.hold(key))
+        lock = self.cache.fetch_lock(method, url, **kwargs)
+        if lock is not None:
+            waited = lock.acquire() or waited
+            stack.callback(lock.release)
+        return waited
+
     def get(self, url: str, **kwargs) -> httpx.Response:
         return self.request("GET", url, **kwargs)
     
@@ -114,23 +650,26 @@ def _create_base_client() -> httpx.Client:
     return httpx.Client(
         timeout=_client_config['timeout'],
         headers=_client_config['headers'],
-        follow_redirects=True
+        follow_redirects=True,
+        event_hooks={'request': [_pool_stats.on_request]},
+        **pool_options(_client_config)
     )
 
 def _get_or_create_client(**overrides) -> Union[httpx.Client, CachedClient]:
     global _client
     
-    if _client is None:
-        config = _client_config.copy()
-        config.update(overrides)
-        
-        base_client = _create_base_client()
-        
-        if config['cache_enabled']:
-            cache_manager = CacheManager(config['cache_dir'])
-            _client = CachedClient(base_client, cache_manager)
-        else:
-            _client = base_client
+    # Lock so concurrent page fetchers share a single client
+    with _client_lock:
+        if _client is None:
+            config = _client_config.copy()
+            config.update(overrides)
+
+            base_client = _create_base_client()
+
+            if config['cache_enabled']:
+                _client = CachedClient(base_client, get_cache_manager(config['cache_dir']))
+            else:
+                _client = base_client
             
     return _client
 
@@ -142,7 +681,11 @@ def _logged_request(method: str, url: str, **kwargs) -> httpx.Response:
     status = None
 
     try:
-        response = client.request(method, url, **kwargs)
+        if _client_config['single_flight'] and method.upper() in SINGLE_FLIGHT_METHODS:
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+            response = _single_flight.do(key, lambda: client.request(method, url, **kwargs))
+        else:
+            response = client.request(method, url, **kwargs)
         status = response.status_code
         return response
     except Exception as e:
@@ -153,6 +696,30 @@ def _logged_request(method: str, url: str, **kwargs) -> httpx.Response:
         debug.log_http_request(method, url, status, duration_ms=duration_ms, error=error)
 
 
+@contextmanager
+def stream(method: str, url: str, **kwargs) -> Iterator[httpx.Response]:
+    """Stream a response body without buffering it, with logging if ENABLE_LOGGING is set.
+
+    With the response cache enabled, streamed bodies are cached too (see
+    CachedClient.stream). The logged duration covers reading the whole body.
+    """
+    client = _get_or_create_client()
+    start = time.time()
+    error = None
+    status = None
+
+    try:
+        with client.stream(method, url, **kwargs) as response:
+            status = response.status_code
+            yield response
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        duration_ms = int((time.time() - start) * 1000)
+        debug.log_http_request(method, url, status, duration_ms=duration_ms, error=error)
+
+
 def get(url: str, **kwargs) -> httpx.Response:
     return _logged_request("GET", url, **kwargs)
 
@@ -172,8 +739,9 @@ def get_client(**overrides) -> Union[httpx.Client, CachedClient]:
     return _get_or_create_client(**overrides)
 
 def configure_http(**config):
-    global _client_config, _client
+    global _client_config, _client, _cache_manager
     _client_config.update(config)
+    _cache_manager = None
     if _client:
         _client.close()
         _client = None
\ No newline at end of file
@@ -1,16 +1,20 @@
 import os
 import io
+import csv
 import json
 import gzip
 import uuid
+import shutil
+from contextlib import closing, contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 import pyarrow as pa
 import pyarrow.parquet as pq
 from deltalake import write_deltalake, DeltaTable
 from . import debug
 from .environment import get_data_dir
-from .r2 import is_cloud_mode, upload_bytes, upload_file, upload_fileobj, download_bytes, get_storage_options, get_delta_table_uri, get_bucket_name, get_connector_name
+from .r2 import is_cloud_mode, upload_bytes, upload_file, upload_fileobj, download_bytes, open_object, delete_keys, list_keys, MultipartWriter, get_storage_options, get_delta_table_uri, get_bucket_name, get_connector_name
 
 
 def upload_data(data: pa.Table, dataset_name: str, metadata: dict = None, mode: str = "append", merge_key: str = None) -> str:
@@ -204,6 +208,21 @@ def save_state(asset: str, state_data: dict) -> str:
         return str(state_file)
 
 
+def delete_state(asset: str) -> None:
+    """Delete the state for an asset (e.g., a finished checkpoint manifest).
+
+    In local mode: removes DATA_DIR/state/{asset}.json
+    In cloud mode: deletes R2 {connector}/data/state/{asset}.json
+    """
+    if is_cloud_mode():
+        connector = get_connector_name()
+        delete_keys([f"{connector}/data/state/{asset}.json"])
+    else:
+        state_file = Path(get_data_dir()) / "state" / f"{asset}.json"
+        if state_file.exists():
+            state_file.unlink()
+
+
 def has_changed(new_data: pa.Table, asset_name: str) -> bool:
     """Check if new data differs from the existing asset.
 
@@ -374,6 +393,118 @@ def load_raw_file(asset_id: str, extension: str = "txt") -> str | bytes:
                 return f.read()
 
 
+@contextmanager
+def raw_writer(asset_id: str, extension: str):
+    """Open a binary writer for streaming a large raw file without holding it in memory.
+
+    In local mode: writes to DATA_DIR/raw/{asset_id}.{extension}.part and
+        renames it into place when the block exits without error
+    In cloud mode: streams to R2 as a multipart upload (about one part in
+        memory, no disk), completed when the block exits without error and
+        aborted otherwise
+
+    Usage:
+        with raw_writer("dataset_abcd-1234", "csv.gz") as f:
+            f.write(chunk)
+    """
+    if is_cloud_mode():
+        with MultipartWriter(_get_raw_r2_key(asset_id, extension)) as f:
+            yield f
+        print(f"  -> R2: Saved {asset_id}.{extension}")
+    else:
+        path = _get_raw_path(asset_id, extension)
+        part_path = path.with_name(path.name + ".part")
+        try:
+            with open(part_path, 'wb') as f:
+                yield f
+            os.replace(part_path, path)
+            print(f"  -> Raw Cache: Saved {asset_id}.{extension}")
+        finally:
+            if part_path.exists():
+                os.remove(part_path)
+
+
+def _raw_segment_ext(extension: str, seq: int) -> str:
+    return f"{extension}.parts/{seq:05d}"
+
+
+@contextmanager
+def raw_segment_writer(asset_id: str, extension: str, seq: int):
+    """Open a binary writer for segment `seq` of a raw file written in resumable pieces.
+
+    Each segment is committed on its own, so an interrupted writer can resume
+    after the last committed one (see has_raw_segments), and
+    join_raw_segments concatenates them into {asset_id}.{extension} once all
+    are in. A segment only appears when the block exits without error.
+
+    In local mode: writes to DATA_DIR/raw/{asset_id}.{extension}.parts/{seq}
+    In cloud mode: streams to R2 under the same key as a multipart upload
+    """
+    ext = _raw_segment_ext(extension, seq)
+    if is_cloud_mode():
+        with MultipartWriter(_get_raw_r2_key(asset_id, ext)) as f:
+            yield f
+    else:
+        path = _get_raw_path(asset_id, ext)
+        part_path = path.with_name(path.name + ".part")
+        try:
+            with open(part_path, 'wb') as f:
+                yield f
+            os.replace(part_path, path)
+        finally:
+            if part_path.exists():
+                os.remove(part_path)
+
+
+def _list_raw_segments(asset_id: str, extension: str) -> list[str]:
+    """Committed segment keys (cloud) or paths (local) of a raw file, in seq order."""
+    if is_cloud_mode():
+        return sorted(list_keys(_get_raw_r2_key(asset_id, f"{extension}.parts/")))
+    else:
+        parts_dir = Path(get_data_dir()) / "raw" / f"{asset_id}.{extension}.parts"
+        if not parts_dir.is_dir():
+            return []
+        return sorted(str(path) for path in parts_dir.iterdir() if path.suffix != ".part")
+
+
+def has_raw_segments(asset_id: str, extension: str, count: int) -> bool:
+    """True if segments 0..count-1 of a raw file are all committed."""
+    names = {os.path.basename(segment) for segment in _list_raw_segments(asset_id, extension)}
+    return all(f"{seq:05d}" in names for seq in range(count))
+
+
+def join_raw_segments(asset_id: str, extension: str, count: int) -> str:
+    """Concatenate segments 0..count-1 into {asset_id}.{extension}, then delete the segments.
+
+    Segments are copied through raw_writer in seq order, so the result is
+    the file a single writer would have produced (gzip members concatenate
+    into one valid gzip stream).
+    """
+    with raw_writer(asset_id, extension) as f:
+        for seq in range(count):
+            ext = _raw_segment_ext(extension, seq)
+            segment = _open_raw_stream(asset_id, ext)
+            if segment is None:
+                raise FileNotFoundError(f"Raw segment '{asset_id}.{ext}' not found.")
+            with closing(segment):
+                shutil.copyfileobj(segment, f)
+    clear_raw_segments(asset_id, extension)
+    return f"{asset_id}.{extension}"
+
+
+def clear_raw_segments(asset_id: str, extension: str) -> int:
+    """Delete all segments of a raw file (after joining, or to restart it). Returns count."""
+    segments = _list_raw_segments(asset_id, extension)
+    if is_cloud_mode():
+        if segments:
+            delete_keys(segments)
+    else:
+        parts_dir = Path(get_data_dir()) / "raw" / f"{asset_id}.{extension}.parts"
+        if parts_dir.is_dir():
+            shutil.rmtree(parts_dir)
+    return len(segments)
+
+
 def save_raw_json(data: any, asset_id: str, compress: bool = False) -> str:
     """Save raw JSON data. Accepts Dict or List.
 
@@ -417,7 +548,14 @@ def load_raw_json(asset_id: str) -> any:
 
     In local mode: reads from DATA_DIR/raw/{asset_id}.json[.gz]
     In cloud mode: downloads from R2
+
+    If delta segments were saved for the asset (see save_raw_delta), they are
+    merged into its "data" rows before returning.
     """
+    return _apply_raw_deltas(_load_raw_json_base(asset_id), asset_id)
+
+
+def _load_raw_json_base(asset_id: str) -> any:
     if is_cloud_mode():
         # Try uncompressed first
         key = _get_raw_r2_key(asset_id, "json")
@@ -450,6 +588,240 @@ def load_raw_json(asset_id: str) -> any:
         raise FileNotFoundError(f"Raw asset '{asset_id}' not found.")
 
 
+def save_raw_delta(rows: list, asset_id: str, seq: int) -> str:
+    """Save a delta segment of changed rows for a raw asset.
+
+    Segments are gzip NDJSON files named {asset_id}.delta-{seq}.ndjson.gz and
+    are applied in seq order on top of the base asset by load_raw_json.
+
+    In local mode: writes to DATA_DIR/raw/{asset_id}.delta-{seq}.ndjson.gz
+    In cloud mode: uploads directly to R2 (no disk write)
+    """
+    ext = f"delta-{seq:05d}.ndjson.gz"
+    content = gzip.compress("".join(json.dumps(row) + '\n' for row in rows).encode('utf-8'))
+
+    if is_cloud_mode():
+        uri = upload_bytes(content, _get_raw_r2_key(asset_id, ext))
+        print(f"  -> R2: Saved {asset_id}.{ext} ({len(rows):,} rows)")
+        return uri
+    else:
+        path = _get_raw_path(asset_id, ext)
+        with open(path, 'wb') as f:
+            f.write(content)
+        print(f"  -> Raw Cache: Saved {asset_id}.{ext} ({len(rows):,} rows)")
+        return str(path)
+
+
+def _list_raw_deltas(asset_id: str) -> list[str]:
+    """Delta segment keys (cloud) or paths (local) for an asset, in seq order."""
+    if is_cloud_mode():
+        prefix = _get_raw_r2_key(asset_id, "delta-")
+        return sorted(key for key in list_keys(prefix) if key.endswith(".ndjson.gz"))
+    else:
+        raw_dir = Path(get_data_dir()) / "raw"
+        return sorted(str(path) for path in raw_dir.glob(f"{asset_id}.delta-*.ndjson.gz"))
+
+
+def clear_raw_deltas(asset_id: str) -> int:
+    """Delete all delta segments of an asset (after a full re-fetch). Returns count."""
+    segments = _list_raw_deltas(asset_id)
+    if is_cloud_mode():
+        if segments:
+            delete_keys(segments)
+    else:
+        for path in segments:
+            os.remove(path)
+    return len(segments)
+
+
+def _apply_raw_deltas(raw: any, asset_id: str, key: str = ":id") -> any:
+    """Merge delta segments into raw["data"]: rows replace the base row with the same key."""
+    if not isinstance(raw, dict) or not isinstance(raw.get("data"), list):
+        return raw
+
+    segments = _list_raw_deltas(asset_id)
+    if not segments:
+        return raw
+
+    data = raw["data"]
+    positions = {row[key]: i for i, row in enumerate(data) if key in row}
+
+    for segment in segments:
+        content = download_bytes(segment) if is_cloud_mode() else Path(segment).read_bytes()
+        for line in gzip.decompress(content).decode('utf-8').splitlines():
+            row = json.loads(line)
+            if key in row and row[key] in positions:
+                data[positions[row[key]]] = row
+            else:
+                if key in row:
+                    positions[row[key]] = len(data)
+                data.append(row)
+
+    return raw
+
+
+# Raw dataset layouts, in the order open_raw_dataset looks for them:
+#   {asset}.json / .json.gz  one JSON object, rows under "data" (up to one page)
+#   {asset}.ndjson.gz        header line ("_header": true), then one row per line
+#   {asset}.csv.gz           CSV rows, header saved as {asset}.header.json
+RAW_DATASET_LAYOUTS = ("json", "json.gz", "ndjson.gz", "csv.gz")
+
+
+def _open_raw_stream(asset_id: str, extension: str):
+    """Binary stream of a raw file (local file or R2 body), or None if it doesn't exist."""
+    if is_cloud_mode():
+        return open_object(_get_raw_r2_key(asset_id, extension))
+    path = _get_raw_path(asset_id, extension)
+    return open(path, 'rb') if path.exists() else None
+
+
+def _text_lines(stream):
+    with stream, io.TextIOWrapper(gzip.GzipFile(fileobj=stream, mode='rb'), encoding='utf-8') as f:
+        yield from f
+
+
+def _ndjson_rows(lines):
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _csv_rows(stream):
+    # Empty CSV fields are nulls, which SODA JSON leaves out of the row
+    with stream, io.TextIOWrapper(gzip.GzipFile(fileobj=stream, mode='rb'), encoding='utf-8', newline='') as f:
+        for row in csv.DictReader(f):
+            yield {column: value for column, value in row.items() if value != ''}
+
+
+def _merge_raw_deltas(rows, asset_id: str, key: str = ":id"):
+    """Stream rows with delta segments applied, as _apply_raw_deltas does for a list.
+
+    Only the (small) delta rows are held in memory: changed rows replace the
+    base row in place, rows new to the base follow at the end.
+    """
+    segments = _list_raw_deltas(asset_id)
+    if not segments:
+        yield from rows
+        return
+
+    changed, unkeyed = {}, []
+    for segment in segments:
+        content = download_bytes(segment) if is_cloud_mode() else Path(segment).read_bytes()
+        for row in _ndjson_rows(gzip.decompress(content).decode('utf-8').splitlines()):
+            if key in row:
+                changed[row[key]] = row
+            else:
+                unkeyed.append(row)
+
+    for row in rows:
+        yield changed.pop(row[key]) if key in row and row[key] in changed else row
+    yield from changed.values()
+    yield from unkeyed
+
+
+def open_raw_dataset(asset_id: str) -> tuple[dict, Iterator[dict]]:
+    """Open a raw dataset in whichever layout ingest wrote it (see RAW_DATASET_LAYOUTS).
+
+    Returns (header, rows): the header is the dataset's id, name, score and
+    metadata; rows is an iterator of row dicts with delta segments merged in.
+    NDJSON and CSV layouts are streamed (from disk, or from R2 in cloud mode),
+    so memory stays bounded however large the dataset is; the JSON layout
+    only holds datasets of up to one page and is loaded whole.
+
+    Usage:
+        header, rows = open_raw_dataset("dataset_abcd-1234")
+        for row in rows:
+            ...
+    """
+    for extension in ("json", "json.gz"):
+        stream = _open_raw_stream(asset_id, extension)
+        if stream is not None:
+            with stream:
+                raw = json.load(gzip.GzipFile(fileobj=stream, mode='rb') if extension == "json.gz" else stream)
+            rows = raw.pop("data", [])
+            return raw, _merge_raw_deltas(iter(rows), asset_id)
+
+    stream = _open_raw_stream(asset_id, "ndjson.gz")
+    if stream is not None:
+        lines = _text_lines(stream)
+        header = json.loads(next(lines, None) or "{}")
+        header.pop("_header", None)
+        return header, _merge_raw_deltas(_ndjson_rows(lines), asset_id)
+
+    stream = _open_raw_stream(asset_id, "csv.gz")
+    if stream is not None:
+        header = _load_raw_json_base(f"{asset_id}.header")
+        return header, _merge_raw_deltas(_csv_rows(stream), asset_id)
+
+    raise FileNotFoundError(f"Raw dataset '{asset_id}' not found in any layout {RAW_DATASET_LAYOUTS}.")
+
+
+def iter_raw_rows(asset_id: str) -> Iterator[dict]:
+    """Rows of a raw dataset in any layout, streamed (see open_raw_dataset)."""
+    return open_raw_dataset(asset_id)[1]
+
+
+def _arrow_cell(value):
+    # Nested values (e.g. location points) are kept as JSON text
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def open_raw_batches(asset_id: str, batch_size: int = 50000,
+                     columns: list | None = None) -> tuple[dict, Iterator[pa.RecordBatch]]:
+    """Open a raw dataset as Arrow record batches of up to batch_size rows.
+
+    Every column is a string column, as SODA serves them. `columns` defaults
+    to :id plus the fields in the header's metadata, so every batch has the
+    same schema; columns a row lacks are null.
+
+    Returns (header, batches).
+    """
+    header, rows = open_raw_dataset(asset_id)
+    if columns is None:
+        columns = [":id"] + [col["fieldName"] for col in header.get("metadata", {}).get("columns", [])
+                             if not col.get("fieldName", ":").startswith(":")]
+    schema = pa.schema([(column, pa.string()) for column in columns])
+
+    def batches():
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) == batch_size:
+                yield _to_record_batch(batch, schema)
+                batch = []
+        if batch:
+            yield _to_record_batch(batch, schema)
+
+    return header, batches()
+
+
+def _to_record_batch(rows: list, schema: pa.Schema) -> pa.RecordBatch:
+    return pa.RecordBatch.from_arrays(
+        [pa.array([_arrow_cell(row.get(name)) for row in rows], type=pa.string()) for name in schema.names],
+        schema=schema,
+    )
+
+
+def remove_raw_layouts(asset_id: str, keep: str) -> None:
+    """Delete an asset's files in raw dataset layouts other than `keep`.
+
+    Called after a full fetch, so a dataset that moved to another layout
+    isn't shadowed by (or read alongside) its previous one.
+    """
+    extensions = [ext for ext in RAW_DATASET_LAYOUTS if ext != keep]
+    if keep != "csv.gz":
+        extensions.append("header.json")
+    if is_cloud_mode():
+        delete_keys([_get_raw_r2_key(asset_id, ext) for ext in extensions])
+    else:
+        for ext in extensions:
+            path = Path(get_data_dir()) / "raw" / f"{asset_id}.{ext}"
+            if path.exists():
+                os.remove(path)
+
+
 def save_raw_parquet(data: pa.Table, asset_id: str, metadata: dict = None) -> str:
     """Save raw PyArrow table as Parquet with optional metadata.
 
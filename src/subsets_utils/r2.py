@@ -6,10 +6,19 @@ Provides helper functions for R2 upload/download operations.
 
 import os
 import io
-from typing import Optional
+import threading
+import time
+from typing import Iterable, Optional
 
 _s3_client = None
 
+# Managed transfers (upload_bytes/upload_file/upload_fileobj/upload_iter):
+# objects of at least the threshold go up as multipart uploads of
+# part-size parts, up to max-concurrency parts at a time
+TRANSFER_THRESHOLD = int(os.environ.get('R2_MULTIPART_THRESHOLD', str(16 * 1024 * 1024)))
+TRANSFER_PART_SIZE = int(os.environ.get('R2_PART_SIZE', str(16 * 1024 * 1024)))
+TRANSFER_MAX_CONCURRENCY = int(os.environ.get('R2_MAX_CONCURRENCY', '8'))
+
 
 def is_cloud_mode() -> bool:
     """Check if running in cloud mode (CI environment)."""
@@ -22,9 +31,16 @@ def get_connector_name() -> str:
 
 
 def _get_r2_config() -> dict:
-    """Get R2 configuration from environment variables."""
+    """Get R2 configuration from environment variables.
+
+    R2_ENDPOINT_URL overrides the account endpoint, e.g. to point at a
+    local S3-compatible stand-in.
+    """
+    endpoint_url = os.environ.get('R2_ENDPOINT_URL')
+    account_id = os.environ.get('R2_ACCOUNT_ID') if endpoint_url else os.environ['R2_ACCOUNT_ID']
     return {
-        'account_id': os.environ['R2_ACCOUNT_ID'],
+        'account_id': account_id,
+        'endpoint_url': endpoint_url or f"https://{account_id}.r2.cloudflarestorage.com",
         'access_key_id': os.environ['R2_ACCESS_KEY_ID'],
         'secret_access_key': os.environ['R2_SECRET_ACCESS_KEY'],
         'bucket_name': os.environ['R2_BUCKET_NAME'],
@@ -39,11 +55,10 @@ def get_s3_client():
         import boto3
 
         config = _get_r2_config()
-        endpoint_url = f"https://{config['account_id']}.r2.cloudflarestorage.com"
 
         _s3_client = boto3.client(
             's3',
-            endpoint_url=endpoint_url,
+            endpoint_url=config['endpoint_url'],
             aws_access_key_id=config['access_key_id'],
             aws_secret_access_key=config['secret_access_key'],
             region_name='auto'
@@ -57,18 +72,81 @@ def get_bucket_name() -> str:
     return os.environ['R2_BUCKET_NAME']
 
 
-def upload_bytes(data: bytes, key: str) -> str:
+def transfer_config(part_size: int | None = None, max_concurrency: int | None = None,
+                    threshold: int | None = None):
+    """boto3 TransferConfig for managed uploads, defaulting to the R2_* settings.
+
+    Args:
+        part_size: Bytes per multipart part (R2 needs at least 5 MiB)
+        max_concurrency: Parts uploaded at once
+        threshold: Smallest object sent as a multipart upload
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=threshold or TRANSFER_THRESHOLD,
+        multipart_chunksize=part_size or TRANSFER_PART_SIZE,
+        max_concurrency=max_concurrency or TRANSFER_MAX_CONCURRENCY,
+    )
+
+
+class _Progress:
+    """Bytes sent so far, from boto3 transfer callbacks (called on worker threads)."""
+
+    def __init__(self):
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, sent: int):
+        with self._lock:
+            self.bytes += sent
+
+
+def _log_upload(method: str, key: str, size: int, started: float, parts: int | None = None):
+    from . import debug  # debug imports this module
+
+    seconds = time.perf_counter() - started
+    debug.log_r2_upload(key, method, size, round(seconds, 3),
+                        round(size / seconds / 1024 / 1024, 2) if seconds else None, parts)
+
+
+def _managed_upload(method: str, source, key: str, config, size: int | None = None) -> str:
+    """boto3 managed upload of a file path or readable file-like object, with throughput logging.
+
+    `size` is logged if known; otherwise the bytes boto3 reports sending.
+    """
+    client = get_s3_client()
+    bucket = get_bucket_name()
+    progress = _Progress()
+    started = time.perf_counter()
+
+    if isinstance(source, str):
+        client.upload_file(source, bucket, key, Config=config or transfer_config(), Callback=progress)
+    else:
+        client.upload_fileobj(source, bucket, key, Config=config or transfer_config(), Callback=progress)
+
+    _log_upload(method, key, progress.bytes if size is None else size, started)
+    return f"s3://{bucket}/{key}"
+
+
+def upload_bytes(data: bytes, key: str, config=None) -> str:
     """Upload bytes to R2.
 
     Args:
         data: Bytes to upload
         key: Full key path in bucket (e.g., 'data/raw/asset.json')
+        config: TransferConfig from transfer_config() (default: R2_* settings)
 
     Returns:
         S3 URI of uploaded object
     """
+    config = config or transfer_config()
+    if len(data) >= config.multipart_threshold:
+        return _managed_upload("bytes", io.BytesIO(data), key, config, size=len(data))
+
     client = get_s3_client()
     bucket = get_bucket_name()
+    started = time.perf_counter()
 
     client.put_object(
         Bucket=bucket,
@@ -76,43 +154,158 @@ def upload_bytes(data: bytes, key: str) -> str:
         Body=data
     )
 
+    _log_upload("bytes", key, len(data), started, parts=1)
     return f"s3://{bucket}/{key}"
 
 
-def upload_file(file_path: str, key: str) -> str:
+def upload_file(file_path: str, key: str, config=None) -> str:
     """Upload a local file to R2.
 
     Args:
         file_path: Local file path
         key: Full key path in bucket
+        config: TransferConfig from transfer_config() (default: R2_* settings)
 
     Returns:
         S3 URI of uploaded object
     """
-    client = get_s3_client()
-    bucket = get_bucket_name()
+    return _managed_upload("file", str(file_path), key, config, size=os.path.getsize(file_path))
 
-    client.upload_file(file_path, bucket, key)
 
-    return f"s3://{bucket}/{key}"
+def upload_fileobj(fileobj: io.IOBase, key: str, config=None) -> str:
+    """Upload a file-like object to R2.
 
+    Args:
+        fileobj: Readable binary file-like object (read from its current position)
+        key: Full key path in bucket
+        config: TransferConfig from transfer_config() (default: R2_* settings)
 
-def upload_fileobj(fileobj: io.IOBase, key: str) -> str:
-    """Upload a file-like object to R2.
+    Returns:
+        S3 URI of uploaded object
+    """
+    return _managed_upload("fileobj", fileobj, key, config)
+
+
+class IteratorReader(io.RawIOBase):
+    """Read-only binary stream over an iterable of bytes chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def upload_iter(chunks: Iterable[bytes], key: str, config=None) -> str:
+    """Upload an object from an iterator or generator of bytes chunks.
+
+    Chunks are read as the upload needs them, so memory holds about
+    max_concurrency parts, however large the object. The object only
+    appears once every part is in.
 
     Args:
-        fileobj: File-like object (must be seeked to start)
+        chunks: Iterable of bytes
         key: Full key path in bucket
+        config: TransferConfig from transfer_config() (default: R2_* settings)
 
     Returns:
         S3 URI of uploaded object
     """
-    client = get_s3_client()
-    bucket = get_bucket_name()
+    return _managed_upload("iter", io.BufferedReader(IteratorReader(chunks)), key, config)
 
-    client.upload_fileobj(fileobj, bucket, key)
 
-    return f"s3://{bucket}/{key}"
+class MultipartWriter:
+    """Binary writer that streams to an R2 object as S3 multipart parts.
+
+    Bytes are buffered until a full part is ready, so memory stays at about
+    one part and nothing touches local disk. All parts but the last have the
+    same size, as R2 requires. The object only appears once close() completes
+    the upload; abort() (or leaving a `with` block with an error) discards it.
+
+    Usage:
+        with MultipartWriter("connector/data/raw/big.ndjson.gz") as f:
+            f.write(chunk)
+    """
+
+    PART_SIZE = 8 * 1024 * 1024  # R2/S3 minimum is 5 MiB
+
+    def __init__(self, key: str, part_size: int | None = None):
+        self.key = key
+        self.part_size = part_size or self.PART_SIZE
+        self.client = get_s3_client()
+        self.bucket = get_bucket_name()
+        self.upload_id = None
+        self.parts = []
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._started = time.perf_counter()
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self.bytes_written += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def _upload_part(self, data: bytes):
+        if self.upload_id is None:
+            self.upload_id = self.client.create_multipart_upload(Bucket=self.bucket, Key=self.key)['UploadId']
+        number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id, PartNumber=number, Body=data
+        )
+        self.parts.append({'PartNumber': number, 'ETag': response['ETag']})
+
+    def close(self) -> str:
+        """Upload the last part and complete the upload, making the object visible."""
+        if self.closed:
+            return f"s3://{self.bucket}/{self.key}"
+        if self.upload_id is None:
+            # Smaller than one part: a single PUT is just as atomic
+            self.client.put_object(Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer))
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self.upload_id, MultipartUpload={'Parts': self.parts}
+            )
+        self._buffer = bytearray()
+        self.closed = True
+        _log_upload("multipart_writer", self.key, self.bytes_written, self._started, parts=len(self.parts) or 1)
+        return f"s3://{self.bucket}/{self.key}"
+
+    def abort(self):
+        """Discard everything uploaded so far; the object is never created."""
+        if self.upload_id is not None and not self.closed:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        self._buffer = bytearray()
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
 
 
 def download_bytes(key: str) -> Optional[bytes]:
@@ -134,6 +327,25 @@ def download_bytes(key: str) -> Optional[bytes]:
         return None
 
 
+def open_object(key: str):
+    """Open an object in R2 for streaming reads.
+
+    Args:
+        key: Full key path in bucket
+
+    Returns:
+        Readable binary stream of the body (close it when done), or None if
+        the key doesn't exist
+    """
+    client = get_s3_client()
+    bucket = get_bucket_name()
+
+    try:
+        return client.get_object(Bucket=bucket, Key=key)['Body']
+    except client.exceptions.NoSuchKey:
+        return None
+
+
 def object_exists(key: str) -> bool:
     """Check if an object exists in R2.
 
@@ -153,6 +365,23 @@ def object_exists(key: str) -> bool:
         return False
 
 
+def delete_keys(keys: list[str]) -> None:
+    """Delete objects from R2.
+
+    Args:
+        keys: Full key paths in bucket
+    """
+    client = get_s3_client()
+    bucket = get_bucket_name()
+
+    # delete_objects accepts at most 1000 keys per call
+    for i in range(0, len(keys), 1000):
+        client.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': [{'Key': key} for key in keys[i:i + 1000]], 'Quiet': True}
+        )
+
+
 def list_keys(prefix: str) -> list[str]:
     """List all keys in R2 with a given prefix.
 
@@ -184,7 +413,7 @@ def get_storage_options() -> dict:
     config = _get_r2_config()
 
     return {
-        'AWS_ENDPOINT_URL': f"https://{config['account_id']}.r2.cloudflarestorage.com",
+        'AWS_ENDPOINT_URL': config['endpoint_url'],
         'AWS_ACCESS_KEY_ID': config['access_key_id'],
         'AWS_SECRET_ACCESS_KEY': config['secret_access_key'],
         'AWS_REGION': 'auto',
@@ -0,0 +1,174 @@
+"""Rate limiter shared between threads, asyncio tasks and processes.
+
+Callers reserve a send slot and then sleep until it arrives, so a single
+limiter can pace blocking worker threads and coroutines against the same
+request budget. The budget is a token bucket; when a state file is given, the
+bucket lives in that file under an exclusive lock, so every process pointed at
+the same file draws from one budget.
+
+Server feedback feeds back into the bucket: penalize() (called on 429/503)
+stops all sends until Retry-After has passed and halves the refill rate, which
+then recovers linearly over `recovery` seconds.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to a process-local bucket
+    fcntl = None
+
+from . import debug
+
+
+def parse_retry_after(value: str | None, default: float) -> float:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """Token bucket allowing `calls` requests per `period` seconds.
+
+    Bursts of up to `calls` requests are let through at once. Pass
+    `state_file` to share the bucket with other processes.
+    """
+
+    MIN_RATE_FACTOR = 0.1
+
+    def __init__(self, calls: int, period: float, state_file: str | None = None, recovery: float = 60.0):
+        self.calls = calls
+        self.period = period
+        self.recovery = recovery
+        self.state_file = state_file if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._state = None
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "throttled_seconds": 0.0,
+            "penalties": 0,
+            "penalty_seconds": 0.0,
+        }
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second at full speed."""
+        return self.calls / self.period
+
+    def _initial_state(self, now: float) -> dict:
+        return {"tokens": float(self.calls), "updated": now, "blocked_until": 0.0, "rate_factor": 1.0}
+
+    @contextmanager
+    def _shared_state(self):
+        """Yield the bucket state under an exclusive lock, saving it on exit."""
+        with self._lock:
+            now = time.time()
+            if self.state_file is None:
+                if self._state is None:
+                    self._state = self._initial_state(now)
+                yield self._state, now
+                return
+
+            fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                with os.fdopen(os.dup(fd), 'r+') as f:
+                    try:
+                        state = json.load(f)
+                    except ValueError:
+                        state = self._initial_state(now)
+                    yield state, now
+                    f.seek(0)
+                    f.truncate()
+                    json.dump(state, f)
+            finally:
+                os.close(fd)  # also releases the lock
+
+    def _refill(self, state: dict, now: float):
+        elapsed = max(0.0, now - state["updated"])
+        state["rate_factor"] = min(1.0, state["rate_factor"] + elapsed / self.recovery)
+        # No tokens accrue while blocked, so the bucket doesn't burst on unblock
+        refill = max(0.0, now - max(state["updated"], state["blocked_until"]))
+        state["tokens"] = min(float(self.calls), state["tokens"] + refill * self.rate * state["rate_factor"])
+        state["updated"] = now
+
+    def reserve(self) -> float:
+        """Reserve the next token and return how long to wait for it.
+
+        Tokens may go negative: a negative balance is a queue of reservations,
+        each served 1 / rate seconds after the previous one.
+        """
+        with self._shared_state() as (state, now):
+            self._refill(state, now)
+            state["tokens"] -= 1
+            delay = 0.0
+            if state["tokens"] < 0:
+                delay = -state["tokens"] / (self.rate * state["rate_factor"])
+            delay = max(delay, state["blocked_until"] - now)
+
+            self._stats["requests"] += 1
+            if delay > 0:
+                self._stats["throttled"] += 1
+                self._stats["throttled_seconds"] += delay
+        return delay
+
+    def penalize(self, retry_after: float):
+        """Back off after the server throttled us (429/503).
+
+        No token is handed out for `retry_after` seconds, and the refill rate
+        is halved so the budget ramps back up instead of bursting again.
+        """
+        with self._shared_state() as (state, now):
+            self._refill(state, now)
+            state["blocked_until"] = max(state["blocked_until"], now + retry_after)
+            state["tokens"] = min(state["tokens"], 0.0)
+            state["rate_factor"] = max(self.MIN_RATE_FACTOR, state["rate_factor"] / 2)
+
+            self._stats["penalties"] += 1
+            self._stats["penalty_seconds"] += retry_after
+
+    def wait(self):
+        """Block the calling thread until a request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """Suspend the calling task until a request may be sent.
+
+        reserve() blocks on the shared state file's lock, so it runs in a
+        worker thread rather than stalling the event loop.
+        """
+        delay = await asyncio.to_thread(self.reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def stats(self) -> dict:
+        """Counters for this process: requests paced, time throttled, penalties."""
+        return {**self._stats,
+                "throttled_seconds": round(self._stats["throttled_seconds"], 3),
+                "penalty_seconds": round(self._stats["penalty_seconds"], 3)}
+
+    def log_stats(self, name: str):
+        """Write this process's counters to the debug rate limit log."""
+        if self._stats["requests"]:
+            debug.log_rate_limit(name, **self.stats())
@@ -0,0 +1,136 @@
+"""Single-flight deduplication of concurrent identical calls.
+
+While a call for a key is in flight, further callers with the same key wait
+for it and share its result (or its exception) instead of repeating it.
+Nothing is remembered once the call finishes; keeping results is the
+response cache's job.
+
+SingleFlight.do() coalesces threads and SingleFlight.ado() coalesces tasks
+on one event loop. SingleFlight.hold() serializes threads on a key instead,
+for results that can't be shared (a streamed body): the others wait their
+turn and then find the result in the response cache. FileLock extends this across processes: the process
+holding a key's lock file fetches it, the others wait for the lock and then
+find the result in the shared cache.
+"""
+
+import asyncio
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process coalescing
+    fcntl = None
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._tasks = {}
+        self._holds = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn):
+        """Call fn(), or wait for the call another thread already has in flight for key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: str, fn):
+        """Await fn(), or the call another task on this loop already has in flight for key.
+
+        The call runs as its own task, so a waiter being cancelled (even the
+        one that started it) doesn't cancel it for the others.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._tasks.get((loop, key))
+            if task is None:
+                task = self._tasks[(loop, key)] = loop.create_task(fn())
+                task.add_done_callback(lambda _: self._tasks.pop((loop, key), None))
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    @contextmanager
+    def hold(self, key: str):
+        """Run the block as the only thread holding key, yielding True if another held it first."""
+        with self._lock:
+            hold = self._holds.setdefault(key, [threading.Lock(), 0])
+            hold[1] += 1
+        waited = not hold[0].acquire(blocking=False)
+        if waited:
+            with self._lock:
+                self.coalesced += 1
+            hold[0].acquire()
+        try:
+            yield waited
+        finally:
+            hold[0].release()
+            with self._lock:
+                hold[1] -= 1
+                if not hold[1]:
+                    del self._holds[key]
+
+
+class FileLock:
+    """Exclusive lock on a per-key file, held while one process fetches the key.
+
+    The file is removed on release. A process that opened it just before
+    then locks an orphaned file, so at worst two processes fetch the same
+    key; never fewer than one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def acquire(self) -> bool:
+        """Take the lock, returning True if another process held it first."""
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return False
+        except BlockingIOError:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            return True
+
+    def release(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        os.close(self._fd)  # also releases the lock
+        self._fd = None
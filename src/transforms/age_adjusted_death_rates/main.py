@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_age_adjusted_death_rates"
 SOURCE_ID = "6rkc-nb2q"
+SOURCE_FIELDS = ["year", "leading_causes", "age_adjusted_death_rate"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -27,8 +28,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload age-adjusted death rates data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_birth_fertility_rates"
 SOURCE_ID = "e6fc-ccez"
+SOURCE_FIELDS = ["year", "birth_number", "general_fertility_rate", "crude_birth_rate"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -28,8 +29,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload birth and fertility rates data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,15 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_birth_indicators_quarterly"
 SOURCE_ID = "76vv-a7x8"
+SOURCE_FIELDS = [
+    "year_and_quarter", "topic", "topic_subgroup", "indicator", "race_ethnicity", "rate", "unit",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +35,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload birth indicators data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
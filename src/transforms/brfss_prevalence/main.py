@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_brfss_prevalence"
 SOURCE_ID = "d2rk-yvas"
+SOURCE_FIELDS = [
+    "year", "locationabbr", "locationdesc", "class", "topic", "question", "response", "break_out",
+    "break_out_category", "sample_size", "data_value", "confidence_limit_low",
+    "confidence_limit_high", "data_value_type",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -39,8 +44,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload BRFSS prevalence data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
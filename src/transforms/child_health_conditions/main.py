@@ -2,12 +2,15 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_child_health_conditions"
 SOURCE_ID = "2m93-xvra"
+SOURCE_FIELDS = [
+    "indicator", "panel", "unit", "stub_name", "stub_label", "year", "age", "estimate", "flag",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +36,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload child health conditions data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
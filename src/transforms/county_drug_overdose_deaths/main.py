@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_county_drug_overdose_deaths"
 SOURCE_ID = "gb4e-yj24"
+SOURCE_FIELDS = [
+    "data_as_of", "year", "month", "st_abbrev", "state_name", "countyname", "fips", "statefips",
+    "countyfips", "code2013", "percentage_of_records_pending",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload county drug overdose deaths dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_age_race"
 SOURCE_ID = "ks3g-spdg"
+SOURCE_FIELDS = [
+    "data_as_of", "start_week", "end_week", "state", "age_group_new", "race_and_hispanic_origin",
+    "covid_19_deaths", "total_deaths", "pneumonia_deaths", "influenza_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -35,8 +39,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID deaths by age/race data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_county"
 SOURCE_ID = "kn79-hsxy"
+SOURCE_FIELDS = [
+    "data_as_of", "start_week", "end_week", "state_name", "county_name", "county_fips_code",
+    "urban_rural_code", "total_death", "footnote",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +37,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 deaths by county data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,18 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_county_race"
 SOURCE_ID = "k8wy-p9cg"
+SOURCE_FIELDS = [
+    "data_as_of", "start_week", "end_week", "state", "county_name", "urbanruralcode",
+    "urbanruraldesc", "fipsstate", "fipscounty", "fipscode", "indicator", "all_deaths_total",
+    "covid_19_deaths_total", "non_hispanic_white", "non_hispanic_black",
+    "non_hispanic_american_indian", "non_hispanic_asian", "non_hispanic_nhopi", "hispanic", "other",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -44,8 +50,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 deaths by county and race data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_demographics"
 SOURCE_ID = "dmnu-8erf"
+SOURCE_FIELDS = [
+    "data_as_of", "jurisdiction_residence", "data_period_start", "data_period_end", "group",
+    "subgroup1", "covid_deaths", "crude_covid_rate", "aa_covid_rate", "crude_covid_rate_ann",
+    "aa_covid_rate_ann",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +41,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID deaths demographics data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_hhs_region"
 SOURCE_ID = "tpcp-uiv5"
+SOURCE_FIELDS = [
+    "data_as_of", "start_date", "end_date", "group", "mmwr_year", "mmwr_week", "week_ending_date",
+    "hhs_region", "race_and_hispanic_origin", "age_group", "covid_19_deaths", "total_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 deaths by HHS region data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
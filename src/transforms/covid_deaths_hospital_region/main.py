@@ -2,12 +2,18 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_hospital_region"
 SOURCE_ID = "mqmc-4b9n"
+SOURCE_FIELDS = [
+    "data_as_of", "week_ending_date", "mmwr_year", "mmwr_week", "hrr_name", "hrr_number", "state",
+    "total_deaths", "covid_19_deaths", "covid_19_deaths_over_65_years",
+    "covid_19_deaths_65_to_74_years", "covid_19_deaths_75_to_84_years",
+    "covid_19_deaths_over_85_years",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -38,8 +44,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID deaths by HRR dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
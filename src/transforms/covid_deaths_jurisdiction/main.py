@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_jurisdiction"
 SOURCE_ID = "mpx5-t7tu"
+SOURCE_FIELDS = [
+    "data_as_of", "jurisdiction_residence", "group", "data_period_start", "data_period_end",
+    "covid_deaths", "covid_pct_of_total", "crude_covid_rate", "aa_covid_rate",
+    "crude_covid_rate_ann", "aa_covid_rate_ann",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -35,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 deaths by jurisdiction data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,18 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_race_distribution"
 SOURCE_ID = "pj7m-y5uh"
+SOURCE_FIELDS = [
+    "data_as_of", "start_week", "end_week", "year", "group", "state", "indicator",
+    "non_hispanic_white", "non_hispanic_black_african_american",
+    "non_hispanic_american_indian_alaska_native", "non_hispanic_asian_pacific_islander", "nh_nhopi",
+    "non_hispanic_more_than_one_race", "hispanic_latino_total",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -38,8 +44,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 deaths race distribution data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_sex_age"
 SOURCE_ID = "9bhg-hcku"
+SOURCE_FIELDS = [
+    "data_as_of", "start_date", "end_date", "state", "sex", "age_group", "covid_19_deaths",
+    "total_deaths", "pneumonia_deaths", "pneumonia_and_covid_19_deaths", "influenza_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID deaths by sex and age data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
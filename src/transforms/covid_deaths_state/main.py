@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_state"
 SOURCE_ID = "r8kw-7aab"
+SOURCE_FIELDS = [
+    "data_as_of", "state", "year", "mmwr_week", "week_ending_date", "covid_19_deaths",
+    "total_deaths", "pneumonia_deaths", "pneumonia_and_covid_19_deaths", "influenza_deaths",
+    "pneumonia_influenza_or_covid_19_deaths", "percent_of_expected_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -37,8 +42,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID deaths by state data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_mmddyyyy
 from .test import test
 
 DATASET_ID = "cdc_covid_deaths_youth"
 SOURCE_ID = "nr4s-juj3"
+SOURCE_FIELDS = [
+    "data_as_of", "start_week", "end_week", "age_group", "covid_19_deaths", "indicator", "sex",
+    "race_group",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +36,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 deaths youth data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
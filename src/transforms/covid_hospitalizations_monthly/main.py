@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_covid_hospitalizations_monthly"
 SOURCE_ID = "cf5u-bm9w"
+SOURCE_FIELDS = [
+    "state", "season", "_yearmonth", "agecategory_legend", "sex_label", "race_label", "monthlyrate",
+    "type",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +37,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID hospitalizations monthly data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_covid_test_positivity"
 SOURCE_ID = "gvsb-yw6g"
+SOURCE_FIELDS = [
+    "level", "mmwrweek_end", "percent_pos", "percent_pos_2_week", "percent_pos_4_week", "perc_diff",
+    "number_tested", "number_tested_2_week", "number_tested_4_week",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID test positivity data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_date
 from .test import test
 
 DATASET_ID = "cdc_covid_variant_proportions"
 SOURCE_ID = "jr58-6ysp"
+SOURCE_FIELDS = [
+    "usa_or_hhsregion", "week_ending", "variant", "share", "share_hi", "share_lo", "modeltype",
+    "time_interval",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +37,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID variant proportions dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
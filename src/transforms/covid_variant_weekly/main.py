@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_covid_variant_weekly"
 SOURCE_ID = "jr58-6ysp"
+SOURCE_FIELDS = [
+    "usa_or_hhsregion", "week_ending", "variant", "share", "share_hi", "share_lo", "count_lt10",
+    "modeltype", "time_interval", "creation_date",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-19 variant weekly data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_covidnet_hospitalizations"
 SOURCE_ID = "bigw-pgk2"
+SOURCE_FIELDS = [
+    "season", "strata", "age_category", "race_ethnicity", "sex", "covid", "icu",
+    "medical_condition", "mechanical_ventilation", "death", "time_period", "time", "estimate_type",
+    "estimate",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -39,8 +44,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload COVID-NET hospitalizations data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
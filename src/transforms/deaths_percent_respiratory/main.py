@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_deaths_percent_respiratory"
 SOURCE_ID = "53g5-jf7x"
+SOURCE_FIELDS = [
+    "data_as_of", "start_date", "end_date", "group", "year", "month", "mmwr_week",
+    "weekending_date", "state", "demographic_type", "demographic_values", "pathogen", "deaths",
+    "total_deaths", "percent_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -40,8 +45,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload respiratory deaths percent data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
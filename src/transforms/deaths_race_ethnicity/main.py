@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_deaths_race_ethnicity"
 SOURCE_ID = "qfhf-uhaa"
+SOURCE_FIELDS = [
+    "jurisdiction", "state_abbreviation", "week_ending_date", "mmwryear", "mmwrweek",
+    "race_ethnicity", "number_of_deaths", "time_period",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +37,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload deaths by race/ethnicity data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_float, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_drug_overdose_deaths"
 SOURCE_ID = "xkb8-kh2a"
+SOURCE_FIELDS = [
+    "year", "month", "state", "state_name", "indicator", "data_value", "predicted_value",
+    "percent_complete", "percent_pending_investigation",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload drug overdose deaths dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
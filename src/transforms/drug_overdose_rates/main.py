@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_drug_overdose_rates"
 SOURCE_ID = "95ax-ymtc"
+SOURCE_FIELDS = ["indicator", "panel", "unit", "stub_name", "stub_label", "year", "age", "estimate"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +33,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload drug overdose death rates data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_drug_overdose_specific"
 SOURCE_ID = "8hzs-zshh"
+SOURCE_FIELDS = [
+    "data_as_of", "death_year", "death_month", "jurisdiction_occurrence", "drug_involved",
+    "time_period", "month_ending_date", "drug_overdose_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +37,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload drug overdose specific data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
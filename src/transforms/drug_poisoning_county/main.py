@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_drug_poisoning_county"
 SOURCE_ID = "pbkm-d27e"
+SOURCE_FIELDS = [
+    "fips", "year", "state", "st", "fips_state", "county", "population",
+    "estimated_age_adjusted_death_rate_11_categories_in_ranges",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +36,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload drug poisoning county data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
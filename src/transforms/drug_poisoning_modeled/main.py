@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_drug_poisoning_modeled"
 SOURCE_ID = "rpvx-m2md"
+SOURCE_FIELDS = [
+    "fips", "year", "state", "fipsstate", "county", "population", "model_based_death_rate",
+    "standard_deviation", "lower95ci", "upper95ci",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload drug poisoning modeled data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
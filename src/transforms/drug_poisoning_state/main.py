@@ -2,12 +2,20 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_drug_poisoning_state"
 SOURCE_ID = "xbxb-epbu"
+SOURCE_FIELDS = [
+    "state", "year", "sex", "age_group", "race_and_hispanic_origin", "deaths", "population",
+    "crude_death_rate", "standard_error_for_crude_rate", "lower_confidence_limit_for_crude_rate",
+    "upper_confidence_limit_for_crude_rate", "age_adjusted_rate",
+    "standard_error_for_age_adjusted_rate", "lower_confidence_limit_for_age_adjusted_rate",
+    "upper_confidence_limit_for_age_adjusted_rate", "state_crude_rate_in_range", "us_crude_rate",
+    "us_age_adjusted_rate",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -42,8 +50,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload drug poisoning state data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
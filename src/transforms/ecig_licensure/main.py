@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_ecig_licensure"
 SOURCE_ID = "ne52-uraz"
+SOURCE_FIELDS = [
+    "year", "quarter", "locationabbr", "locationdesc", "topicdesc", "measuredesc",
+    "provisiongroupdesc", "provisiondesc", "provisionvalue", "citation", "enacted_date",
+    "effective_date",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -37,8 +42,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload e-cigarette licensure data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
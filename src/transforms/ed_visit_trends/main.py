@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_ed_visit_trends"
 SOURCE_ID = "rdmq-nq56"
+SOURCE_FIELDS = [
+    "week_end", "geography", "county", "hsa", "ed_trends_covid", "ed_trends_influenza",
+    "ed_trends_rsv",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +36,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload ED visit trends data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
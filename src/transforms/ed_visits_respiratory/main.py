@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_date
 from .test import test
 
 DATASET_ID = "cdc_ed_visits_respiratory"
 SOURCE_ID = "7xva-uux8"
+SOURCE_FIELDS = [
+    "week_end", "geography", "pathogen", "demographics_type", "demographics_values",
+    "percent_visits",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -31,8 +35,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload NSSP ED visits data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
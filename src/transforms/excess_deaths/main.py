@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_excess_deaths"
 SOURCE_ID = "xkkf-xrst"
+SOURCE_FIELDS = [
+    "week_ending_date", "state", "observed_number", "upper_bound_threshold", "exceeds_threshold",
+    "average_expected_count", "excess_estimate", "total_excess_estimate", "percent_excess_estimate",
+    "year", "type", "outcome",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -37,8 +42,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload excess deaths data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_excess_deaths_causes"
 SOURCE_ID = "vdpk-qzpr"
+SOURCE_FIELDS = [
+    "year", "cause_of_death", "state", "state_fips_code", "hhs_region", "age_range", "benchmark",
+    "locality", "observed_deaths", "population", "expected_deaths", "potentially_excess_deaths",
+    "percent_potentially_excess_deaths",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -38,8 +43,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload excess deaths by causes data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
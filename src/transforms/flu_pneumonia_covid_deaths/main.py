@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date, parse_mmddyyyy, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_flu_pneumonia_covid_deaths"
 SOURCE_ID = "ynw2-4viq"
+SOURCE_FIELDS = [
+    "data_as_of", "week_ending_date", "mmwryear", "mmwrweek", "state", "indicator", "deaths",
+    "percent_of_expected", "age_group",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload flu/pneumonia/covid deaths data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_hai_cdi"
 SOURCE_ID = "abgz-qs4g"
+SOURCE_FIELDS = ["yearname", "topic", "viewby", "grouping", "series", "value"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -31,8 +32,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload HAI CDI data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_date
 from .test import test
 
 DATASET_ID = "cdc_hospital_drug_use"
 SOURCE_ID = "gypc-kpgn"
+SOURCE_FIELDS = ["setting", "start_time", "end_time", "measure", "value", "figure"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -30,8 +31,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload hospital drug use data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,15 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_infant_mortality_quarterly"
 SOURCE_ID = "jqwm-z2g9"
+SOURCE_FIELDS = [
+    "year_and_quarter", "topic", "indicator", "time_period", "rate", "unit", "significant",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +35,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload infant mortality data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_life_expectancy"
 SOURCE_ID = "w9j2-ggv5"
+SOURCE_FIELDS = ["year", "race", "sex", "average_life_expectancy", "mortality"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -30,8 +31,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload life expectancy data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_float, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_maternal_deaths"
 SOURCE_ID = "e2d5-ggg7"
+SOURCE_FIELDS = [
+    "data_as_of", "jurisdiction", "year_of_death", "month_of_death", "group", "subgroup",
+    "time_period", "deaths", "rate",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload maternal deaths data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
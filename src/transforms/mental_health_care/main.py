@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_date
 from .test import test
 
 DATASET_ID = "cdc_mental_health_care"
 SOURCE_ID = "yni7-er2q"
+SOURCE_FIELDS = [
+    "indicator", "group", "state", "subgroup", "phase", "time_period", "time_period_label",
+    "time_period_start_date", "time_period_end_date", "value", "lowci", "highci",
+    "confidence_interval",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -38,8 +43,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload mental health care data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,21 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_monthly_deaths_causes"
 SOURCE_ID = "65mz-jvh5"
+SOURCE_FIELDS = [
+    "analysisdate", "date_of_death_year", "date_of_death_month", "start_date", "end_date",
+    "jurisdiction_of_occurrence", "sex", "race_ethnicity", "agegroup", "allcause", "naturalcause",
+    "septicemia_a40_a41", "malignant_neoplasms_c00_c97", "diabetes_mellitus_e10_e14",
+    "alzheimer_disease_g30", "influenza_and_pneumonia_j09", "chronic_lower_respiratory",
+    "other_diseases_of_respiratory", "nephritis_nephrotic_syndrome", "symptoms_signs_and_abnormal",
+    "diseases_of_heart_i00_i09", "cerebrovascular_diseases", "covid_19_u071_multiple_cause",
+    "covid_19_u071_underlying",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -49,8 +58,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload monthly deaths data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_natality_measures"
 SOURCE_ID = "89yk-m38d"
+SOURCE_FIELDS = ["year", "race", "live_births", "birth_rate", "fertility_rate"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -29,8 +30,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload natality measures data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_nchs_drug_poisoning_state"
 SOURCE_ID = "44rk-q6r2"
+SOURCE_FIELDS = [
+    "state", "year", "sex", "age", "race", "deaths", "popul", "rate", "se", "slcl", "sucl",
+    "usrate", "usageadjrate", "unit",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -39,8 +43,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload NCHS drug poisoning data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
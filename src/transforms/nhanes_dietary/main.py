@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_nhanes_dietary"
 SOURCE_ID = "8wmh-yzz9"
+SOURCE_FIELDS = [
+    "survey_years", "sex", "age_group", "race_and_hispanic_origin", "nutrient", "mean",
+    "standard_error", "lower_95_ci_limit", "upper_95_ci_limit",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload NHANES dietary data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,18 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_nhis_vision"
 SOURCE_ID = "2t2r-sf6s"
+SOURCE_FIELDS = [
+    "yearstart", "yearend", "locationabbr", "locationdesc", "datasource", "topic", "category",
+    "question", "response", "age", "sex", "raceethnicity", "riskfactor", "riskfactorresponse",
+    "data_value_unit", "data_value_type", "data_value", "low_confidence_limit",
+    "high_confidence_limit", "sample_size",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -45,8 +51,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload NHIS vision data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_nndss_weekly"
 SOURCE_ID = "x9gk-5huc"
+SOURCE_FIELDS = ["states", "year", "week", "label", "m2", "m4", "location2"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +33,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload NNDSS weekly data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
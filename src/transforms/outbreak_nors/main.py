@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int
 from .test import test
 
 DATASET_ID = "cdc_outbreak_nors"
 SOURCE_ID = "5xkq-dg7x"
+SOURCE_FIELDS = [
+    "year", "month", "state", "primary_mode", "etiology", "etiology_status", "setting", "illnesses",
+    "deaths", "water_exposure", "water_type",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload NORS outbreak data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
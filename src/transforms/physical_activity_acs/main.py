@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_physical_activity_acs"
 SOURCE_ID = "8mrp-rmkw"
+SOURCE_FIELDS = [
+    "yearstart", "locationabbr", "locationdesc", "datasource", "class", "topic", "question",
+    "data_value", "data_value_type", "stratificationcategory1", "stratification1",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -35,8 +39,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload physical activity ACS data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_respiratory_hospitalizations_combined"
 SOURCE_ID = "kvib-3txy"
+SOURCE_FIELDS = [
+    "surveillance_network", "season", "mmwr_year", "mmwr_week", "age_group", "sex",
+    "race_ethnicity", "site", "virus", "weekly_rate", "cumulative_rate",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload respiratory hospitalizations data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,18 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, parse_date
 from .test import test
 
 DATASET_ID = "cdc_respiratory_vaccination"
 SOURCE_ID = "5c6r-xi2t"
+SOURCE_FIELDS = [
+    "vaccine", "influenza_season", "geographic_level", "geographic_name", "demographic_level",
+    "demographic_name", "indicator_label", "indicator_category_label", "month_week", "week_ending",
+    "nd_weekly_estimate", "ci_half_width_90pct", "ci_half_width_95pct", "n_unweighted",
+    "suppression_flag", "data_source",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -41,8 +47,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload respiratory vaccination data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,15 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_rsv_hospitalizations_weekly"
 SOURCE_ID = "29hc-w46k"
+SOURCE_FIELDS = [
+    "state", "season", "week_ending_date", "age_category", "sex", "race", "rate", "cumulative_rate",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -33,8 +36,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload RSV hospitalizations weekly data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_teen_births_race"
 SOURCE_ID = "e8kx-wbww"
+SOURCE_FIELDS = ["year", "race", "age", "birth_rate"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -28,8 +29,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload teen birth rates by race data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
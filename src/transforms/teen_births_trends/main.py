@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int
 from .test import test
 
 DATASET_ID = "cdc_teen_births_trends"
 SOURCE_ID = "y268-sna3"
+SOURCE_FIELDS = [
+    "year", "state", "age_years", "state_rate", "state_births", "u_s_births", "u_s_birth_rate",
+    "unit",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -32,8 +36,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload teen birth trends data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_mmddyyyy, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_tobacco_legislation_tax"
 SOURCE_ID = "2dwv-vfam"
+SOURCE_FIELDS = [
+    "year", "quarter", "locationabbr", "locationdesc", "topicdesc", "measuredesc",
+    "provisiongroupdesc", "provisiondesc", "provisionvalue", "provisionaltvalue", "datatype",
+    "citation", "comments", "enacted_date", "effective_date",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -40,8 +45,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload tobacco tax legislation dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
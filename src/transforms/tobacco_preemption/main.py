@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_tobacco_preemption"
 SOURCE_ID = "hj2x-85ya"
+SOURCE_FIELDS = [
+    "year", "quarter", "locationabbr", "locationdesc", "topicdesc", "measuredesc",
+    "smokefree_indoor_air", "youth_access", "licensure",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -34,8 +38,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload tobacco preemption data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
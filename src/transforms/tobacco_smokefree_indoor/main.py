@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_tobacco_smokefree_indoor_legislation"
 SOURCE_ID = "32fd-hyzc"
+SOURCE_FIELDS = [
+    "year", "quarter", "locationabbr", "locationdesc", "topicdesc", "measuredesc",
+    "provisiongroupdesc", "provisiondesc", "provisionvalue", "provisionaltvalue", "datatype",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload tobacco smokefree legislation dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,13 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float
 from .test import test
 
 DATASET_ID = "cdc_wastewater_covid_concentration"
 SOURCE_ID = "g653-rqe2"
+SOURCE_FIELDS = ["key_plot_id", "date", "pcr_conc_lin", "normalization"]
 
 METADATA = {
     "id": DATASET_ID,
@@ -29,8 +30,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload wastewater concentration data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,16 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_wastewater_covid_metrics"
 SOURCE_ID = "2ew6-ywp6"
+SOURCE_FIELDS = [
+    "wwtp_jurisdiction", "wwtp_id", "county_names", "county_fips", "population_served",
+    "date_start", "date_end", "ptc_15d", "detect_prop_15d", "percentile", "first_sample_date",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +40,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload wastewater COVID metrics dataset."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_int, parse_float, parse_date, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_weekly_deaths_cause"
 SOURCE_ID = "u6jv-9ijr"
+SOURCE_FIELDS = [
+    "jurisdiction", "state_abbreviation", "week_ending_date", "mmwryear", "mmwrweek", "cause_group",
+    "cause_subgroup", "number_of_deaths", "average_number_of_deaths",
+    "difference_from_2015_2019_to_2020", "percent_difference_from_15_19_to_20",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -36,8 +41,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload weekly deaths by cause data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
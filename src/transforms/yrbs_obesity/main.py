@@ -2,12 +2,17 @@
 
 import pyarrow as pa
 
-from subsets_utils import upload_data, publish, load_raw_json
+from subsets_utils import upload_data, publish, iter_raw_rows
 from ..utils import parse_float, parse_int, COLUMN_DESC
 from .test import test
 
 DATASET_ID = "cdc_yrbs_obesity"
 SOURCE_ID = "vba9-s8jp"
+SOURCE_FIELDS = [
+    "yearstart", "yearend", "locationabbr", "locationdesc", "datasource", "class", "topic",
+    "question", "data_value_type", "data_value", "sex", "stratificationcategory1",
+    "stratification1",
+]
 
 METADATA = {
     "id": DATASET_ID,
@@ -38,8 +43,7 @@ METADATA = {
 
 def run():
     """Transform, validate, and upload YRBS obesity data."""
-    raw = load_raw_json(f"dataset_{SOURCE_ID}")
-    data = raw["data"]
+    data = iter_raw_rows(f"dataset_{SOURCE_ID}")
 
     records = []
     for row in data:
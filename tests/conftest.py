@@ -0,0 +1,33 @@
+import pytest
+
+import cdc_client
+from benchmarks.soda_standin import SodaStandin
+from subsets_utils import RateLimiter, http_client
+
+DATASET_ID = "test-0001"
+
+
+@pytest.fixture
+def standin(monkeypatch):
+    """Local SODA stand-in serving one 5,000-row dataset, with cdc_client pointed at it."""
+    with SodaStandin({DATASET_ID: 5000}) as server:
+        monkeypatch.setattr(cdc_client, "BASE_URL", server.url)
+        monkeypatch.setattr(cdc_client, "_limiter", RateLimiter(calls=1000, period=1))
+        yield server
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    """Shared clients with the response cache enabled in a temporary directory."""
+    saved = dict(http_client._client_config)
+    http_client.configure_http(cache_enabled=True, cache_dir=tmp_path / "http_cache")
+    yield http_client.get_cache_manager()
+    http_client.configure_http(**saved)
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Local-mode raw store and state in a temporary DATA_DIR."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("CI", "")
+    return tmp_path / "data"
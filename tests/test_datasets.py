@@ -0,0 +1,17 @@
+from ingest import datasets
+from subsets_utils import load_raw_parquet
+
+from conftest import DATASET_ID
+
+
+def test_second_catalog_run_is_revalidated(standin, http_cache, data_dir):
+    standin.etags = True
+
+    datasets.run()
+    datasets.run()
+
+    stats = standin.stats()
+    assert stats["requests"] == 2
+    assert stats["not_modified"] == 1
+    assert http_cache.stats()["revalidated"] == 1
+    assert load_raw_parquet("catalog_index").column("id").to_pylist() == [DATASET_ID]
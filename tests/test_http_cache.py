@@ -0,0 +1,56 @@
+import threading
+import time
+
+import cdc_client
+from subsets_utils import http_client
+
+from conftest import DATASET_ID
+
+
+def test_streamed_page_is_cached(standin, http_cache):
+    # iter_json_array returns at the closing bracket, before the body's end
+    first = list(cdc_client.stream_dataset_after(DATASET_ID, limit=100))
+    second = list(cdc_client.stream_dataset_after(DATASET_ID, limit=100))
+
+    assert len(first) == 100
+    assert second == first
+    assert standin.stats()["requests"] == 1
+    assert http_cache.stats()["hits"] == 1
+
+
+def test_abandoned_stream_is_not_cached(standin, http_cache, monkeypatch):
+    # The body (~320 KB) is several reads long; stop after the first
+    monkeypatch.setattr(http_client._TeeStream, "DRAIN_LIMIT", 0)
+    url = f"{standin.url}/resource/{DATASET_ID}.json"
+    for _ in range(2):
+        with http_client.stream("GET", url, params={"$limit": 5000}) as response:
+            next(response.iter_bytes(1024))
+
+    assert standin.stats()["requests"] == 2
+    assert http_cache.stats()["stores"] == 0
+
+
+def test_concurrent_streams_are_coalesced(standin, http_cache):
+    url = f"{standin.url}/resource/{DATASET_ID}.json"
+    started = threading.Event()
+    bodies = {}
+
+    def leader():
+        with http_client.stream("GET", url, params={"$limit": 1000}) as response:
+            chunks = response.iter_bytes(1024)
+            body = next(chunks)
+            started.set()
+            time.sleep(0.3)  # the follower's request arrives mid-stream
+            body += b"".join(chunks)
+        bodies["leader"] = body
+
+    thread = threading.Thread(target=leader)
+    thread.start()
+    started.wait()
+    with http_client.stream("GET", url, params={"$limit": 1000}) as response:
+        bodies["follower"] = response.read()
+    thread.join()
+
+    assert bodies["follower"] == bodies["leader"]
+    assert standin.stats()["requests"] == 1
+    assert http_cache.stats()["hits"] == 1
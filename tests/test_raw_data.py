@@ -0,0 +1,161 @@
+import asyncio
+
+import pytest
+
+import cdc_client
+from ingest import raw_data
+from subsets_utils import aclose, iter_raw_rows
+
+from conftest import DATASET_ID
+
+
+def fetch_full(*args, **kwargs):
+    async def fetch():
+        try:
+            return await raw_data.fetch_full(*args, **kwargs)
+        finally:
+            await aclose()
+    return asyncio.run(fetch())
+
+
+@pytest.fixture
+def export_sized(monkeypatch):
+    """Send the 5,000-row dataset down the bulk export path, with little $limit headroom."""
+    monkeypatch.setattr(raw_data, "LARGE_DATASET_THRESHOLD", 1000)
+    monkeypatch.setattr(cdc_client, "PAGE_SIZE", 500)
+
+
+def raw_row_count():
+    return sum(1 for _ in iter_raw_rows(f"dataset_{DATASET_ID}"))
+
+
+def test_export_ignores_stale_catalog_count(standin, data_dir, export_sized):
+    metadata = cdc_client.get_dataset_metadata(DATASET_ID)
+    fetch_full(DATASET_ID, 0, metadata, None, row_count=2500)
+
+    assert raw_row_count() == 5000
+    assert (data_dir / "raw" / f"dataset_{DATASET_ID}.csv.gz").exists()
+
+
+def test_short_export_is_refetched(standin, data_dir, export_sized, monkeypatch):
+    def truncated_export(dataset_id, fileobj, limit, **kwargs):
+        return cdc_client.download_export(dataset_id, fileobj, 4000, **kwargs)
+
+    monkeypatch.setattr(raw_data, "download_export", truncated_export)
+    metadata = cdc_client.get_dataset_metadata(DATASET_ID)
+    fetch_full(DATASET_ID, 0, metadata, None)
+
+    assert raw_row_count() == 5000
+    assert not (data_dir / "raw" / f"dataset_{DATASET_ID}.csv.gz").exists()
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(monkeypatch, name, calls):
+    """Make raw_data.<name> fail after `calls` calls, as a killed run would."""
+    real = getattr(raw_data, name)
+    made = []
+
+    def interrupted(*args, **kwargs):
+        if len(made) == calls:
+            raise Interrupted
+        made.append(1)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(raw_data, name, interrupted)
+
+
+def test_export_runs_in_windows(standin, data_dir, export_sized, monkeypatch):
+    monkeypatch.setattr(raw_data, "EXPORT_WINDOW", 1500)
+    metadata = cdc_client.get_dataset_metadata(DATASET_ID)
+    entry = fetch_full(DATASET_ID, 0, metadata, None)
+
+    assert entry["rows"] == 5000
+    assert raw_row_count() == 5000
+    assert (data_dir / "raw" / f"dataset_{DATASET_ID}.csv.gz").exists()
+    assert not (data_dir / "raw" / f"dataset_{DATASET_ID}.csv.gz.parts").exists()
+    assert not (data_dir / "state" / f"raw_data_stream_{DATASET_ID}.json").exists()
+
+
+def test_interrupted_export_resumes(standin, data_dir, export_sized, monkeypatch):
+    monkeypatch.setattr(raw_data, "EXPORT_WINDOW", 1500)
+    metadata = cdc_client.get_dataset_metadata(DATASET_ID)
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, "download_export", 2)
+        with pytest.raises(Interrupted):
+            fetch_full(DATASET_ID, 0, metadata, None)
+
+    requests = standin.requests
+    fetch_full(DATASET_ID, 0, metadata, None)
+
+    # The two committed windows aren't fetched again
+    assert standin.requests - requests == 2 + 1  # windows 3 and 4, and the row count
+    assert raw_row_count() == 5000
+    assert (data_dir / "raw" / f"dataset_{DATASET_ID}.csv.gz").exists()
+
+
+def test_interrupted_stream_resumes(standin, data_dir, monkeypatch):
+    monkeypatch.setattr(cdc_client, "PAGE_SIZE", 1000)
+    monkeypatch.setattr(raw_data, "PAGE_SIZE", 1000)
+    metadata = cdc_client.get_dataset_metadata(DATASET_ID)
+    with monkeypatch.context() as patch:
+        interrupt_after(patch, "stream_dataset_after", 3)
+        with pytest.raises(Interrupted):
+            fetch_full(DATASET_ID, 0, metadata, None)
+
+    requests = standin.requests
+    fetch_full(DATASET_ID, 0, metadata, None)
+
+    assert standin.requests - requests == 3 + 1  # pages 4 to 6 (the last one empty), and the row count
+    assert raw_row_count() == 5000
+    assert not (data_dir / "raw" / f"dataset_{DATASET_ID}.ndjson.gz.parts").exists()
+
+
+def fetch_delta(entry):
+    async def fetch():
+        try:
+            metadata = await cdc_client.async_get_dataset_metadata(DATASET_ID)
+            return await raw_data.fetch_delta(DATASET_ID, metadata, entry)
+        finally:
+            await aclose()
+    return asyncio.run(fetch())
+
+
+@pytest.fixture
+def fetched(standin, data_dir):
+    """State entry for the 5,000-row dataset after a full fetch."""
+    metadata = cdc_client.get_dataset_metadata(DATASET_ID)
+    return fetch_full(DATASET_ID, 0, metadata, None)
+
+
+def test_full_fetch_stores_row_count(fetched):
+    assert fetched["rows"] == 5000
+
+
+def test_changed_rows_are_a_delta(standin, fetched):
+    standin.update_rows(DATASET_ID, range(10), "2024-06-01T00:00:00.000Z", state="ZZ")
+
+    entry = fetch_delta(fetched)
+    assert entry["deltas"] == 1
+    assert entry["rows"] == 5000
+    assert raw_row_count() == 5000
+
+
+def test_deleted_rows_need_full_fetch(standin, fetched):
+    standin.delete_rows(DATASET_ID, range(10))
+
+    assert fetch_delta(fetched) is None
+
+
+def test_replaced_rows_need_full_fetch(standin, fetched):
+    standin.replace_rows(DATASET_ID, 5000, "2024-06-01T00:00:00.000Z")
+
+    assert fetch_delta(fetched) is None
+
+
+def test_mostly_changed_rows_need_full_fetch(standin, fetched):
+    standin.update_rows(DATASET_ID, range(3000), "2024-06-01T00:00:00.000Z", state="ZZ")
+
+    assert fetch_delta(fetched) is None